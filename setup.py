@@ -21,7 +21,7 @@ test_requires = [
     "flake8==3.9.2",
     "pytest>=6.2,<6.3",
     "pytest-cov>=2.12,<3",
-    "pytest-django>=4.3.0,<5",
+    "pytest-django>=4.5.0,<5",
     "pytest-factoryboy>=2.1.0,<3",
     "pytest-mock>=3.6.1,<3.7.0",
     "pytest-asyncio>=0.15.1,<0.16",
@@ -29,9 +29,12 @@ test_requires = [
     "channels>=3.0.0,<4.0.0",
     "aioredis>=2.0.0,<3",
     "starlette>=0.16.0,<0.17",
+    # The websockets app writes prepared frames with the undocumented
+    # `ensure_open` and `write_frame` methods when they exist, test against a known range.
     "websockets>=9.0,<10",
     "mock>=4.0.3,<5.0.0",
     "wagtail-factories>=2.0.1,<3",
+    "psycopg2-binary>=2.8,<3",
 ]
 
 build_requires = [
@@ -6,19 +6,33 @@ class WagtailLiveConfig(AppConfig):
     name = "wagtail_live"
 
     def ready(self):
+        from wagtail_live.cache import get_render_cache, invalidate_render_cache
+        from wagtail_live.publishers.notifiers import get_update_notifier
+        from wagtail_live.publishers.polling import AsyncLongPollingPublisher
         from wagtail_live.publishers.websocket import BaseWebsocketPublisher
+        from wagtail_live.signals import live_page_update
         from wagtail_live.utils import get_live_publisher
 
+        # Remove the renders of deleted live posts from the render cache.
+        if get_render_cache() is not None:
+            live_page_update.connect(
+                invalidate_render_cache, dispatch_uid="invalidate_render_cache"
+            )
+
         live_publisher = get_live_publisher()
 
         # Connect a listener to the live_page_update signal
         # if the publisher defined uses the websockets technique
         if issubclass(live_publisher, BaseWebsocketPublisher):
-            from wagtail_live.signals import live_page_update
-
             # Set`weak=False` to avoid the publisher being garbage collected.
             # See:
             # https://docs.djangoproject.com/en/3.2/topics/signals/#django.dispatch.Signal.connect
             live_page_update.connect(
                 live_publisher(), weak=False, dispatch_uid="live_publisher"
             )
+
+        # Wake up pending long polling requests when a live page is updated.
+        if issubclass(live_publisher, AsyncLongPollingPublisher):
+            live_page_update.connect(
+                get_update_notifier(), weak=False, dispatch_uid="update_notifier"
+            )
@@ -1,13 +1,20 @@
 """ Block types and block constructors are defined in this module."""
 
+import hashlib
+import json
+
+from django import forms
+from django.core.serializers.json import DjangoJSONEncoder
 from wagtail.admin.rich_text.converters.editor_html import EditorHTMLConverter
 from wagtail.core import rich_text
 from wagtail.core.blocks import (
     BooleanBlock,
     CharBlock,
     DateTimeBlock,
+    FieldBlock,
     RichTextBlock,
     StreamBlock,
+    StreamValue,
     StructBlock,
     StructValue,
 )
@@ -23,6 +30,26 @@ class ContentBlock(StreamBlock):
     embed = EmbedBlock(help_text="URL of the embed message")
 
 
+class FingerprintBlock(FieldBlock):
+    """
+    A block holding a fingerprint. It isn't editable in the admin.
+
+    Live posts without a fingerprint have an empty string as fingerprint.
+    """
+
+    def __init__(self, help_text=None, **kwargs):
+        self.field = forms.CharField(
+            required=False, help_text=help_text, widget=forms.HiddenInput()
+        )
+        super().__init__(**kwargs)
+
+    def get_default(self):
+        return ""
+
+    def to_python(self, value):
+        return value or ""
+
+
 class LivePostBlock(StructBlock):
     """A generic block that maps to a message in a messaging app."""
 
@@ -40,6 +67,7 @@ class LivePostBlock(StructBlock):
         default=True,
     )
     content = ContentBlock()
+    fingerprint = FingerprintBlock(help_text="Fingerprint of the message content")
 
     class Meta:
         template = "wagtail_live/blocks/live_post.html"
@@ -151,6 +179,126 @@ def clear_live_post_content(live_post):
         live_post.value["content"].clear()
 
 
+def get_stream_child(stream_value, index):
+    """
+    Retrieves a child of a StreamValue without converting its other children.
+
+    Accessing a child of a lazy StreamValue converts all the children sharing its
+    block type to their python value. On large live pages, this means converting
+    every live post when only one of them is needed.
+
+    Args:
+        stream_value (StreamValue): StreamValue to retrieve the child from.
+        index (int): Index of the child to retrieve.
+
+    Returns:
+        StreamChild: The child of the StreamValue at the given index.
+
+    Raises:
+        IndexError: if a child with the given index doesn't exist.
+    """
+
+    bound_blocks = getattr(stream_value, "_bound_blocks", None)
+    if bound_blocks is None or bound_blocks[index] is not None:
+        return stream_value[index]
+
+    raw_child = stream_value.raw_data[index]
+    block = stream_value.stream_block.child_blocks[raw_child["type"]]
+    child = StreamValue.StreamChild(
+        block, block.to_python(raw_child["value"]), id=raw_child.get("id")
+    )
+    bound_blocks[index] = child
+    return child
+
+
+def get_stream_raw_data(stream_value):
+    """
+    Retrieves the JSON representation of the children of a StreamValue.
+
+    The `raw_data` of a StreamValue keeps returning the original data of the children
+    already converted to their python value, even if they've been changed since.
+    The converted children are therefore serialized again, the others aren't converted.
+
+    Args:
+        stream_value (StreamValue): StreamValue to retrieve the children from.
+
+    Returns:
+        list: The JSON representation of each child of the StreamValue.
+    """
+
+    raw_data = stream_value.raw_data
+    bound_blocks = getattr(stream_value, "_bound_blocks", None)
+    if bound_blocks is None:
+        return list(raw_data)
+
+    return [
+        raw_data[i] if bound_block is None else bound_block.get_prep_value()
+        for i, bound_block in enumerate(bound_blocks)
+    ]
+
+
+def get_live_post_content_hash(raw_post_value):
+    """
+    Computes a hash of the content of a live post.
+
+    Only what's displayed of the live post is hashed: whether it's shown and
+    the types and values of its content blocks.
+    Live posts with the same hash are displayed identically.
+
+    Args:
+        raw_post_value (dict): Value of the live post, in its JSON representation.
+
+    Returns:
+        str: SHA-1 hex digest of the content of the live post.
+    """
+
+    content = {
+        "show": raw_post_value.get("show"),
+        "content": [
+            [block["type"], block["value"]]
+            for block in raw_post_value.get("content") or []
+        ],
+    }
+    content = json.dumps(content, sort_keys=True, cls=DjangoJSONEncoder)
+    return hashlib.sha1(content.encode()).hexdigest()
+
+
+def get_live_post_fingerprint(live_post):
+    """
+    Computes the fingerprint of a live post.
+
+    Args:
+        live_post (livePostBlock): Live post to compute the fingerprint of.
+
+    Returns:
+        str: The content hash of the live post.
+    """
+
+    if isinstance(live_post, StructValue):
+        value = live_post
+    else:
+        value = live_post.value
+
+    return get_live_post_content_hash(value.block.get_prep_value(value))
+
+
+def set_live_post_fingerprint(live_post):
+    """
+    Stores the fingerprint of a live post in its value.
+
+    This must be done each time the content of the live post changes.
+
+    Args:
+        live_post (livePostBlock): Live post to fingerprint.
+    """
+
+    fingerprint = get_live_post_fingerprint(live_post)
+    if isinstance(live_post, StructValue):
+        live_post["fingerprint"] = fingerprint
+    else:
+        live_post.value["fingerprint"] = fingerprint
+
+
 def compare_live_posts_values(first_post_value, second_post_value):
     """
     Compares the values of two live posts.
@@ -0,0 +1,197 @@
+"""Wagtail Live cache helpers."""
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+def get_render_cache():
+    """
+    Retrieves the cache used to store the renders of live posts.
+
+    The user can set this parameter in his settings by doing so:
+    ```python
+    WAGTAIL_LIVE_RENDER_CACHE = (alias of a cache defined in the CACHES setting)
+    ```
+
+    Live posts renders aren't cached by default.
+
+    Returns:
+        BaseCache: The cache used to store renders if defined else `None`.
+    """
+
+    alias = getattr(settings, "WAGTAIL_LIVE_RENDER_CACHE", None)
+    if alias:
+        return caches[alias]
+
+
+def make_render_cache_key(live_post_id):
+    return f"wagtail_live:render:{live_post_id}"
+
+
+def get_render_version(live_post):
+    """
+    Retrieves the version of a live post.
+
+    A live post gets a new version each time it's edited.
+
+    Args:
+        live_post (LivePostBlock): Live post to get the version from.
+
+    Returns:
+        tuple: Date of the last edition of the live post, its fingerprint
+            and the template used to render it.
+    """
+
+    value = live_post.value
+    version = value["modified"] or value["created"]
+    if version:
+        # Live posts are saved using a json format which keeps milliseconds only.
+        # We strip the microseconds here to follow that format.
+        microsecond = (version.microsecond // 1000) * 1000
+        version = version.replace(microsecond=microsecond).isoformat()
+
+    return (version, value.get("fingerprint") or "", live_post.block.meta.template)
+
+
+def render_live_post(live_post):
+    """
+    Renders a live post.
+
+    If a render cache is defined, each version of a live post is rendered once
+    and then retrieved from the cache.
+
+    Args:
+        live_post (LivePostBlock): Live post to render.
+
+    Returns:
+        str: The HTML render of the live post.
+    """
+
+    cache = get_render_cache()
+    if cache is None:
+        return live_post.render(context={"block_id": live_post.id})
+
+    cache_key = make_render_cache_key(live_post.id)
+    version = get_render_version(live_post)
+    cached = cache.get(cache_key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    render = live_post.render(context={"block_id": live_post.id})
+    cache.set(cache_key, (version, render))
+    return render
+
+
+def invalidate_render_cache(sender, removals, **kwargs):
+    """
+    Listens to the `live_page_update` signal and removes
+    the renders of the deleted live posts from the render cache.
+
+    Renders of edited live posts don't need to be removed since
+    they are stored along with their version.
+    """
+
+    cache = get_render_cache()
+    if cache is not None and removals:
+        cache.delete_many([make_render_cache_key(post_id) for post_id in removals])
+
+
+def get_last_update_cache():
+    """
+    Retrieves the cache used to store the last update of live pages.
+
+    The user can set this parameter in his settings by doing so:
+    ```python
+    WAGTAIL_LIVE_LAST_UPDATE_CACHE = (alias of a cache defined in the CACHES setting)
+    ```
+
+    Last updates aren't cached by default.
+
+    Returns:
+        BaseCache: The cache used to store last updates if defined else `None`.
+    """
+
+    alias = getattr(settings, "WAGTAIL_LIVE_LAST_UPDATE_CACHE", None)
+    if alias:
+        return caches[alias]
+
+
+def make_last_update_cache_key(channel_id, page_id=None, last_update_seq=None):
+    if page_id is None:
+        return f"wagtail_live:last_update:{channel_id}"
+    return f"wagtail_live:last_update:{channel_id}:{page_id}:{last_update_seq}"
+
+
+def get_last_update_entry_timeout(cache):
+    # Entries outlive the latest update stored for the channel,
+    # so readers starting from an outdated one still find the updates following it.
+    if cache.default_timeout is not None:
+        return 2 * cache.default_timeout
+
+
+def set_cached_last_update(channel_id, page_id, last_updated_at, last_update_seq):
+    """
+    Stores the last update of a live page in the last update cache if defined.
+
+    Each update of a page is stored in its own entry, added once with `cache.add`.
+    The latest update of the page is also stored for its channel. Writes of this value
+    aren't atomic, so a delayed write can bring it back to an older update.
+    Readers therefore use it as a starting point and walk forward through the entries
+    of the following updates, so they never get an update older than the latest one cached.
+
+    Args:
+        channel_id (str): ID of the channel corresponding to the live page.
+        page_id (int): ID of the live page.
+        last_updated_at (DateTime): Date and time of the last update of the page.
+        last_update_seq (int): Sequence number of the last update of the page.
+    """
+
+    cache = get_last_update_cache()
+    if cache is None or not channel_id:
+        return
+
+    last_update = (page_id, last_updated_at, last_update_seq)
+    cache.add(
+        make_last_update_cache_key(channel_id, page_id, last_update_seq),
+        last_update,
+        timeout=get_last_update_entry_timeout(cache),
+    )
+
+    cache_key = make_last_update_cache_key(channel_id)
+    cached = cache.get(cache_key)
+    if cached is None or cached[0] != page_id or cached[2] < last_update_seq:
+        cache.set(cache_key, last_update)
+
+
+def get_cached_last_update(channel_id):
+    """
+    Retrieves the last update of a live page from the last update cache.
+
+    Args:
+        channel_id (str): ID of the channel corresponding to the live page.
+
+    Returns:
+        (int, DateTime, int):
+            a tuple containing the ID of the page, the date and time and the sequence number
+            of its last update if found in the cache else `None`.
+    """
+
+    cache = get_last_update_cache()
+    if cache is None:
+        return
+
+    cache_key = make_last_update_cache_key(channel_id)
+    last_update = cached = cache.get(cache_key)
+    while last_update is not None:
+        page_id, _, last_update_seq = last_update
+        next_update = cache.get(
+            make_last_update_cache_key(channel_id, page_id, last_update_seq + 1)
+        )
+        if next_update is None:
+            break
+        last_update = next_update
+
+    if last_update is not cached:
+        # The latest update stored for the channel is outdated.
+        cache.set(cache_key, last_update)
+    return last_update
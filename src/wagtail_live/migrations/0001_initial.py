@@ -0,0 +1,74 @@
+# Generated by Django 3.2.8 on 2021-11-08 10:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("wagtailcore", "0040_page_draft_title"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LivePost",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "block_id",
+                    models.CharField(
+                        help_text="ID of the live post in the live page",
+                        max_length=255,
+                    ),
+                ),
+                (
+                    "message_id",
+                    models.CharField(help_text="Message's ID", max_length=255),
+                ),
+                (
+                    "created",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="Date and time of message creation",
+                        null=True,
+                    ),
+                ),
+                (
+                    "value",
+                    models.TextField(help_text="JSON value of the live post"),
+                ),
+                (
+                    "page",
+                    models.ForeignKey(
+                        help_text="Live page this post belongs to",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="wagtailcore.page",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="livepost",
+            index=models.Index(
+                fields=["page", "message_id"], name="wagtail_live_post_message_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="livepost",
+            index=models.Index(
+                fields=["page", "created"], name="wagtail_live_post_created_idx"
+            ),
+        ),
+    ]
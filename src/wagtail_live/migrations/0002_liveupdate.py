@@ -0,0 +1,74 @@
+# Generated by Django 3.2.8 on 2021-11-10 09:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wagtailcore", "0040_page_draft_title"),
+        ("wagtail_live", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LiveUpdate",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "seq",
+                    models.PositiveIntegerField(
+                        help_text="Sequence number of the update"
+                    ),
+                ),
+                (
+                    "created",
+                    models.DateTimeField(help_text="Date and time of the update"),
+                ),
+                (
+                    "renders",
+                    models.TextField(
+                        default="[]",
+                        help_text="JSON list of the IDs of the live posts added or edited",
+                    ),
+                ),
+                (
+                    "removals",
+                    models.TextField(
+                        default="[]",
+                        help_text="JSON list of the IDs of the live posts deleted",
+                    ),
+                ),
+                (
+                    "page",
+                    models.ForeignKey(
+                        help_text="Live page this update belongs to",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="wagtailcore.page",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="liveupdate",
+            index=models.Index(
+                fields=["page", "created"], name="wagtail_live_update_time_idx"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="liveupdate",
+            constraint=models.UniqueConstraint(
+                fields=("page", "seq"), name="wagtail_live_update_seq_uniq"
+            ),
+        ),
+    ]
@@ -1,13 +1,251 @@
 """ Wagtail Live models."""
 
+import functools
+import hashlib
+import json
+import uuid
+
 from django.conf import settings
-from django.db import models
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models, transaction
+from django.db.models import DEFERRED
+from django.template.loader import render_to_string
 from django.utils import timezone
 from wagtail.admin.edit_handlers import FieldPanel, StreamFieldPanel
 from wagtail.core.fields import StreamField
 
-from wagtail_live.blocks import LivePostBlock, compare_live_posts_values
+from wagtail_live.blocks import (
+    LivePostBlock,
+    compare_live_posts_values,
+    get_live_post_content_hash,
+    get_stream_child,
+    get_stream_raw_data,
+    set_live_post_fingerprint,
+)
+from wagtail_live.cache import render_live_post, set_cached_last_update
 from wagtail_live.signals import live_page_update
+from wagtail_live.utils import (
+    TABLE_STORAGE,
+    get_live_post_storage,
+    get_live_posts_window_size,
+    get_update_journal_size,
+    get_update_timestamp,
+)
+
+
+class LivePost(models.Model):
+    """
+    A live post stored in its own row.
+
+    Live posts are stored this way when the `WAGTAIL_LIVE_POST_STORAGE` setting is `"table"`.
+    Adding, editing or deleting a live post then only touches its row instead of
+    rewriting the whole `live_posts` StreamField of the page.
+
+    Attributes:
+        page (Page):
+            Live page this post belongs to.
+        block_id (str):
+            ID of the live post in the `live_posts` StreamField of the page.
+        message_id (str):
+            ID of the message corresponding to this live post.
+        created (DateTime):
+            Date and time of the live post creation.
+        value (str):
+            JSON representation of the live post value.
+    """
+
+    page = models.ForeignKey(
+        "wagtailcore.Page",
+        on_delete=models.CASCADE,
+        related_name="+",
+        help_text="Live page this post belongs to",
+    )
+    block_id = models.CharField(
+        help_text="ID of the live post in the live page",
+        max_length=255,
+    )
+    message_id = models.CharField(
+        help_text="Message's ID",
+        max_length=255,
+    )
+    created = models.DateTimeField(
+        help_text="Date and time of message creation",
+        null=True,
+        blank=True,
+    )
+    value = models.TextField(help_text="JSON value of the live post")
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["page", "message_id"], name="wagtail_live_post_message_idx"
+            ),
+            models.Index(
+                fields=["page", "created"], name="wagtail_live_post_created_idx"
+            ),
+        ]
+
+
+class LiveUpdate(models.Model):
+    """
+    An entry of the update journal of a live page.
+
+    Each time live posts are added, edited or deleted, the page records the IDs of
+    the live posts concerned along with a sequence number.
+    The journal of a page starts with an empty entry when the page is created.
+    Polling publishers read the journal to find the live posts updated since
+    a client's last update instead of going through all the live posts of the page.
+    Only the latest `WAGTAIL_LIVE_UPDATE_JOURNAL_SIZE` entries are kept per page.
+
+    Attributes:
+        page (Page):
+            Live page this update belongs to.
+        seq (int):
+            Sequence number of the update for the page.
+        created (DateTime):
+            Date and time of the update.
+        renders (str):
+            JSON list of the IDs of the live posts added or edited.
+        removals (str):
+            JSON list of the IDs of the live posts deleted.
+    """
+
+    page = models.ForeignKey(
+        "wagtailcore.Page",
+        on_delete=models.CASCADE,
+        related_name="+",
+        help_text="Live page this update belongs to",
+    )
+    seq = models.PositiveIntegerField(help_text="Sequence number of the update")
+    created = models.DateTimeField(help_text="Date and time of the update")
+    renders = models.TextField(
+        help_text="JSON list of the IDs of the live posts added or edited",
+        default="[]",
+    )
+    removals = models.TextField(
+        help_text="JSON list of the IDs of the live posts deleted",
+        default="[]",
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["page", "seq"], name="wagtail_live_update_seq_uniq"
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["page", "created"], name="wagtail_live_update_time_idx"
+            ),
+        ]
+
+
+class LivePostsIndex:
+    """
+    Maps the message IDs of the live posts of a page to their position.
+
+    Positions are stored as ranks, i.e counted from the oldest live post.
+    New live posts are usually inserted at the start of the list, which leaves
+    the ranks of the existing live posts unchanged.
+    Message IDs are read from the raw data of the live posts,
+    so building the index doesn't convert any live post.
+    The index is dropped when the live posts are assigned, and rebuilt when a lookup
+    shows that they have been modified in place.
+
+    Attributes:
+        live_posts (StreamValue):
+            Live posts indexed.
+        length (int):
+            Number of live posts indexed.
+        ranks (dict):
+            Maps a message ID to the rank of its live post.
+    """
+
+    def __init__(self, live_posts):
+        self.live_posts = live_posts
+        self.build()
+
+    def build(self):
+        """(Re)builds the index from the live posts."""
+
+        self.length = len(self.live_posts)
+        self.ranks = {}
+        for rank in range(self.length):
+            # The first live post with a given message ID wins.
+            self.ranks[self.get_message_id(self.length - 1 - rank)] = rank
+
+    def is_valid_for(self, live_posts):
+        """Checks if this index can be used to find posts in `live_posts`."""
+
+        return self.live_posts is live_posts and self.length == len(live_posts)
+
+    def get_message_id(self, index):
+        """Retrieves the message ID of the live post at `index`."""
+
+        # The raw data of the live posts already converted may be outdated.
+        bound_blocks = getattr(self.live_posts, "_bound_blocks", None)
+        if bound_blocks is not None and bound_blocks[index] is not None:
+            return bound_blocks[index].value["message_id"]
+        return self.live_posts.raw_data[index]["value"]["message_id"]
+
+    def _get(self, message_id):
+        rank = self.ranks.get(message_id)
+        if rank is not None:
+            return self.length - 1 - rank
+
+    def get(self, message_id):
+        """
+        Retrieves the index of the live post corresponding to `message_id`.
+
+        Args:
+            message_id (str): ID of the message corresponding to a live post.
+
+        Returns:
+            int: Index of the live post if found else None.
+        """
+
+        index = self._get(message_id)
+        if index is None or self.get_message_id(index) != message_id:
+            # The live posts may have been modified without updating this index.
+            self.build()
+            index = self._get(message_id)
+        return index
+
+    def insert(self, index, message_id):
+        """
+        Updates the index after a live post has been inserted at `index`.
+
+        Only the ranks of the live posts newer than the inserted one change.
+        """
+
+        length = self.length
+        for i in range(index):
+            message_id_i = self.get_message_id(i)
+            if self.ranks.get(message_id_i) == length - 1 - i:
+                self.ranks[message_id_i] += 1
+
+        self.length += 1
+        rank = self.length - 1 - index
+        if self.ranks.get(message_id, -1) < rank:
+            self.ranks[message_id] = rank
+
+    def delete(self, index, message_id):
+        """
+        Updates the index after the live post at `index` has been deleted.
+
+        Only the ranks of the live posts newer than the deleted one change.
+        """
+
+        length = self.length
+        if self.ranks.get(message_id) == length - 1 - index:
+            del self.ranks[message_id]
+
+        for i in range(index):
+            message_id_i = self.get_message_id(i)
+            if self.ranks.get(message_id_i) == length - 1 - i:
+                self.ranks[message_id_i] -= 1
+
+        self.length -= 1
 
 
 class LivePageMixin(models.Model):
@@ -19,6 +257,14 @@ class LivePageMixin(models.Model):
             Id of the corresponding channel in a messaging app.
         last_updated_at (DateTime):
             Date and time of the last update of this page.
+        last_update_seq (int):
+            Sequence number of the last update of this page.
+        live_posts_checksum (str):
+            Checksum of the `live_posts` StreamField as last saved.
+        closed (bool):
+            Whether the live event of this page is finished.
+        live_posts_archive (str):
+            Rendering of all the live posts of this page, served once the page is closed.
         live_posts (StreamField):
             StreamField containing all the posts/messages published
             respectively on this page/channel.
@@ -35,6 +281,27 @@ class LivePageMixin(models.Model):
         blank=True,
         default=timezone.now,
     )
+    last_update_seq = models.PositiveIntegerField(
+        help_text="Sequence number of the last update of this page",
+        default=0,
+        editable=False,
+    )
+    live_posts_checksum = models.CharField(
+        help_text="Checksum of the live posts of this page",
+        max_length=40,
+        blank=True,
+        editable=False,
+    )
+    closed = models.BooleanField(
+        help_text="Close this page once the live event is finished. "
+        "The live posts are archived and clients stop fetching updates.",
+        default=False,
+    )
+    live_posts_archive = models.TextField(
+        help_text="Rendering of the live posts of this page once closed",
+        blank=True,
+        editable=False,
+    )
 
     live_posts = StreamField(
         [
@@ -45,79 +312,441 @@ class LivePageMixin(models.Model):
 
     panels = [
         FieldPanel("channel_id"),
+        FieldPanel("closed"),
         StreamFieldPanel("live_posts"),
     ]
 
+    def __setattr__(self, name, value):
+        if name == "live_posts":
+            # The index of the live posts doesn't hold for the new ones.
+            self.__dict__.pop("_live_posts_index", None)
+        super().__setattr__(name, value)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        if "live_posts" in field_names and get_live_post_storage() == TABLE_STORAGE:
+            # The `live_posts` StreamField is a projection of the live posts rows.
+            # Defer it so the column isn't deserialized, and the rows are only
+            # fetched when the live posts are first accessed.
+            values = [
+                DEFERRED if field_name == "live_posts" else value
+                for field_name, value in zip(field_names, values)
+            ]
+        instance = super().from_db(db, field_names, values)
+        if "closed" in field_names:
+            # Remember the saved state to know when the page is being closed.
+            instance._saved_closed = instance.closed
+        return instance
+
     @property
     def last_update_timestamp(self):
         """Timestamp of the last update of this page."""
 
-        # Live posts are saved using a json format.
-        # We strip the microseconds here to follow that format.
-        microsecond = (self.last_updated_at.microsecond // 1000) * 1000
-        return self.last_updated_at.replace(microsecond=microsecond).timestamp()
+        return get_update_timestamp(self.last_updated_at)
 
     def save(self, sync=True, *args, **kwargs):
         """Update live page on save depending on the `WAGTAIL_LIVE_SYNC_WITH_ADMIN` setting."""
 
+        # The page and its update journal are written together.
+        with transaction.atomic():
+            return self._save(sync, *args, **kwargs)
+
+    def _save(self, sync, *args, **kwargs):
         sync_changes = sync and getattr(settings, "WAGTAIL_LIVE_SYNC_WITH_ADMIN", True)
-        has_changed = False
-        if sync_changes and self.id:
-            renders, seen = [], set()
+        use_table = get_live_post_storage() == TABLE_STORAGE
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "live_posts" not in update_fields:
+            sync_changes = use_table = False
+
+        saves_live_posts = update_fields is None or "live_posts" in update_fields
+        if saves_live_posts:
+            checksum = self.get_live_posts_checksum()
+            if update_fields is not None:
+                kwargs["update_fields"] = list(update_fields) + ["live_posts_checksum"]
+
+        is_new = self.id is None
+        is_unchanged = has_changed = False
+        previous_closed = None
+        if sync and self.id:
+            saved = self._lock_for_update(
+                "live_posts_checksum", "closed", "last_update_seq"
+            )
+            if saved is not None:
+                previous_checksum, previous_closed, last_update_seq = saved
+                # Don't write back an outdated sequence number,
+                # e.g. when the page has been restored from a revision.
+                self.last_update_seq = last_update_seq
+                # Skip the diffing if the live posts haven't changed since the last save.
+                is_unchanged = (
+                    sync_changes
+                    and bool(previous_checksum)
+                    and previous_checksum == checksum
+                )
+
+        if sync_changes and self.id and not is_unchanged:
+            renders, fingerprinted, seen = [], [], set()
+            previous_live_posts = self.__class__.objects.get(id=self.id).live_posts
             previous_posts = {
-                live_post.id: live_post
-                for live_post in self.__class__.objects.get(id=self.id).live_posts
+                raw_live_post.get("id"): i
+                for i, raw_live_post in enumerate(previous_live_posts.raw_data)
             }
             now = timezone.now()
 
-            for i, post in enumerate(self.live_posts):  # New posts
-                post_id = post.id
+            # Changes made to the live posts already converted aren't reflected
+            # by `raw_data`, so use their current JSON representation.
+            raw_live_posts = get_stream_raw_data(self.live_posts)
+            for i, raw_post in enumerate(raw_live_posts):  # New posts
+                post_id = raw_post.get("id")
+                fingerprint = get_live_post_content_hash(raw_post["value"])
                 if post_id in previous_posts:
                     seen.add(post_id)
 
                     # Check if the post has been modified.
-                    previous_post = previous_posts[post_id]
-                    identic = compare_live_posts_values(post.value, previous_post.value)
-                    if not identic:
-                        post.value["modified"] = now
-                        renders.append(i)
+                    # Compare the fingerprints of the posts first to avoid converting them.
+                    previous_index = previous_posts[post_id]
+                    previous_value = previous_live_posts.raw_data[previous_index][
+                        "value"
+                    ]
+                    previous_fingerprint = previous_value.get(
+                        "fingerprint"
+                    ) or get_live_post_content_hash(previous_value)
+
+                    if fingerprint != previous_fingerprint:
+                        post = get_stream_child(self.live_posts, i)
+                        previous_post = get_stream_child(
+                            previous_live_posts, previous_index
+                        )
+                        if not compare_live_posts_values(
+                            post.value, previous_post.value
+                        ):
+                            post.value["modified"] = now
+                            renders.append(i)
 
                 else:
                     # This is a new post.
                     # Force the value of `created` here to keep it synchronized with the
                     # `last_updated_at` property.
                     # This is mostly to avoid missing new updates with the polling publishers.
+                    post = get_stream_child(self.live_posts, i)
                     post.value["created"] = now
                     renders.append(i)
 
+                if raw_post["value"].get("fingerprint") != fingerprint:
+                    get_stream_child(self.live_posts, i).value[
+                        "fingerprint"
+                    ] = fingerprint
+                    fingerprinted.append(i)
+
             removals = list(set(previous_posts.keys()).difference(seen))
 
             has_changed = bool(renders or removals)
             if has_changed:
                 self.last_updated_at = now
+                self.last_update_seq += 1
+            if has_changed or fingerprinted:
+                checksum = self.get_live_posts_checksum()
+
+        if saves_live_posts:
+            self.live_posts_checksum = checksum
+
+        closing = False
+        if update_fields is None or not {"closed", "live_posts"}.isdisjoint(
+            update_fields
+        ):
+            closing = self._is_closing(was_closed=previous_closed)
+            if closing and not has_changed:
+                # Closing the page is an update of its own,
+                # so clients waiting for updates learn that the page is closed.
+                self.last_updated_at = timezone.now()
+                self.last_update_seq += 1
+
+            if not self.closed:
+                self.live_posts_archive = ""
+            elif closing or has_changed or not sync or not self.live_posts_archive:
+                self.live_posts_archive = self.render_live_posts_archive()
+
+            if update_fields is not None:
+                update_fields = list(kwargs["update_fields"]) + ["live_posts_archive"]
+                if closing:
+                    update_fields += ["last_updated_at", "last_update_seq"]
+                kwargs["update_fields"] = update_fields
 
         result = super().save(*args, **kwargs)
+        self._saved_closed = self.closed
+
+        if use_table and not is_unchanged:
+            if sync_changes and not is_new:
+                for i in sorted(set(renders).union(fingerprinted)):
+                    self._save_live_post_row(self.live_posts[i])
+                self._delete_live_post_rows(removals)
+            else:
+                self._replace_live_post_rows()
+
+        if is_new:
+            # Start the update journal of the page.
+            self._add_live_update(renders=[], removals=[])
+
+        if update_fields is None or "last_updated_at" in update_fields:
+            self._cache_last_update()
 
         if sync_changes and has_changed:
             # Reverse renders so the latest posts, which are in the start of the list,
             # are processed later in the front end.
             renders.reverse()
             renders = list(map(self.get_live_post_by_index, renders))
+            self._add_live_update(
+                renders=[live_post.id for live_post in renders], removals=removals
+            )
+
+            self._send_live_page_update(
+                renders=renders, removals=removals, closed=closing
+            )
 
-            # Send signal.
-            live_page_update.send(
+        elif closing:
+            self._add_live_update(renders=[], removals=[])
+            self._send_live_page_update(renders=[], removals=[], closed=True)
+
+        return result
+
+    def _is_closing(self, was_closed=None):
+        if not self.closed or self.id is None:
+            return False
+
+        if was_closed is None:
+            was_closed = getattr(self, "_saved_closed", None)
+        if was_closed is None:
+            # This instance hasn't been loaded from the database,
+            # e.g. it has been restored from a revision.
+            was_closed = (
+                self.__class__.objects.filter(id=self.id)
+                .values_list("closed", flat=True)
+                .first()
+            )
+        return not was_closed
+
+    def refresh_from_db(self, using=None, fields=None):
+        load_live_posts = False
+        if get_live_post_storage() == TABLE_STORAGE:
+            if fields is None:
+                # The live posts are reloaded from their rows on next access.
+                self.__dict__.pop("live_posts", None)
+            elif "live_posts" in fields:
+                fields = [field for field in fields if field != "live_posts"]
+                load_live_posts = True
+
+        if fields is None or fields:
+            super().refresh_from_db(using=using, fields=fields)
+            if fields is None or "closed" in fields:
+                self._saved_closed = self.closed
+
+        if load_live_posts:
+            self.live_posts = self._get_live_posts_from_table()
+
+    def render_live_posts_archive(self):
+        """
+        Renders all the live posts of this page.
+
+        The rendering is stored when the page is closed and served instead of the live posts.
+
+        Returns:
+            str: HTML rendering of the live posts.
+        """
+
+        return render_to_string(
+            "wagtail_live/live_posts_list.html", {"live_posts": self.live_posts}
+        )
+
+    def _get_live_posts_from_table(self):
+        rows = (
+            LivePost.objects.filter(page_id=self.pk)
+            .order_by("-created", "id")
+            .values_list("block_id", "value")
+        )
+        stream_block = self._meta.get_field("live_posts").stream_block
+        return stream_block.to_python(
+            [
+                {"type": "live_post", "id": block_id, "value": json.loads(value)}
+                for block_id, value in rows
+            ]
+        )
+
+    def _get_live_post_row_fields(self, live_post):
+        value = live_post.block.get_prep_value(live_post.value)
+        return {
+            "message_id": live_post.value["message_id"],
+            "created": live_post.value["created"],
+            "value": json.dumps(value, cls=DjangoJSONEncoder),
+        }
+
+    def _save_live_post_row(self, live_post):
+        if not live_post.id:
+            live_post.id = str(uuid.uuid4())
+
+        fields = self._get_live_post_row_fields(live_post)
+        updated = LivePost.objects.filter(
+            page_id=self.pk, block_id=live_post.id
+        ).update(**fields)
+        if not updated:
+            LivePost.objects.create(page_id=self.pk, block_id=live_post.id, **fields)
+
+    def _delete_live_post_rows(self, live_post_ids):
+        if live_post_ids:
+            LivePost.objects.filter(
+                page_id=self.pk, block_id__in=live_post_ids
+            ).delete()
+
+    def _replace_live_post_rows(self):
+        LivePost.objects.filter(page_id=self.pk).delete()
+        LivePost.objects.bulk_create(
+            [
+                LivePost(
+                    page_id=self.pk,
+                    block_id=live_post.id,
+                    **self._get_live_post_row_fields(live_post)
+                )
+                for live_post in self.live_posts
+            ]
+        )
+
+    def _save_live_posts(self, renders=(), removals=()):
+        """
+        Persists the changes made to the live posts of this page.
+
+        With the table storage, only the rows of the live posts rendered or removed
+        are written, along with the `last_updated_at` and `last_update_seq` fields of the page.
+        Otherwise, the page is saved.
+        The update is recorded in the update journal of the page in the same transaction,
+        and the `live_page_update` signal is sent once it is committed.
+
+        Args:
+            renders (list): Live posts that have been added or edited.
+            removals (list): IDs of the live posts that have been removed.
+        """
+
+        with transaction.atomic():
+            (last_update_seq,) = self._lock_for_update("last_update_seq")
+            self.last_update_seq = last_update_seq + 1
+            if get_live_post_storage() == TABLE_STORAGE:
+                for live_post in renders:
+                    self._save_live_post_row(live_post)
+                self._delete_live_post_rows(removals)
+                # The `live_posts` StreamField of the page isn't written,
+                # so its checksum doesn't hold anymore.
+                self.live_posts_checksum = ""
+                if self.closed:
+                    self.live_posts_archive = self.render_live_posts_archive()
+                self.__class__.objects.filter(pk=self.pk).update(
+                    last_updated_at=self.last_updated_at,
+                    last_update_seq=self.last_update_seq,
+                    live_posts_checksum=self.live_posts_checksum,
+                    live_posts_archive=self.live_posts_archive,
+                )
+                self._cache_last_update()
+            else:
+                self.save(sync=False)
+
+            self._add_live_update(
+                renders=[live_post.id for live_post in renders],
+                removals=list(removals),
+            )
+            self._send_live_page_update(renders=list(renders), removals=list(removals))
+
+    def _lock_for_update(self, *fields):
+        """
+        Locks the row of this page until the end of the transaction and reads `fields`.
+
+        Concurrent updates of the page wait for each other,
+        so each of them gets its own sequence number.
+
+        Returns:
+            tuple: Values of `fields` for this page, or None if it hasn't been saved.
+        """
+
+        return (
+            self.__class__.objects.select_for_update()
+            .filter(pk=self.pk)
+            .values_list(*fields)
+            .first()
+        )
+
+    def _cache_last_update(self):
+        # Clients mustn't be told about an update which could still be rolled back.
+        transaction.on_commit(
+            functools.partial(
+                set_cached_last_update,
+                channel_id=self.channel_id,
+                page_id=self.pk,
+                last_updated_at=self.last_updated_at,
+                last_update_seq=self.last_update_seq,
+            )
+        )
+
+    def _send_live_page_update(self, renders, removals, closed=False):
+        # Clients mustn't be told about an update which could still be rolled back.
+        transaction.on_commit(
+            functools.partial(
+                live_page_update.send,
                 sender=self.__class__,
                 channel_id=self.channel_id,
                 renders=renders,
                 removals=removals,
+                seq=self.last_update_seq,
+                closed=closed,
             )
+        )
 
-        return result
+    def _add_live_update(self, renders, removals):
+        """
+        Records an update of this page in its update journal.
+
+        Args:
+            renders (list): IDs of the live posts that have been added or edited.
+            removals (list): IDs of the live posts that have been removed.
+        """
+
+        LiveUpdate.objects.create(
+            page_id=self.pk,
+            seq=self.last_update_seq,
+            created=self.last_updated_at,
+            renders=json.dumps(renders),
+            removals=json.dumps(removals),
+        )
+
+        # Trim the journal.
+        LiveUpdate.objects.filter(
+            page_id=self.pk,
+            seq__lte=self.last_update_seq - get_update_journal_size(),
+        ).delete()
+
+    def _get_live_posts_index(self, build=True):
+        index = self.__dict__.get("_live_posts_index")
+        if index is None or not index.is_valid_for(self.live_posts):
+            index = LivePostsIndex(self.live_posts) if build else None
+            self._live_posts_index = index
+        return index
 
     def _get_live_post_index(self, message_id):
-        for i, post in enumerate(self.live_posts):
-            if post.value["message_id"] == message_id:
-                return i
+        return self._get_live_posts_index().get(message_id)
+
+    def _get_live_post_created(self, live_post_index):
+        # Read the creation date from the raw data to avoid converting the live post.
+        raw_live_post = self.live_posts.raw_data[live_post_index]
+        created_block = self.live_posts.stream_block.child_blocks[
+            raw_live_post["type"]
+        ].child_blocks["created"]
+        return created_block.to_python(raw_live_post["value"]["created"])
+
+    def _get_insertion_index(self, created):
+        # Live posts are sorted by creation date, from the latest to the oldest.
+        # Binary search the index of the first live post created before `created`.
+        low, high = 0, len(self.live_posts)
+        while low < high:
+            middle = (low + high) // 2
+            if self._get_live_post_created(middle) < created:
+                high = middle
+            else:
+                low = middle + 1
+        return low
 
     def get_live_post_index(self, message_id):
         """
@@ -146,7 +775,7 @@ class LivePageMixin(models.Model):
             IndexError: if a live post with the given index doesn't exist.
         """
 
-        return self.live_posts[live_post_index]
+        return get_stream_child(self.live_posts, live_post_index)
 
     def get_live_post_by_message_id(self, message_id):
         """
@@ -177,27 +806,19 @@ class LivePageMixin(models.Model):
                 live post to add
         """
 
-        posts = self.live_posts
-        lp_index = 0
+        set_live_post_fingerprint(live_post)
         post_created_at = live_post["created"]
-        while lp_index < len(posts):
-            if posts[lp_index].value["created"] < post_created_at:
-                break
-            lp_index += 1
+        lp_index = self._get_insertion_index(post_created_at)
 
         # Insert to keep posts sorted by time
-        self.live_posts.insert(lp_index, ("live_post", live_post))
+        index = self._get_live_posts_index(build=False)
+        self.live_posts.insert(lp_index, ("live_post", live_post, str(uuid.uuid4())))
+        if index is not None:
+            index.insert(lp_index, live_post["message_id"])
 
         self.last_updated_at = post_created_at
-        self.save(sync=False)
-
         live_post = self.get_live_post_by_index(lp_index)
-        live_page_update.send(
-            sender=self.__class__,
-            channel_id=self.channel_id,
-            renders=[live_post],
-            removals=[],
-        )
+        self._save_live_posts(renders=[live_post])
 
     def update_live_post(self, live_post):
         """
@@ -208,15 +829,9 @@ class LivePageMixin(models.Model):
                 Live post to update.
         """
 
+        set_live_post_fingerprint(live_post)
         live_post.value["modified"] = self.last_updated_at = timezone.now()
-        self.save(sync=False)
-
-        live_page_update.send(
-            sender=self.__class__,
-            channel_id=self.channel_id,
-            renders=[live_post],
-            removals=[],
-        )
+        self._save_live_posts(renders=[live_post])
 
     def delete_live_post(self, message_id):
         """
@@ -233,26 +848,202 @@ class LivePageMixin(models.Model):
         if live_post_index is None:
             raise KeyError
 
-        live_post_id = self.live_posts[live_post_index].id
+        index = self._get_live_posts_index()
+        live_post_id = self.live_posts.raw_data[live_post_index]["id"]
         del self.live_posts[live_post_index]
+        index.delete(live_post_index, message_id)
 
         self.last_updated_at = timezone.now()
-        self.save(sync=False)
+        self._save_live_posts(removals=[live_post_id])
+
+    def get_live_post_ids(self):
+        """
+        Retrieves the IDs of the live posts of this page.
+
+        IDs are read from the raw data of the live posts,
+        so this doesn't convert any live post.
+
+        Returns:
+            list: IDs of the live posts, from the latest to the oldest.
+        """
+
+        return [raw_live_post["id"] for raw_live_post in self.live_posts.raw_data]
+
+    @property
+    def live_posts_window(self):
+        """
+        Live posts rendered when this page is loaded, from the latest to the oldest.
+
+        Only the latest live posts are rendered if the `WAGTAIL_LIVE_POSTS_WINDOW_SIZE`
+        setting is defined.
+        """
+
+        window_size = len(self.get_live_posts_window_ids())
+        return [get_stream_child(self.live_posts, i) for i in range(window_size)]
+
+    @property
+    def has_older_live_posts(self):
+        """Whether some live posts are left out of the `live_posts_window`."""
+
+        window_size = get_live_posts_window_size()
+        return window_size is not None and len(self.live_posts) > window_size
+
+    @property
+    def live_posts_window_oldest_timestamp(self):
+        """Timestamp of the creation of the oldest live post of the `live_posts_window`."""
+
+        window_size = len(self.get_live_posts_window_ids())
+        if window_size:
+            return get_update_timestamp(self._get_live_post_created(window_size - 1))
+
+    def get_live_posts_window_ids(self):
+        """
+        Retrieves the IDs of the live posts rendered when this page is loaded.
+
+        Returns:
+            list: IDs of the live posts of the window, from the latest to the oldest.
+        """
+
+        return self.get_live_post_ids()[: get_live_posts_window_size()]
+
+    def get_live_posts_before(self, live_post_id, count=None):
+        """
+        Retrieves the live posts older than a given live post.
+
+        Args:
+            live_post_id (str):
+                ID of the live post to start from.
+            count (int):
+                Maximum number of live posts to retrieve.
+                Defaults to the `WAGTAIL_LIVE_POSTS_WINDOW_SIZE` setting.
 
-        live_page_update.send(
-            sender=self.__class__,
-            channel_id=self.channel_id,
-            renders={},
-            removals=[live_post_id],
+        Returns:
+            (list, bool):
+                a tuple containing the live posts older than `live_post_id`,
+                from the latest to the oldest, and whether even older live posts exist.
+
+        Raises:
+            KeyError: if a live post with the given ID doesn't exist.
+        """
+
+        live_post_ids = self.get_live_post_ids()
+        try:
+            start = live_post_ids.index(live_post_id) + 1
+        except ValueError:
+            raise KeyError(live_post_id)
+
+        if count is None:
+            count = get_live_posts_window_size()
+        end = (
+            len(live_post_ids)
+            if count is None
+            else min(start + count, len(live_post_ids))
         )
 
-    def get_updates_since(self, last_update_ts):
+        live_posts = [get_stream_child(self.live_posts, i) for i in range(start, end)]
+        return (live_posts, end < len(live_post_ids))
+
+    def get_live_posts_checksum(self):
+        """
+        Computes a checksum of the `live_posts` StreamField of this page.
+
+        Returns:
+            str: SHA-1 hex digest of the JSON representation of the live posts.
+        """
+
+        live_posts = self._meta.get_field("live_posts").get_prep_value(self.live_posts)
+        return hashlib.sha1(live_posts.encode()).hexdigest()
+
+    def _get_live_updates_since(self, last_update_ts):
+        journal = LiveUpdate.objects.filter(page_id=self.pk)
+        oldest_update = journal.order_by("seq").values_list("created", flat=True)[:1]
+        if not oldest_update or oldest_update[0] > last_update_ts:
+            # The journal doesn't go back to `last_update_ts`.
+            return
+
+        return (
+            journal.filter(created__gte=last_update_ts)
+            .order_by("seq")
+            .values_list("renders", "removals")
+        )
+
+    def _get_live_updates_since_seq(self, last_update_seq):
+        journal = LiveUpdate.objects.filter(page_id=self.pk)
+        oldest_seq = journal.order_by("seq").values_list("seq", flat=True)[:1]
+        if not oldest_seq or oldest_seq[0] > last_update_seq + 1:
+            # Some of the updates following `last_update_seq` aren't in the journal.
+            return
+
+        return (
+            journal.filter(seq__gt=last_update_seq)
+            .order_by("seq")
+            .values_list("renders", "removals")
+        )
+
+    @staticmethod
+    def _get_updated_ids(live_updates):
+        updated_ids = set()
+        for renders, removals in live_updates:
+            updated_ids.update(json.loads(renders))
+            updated_ids.difference_update(json.loads(removals))
+        return updated_ids
+
+    @staticmethod
+    def _get_window_size(live_post_ids, oldest_post_id):
+        # The client side tracks the live posts up to the oldest one it has loaded.
+        if oldest_post_id is not None:
+            try:
+                return live_post_ids.index(oldest_post_id) + 1
+            except ValueError:
+                pass
+        return len(live_post_ids)
+
+    def _get_updated_indexes(self, updated_ids, oldest_post_id=None):
+        # Updated live posts are usually the latest ones, so the scan stops
+        # as soon as all of them are found instead of going through all the live posts.
+        updated_ids = set(updated_ids)
+        updated_indexes = []
+        for i, raw_live_post in enumerate(self.live_posts.raw_data):
+            if not updated_ids:
+                break
+            post_id = raw_live_post["id"]
+            if post_id in updated_ids:
+                updated_ids.discard(post_id)
+                updated_indexes.append(i)
+            if post_id == oldest_post_id:
+                # The client side doesn't track older live posts.
+                break
+        return updated_indexes
+
+    def _get_updated_posts(self, updated_ids, oldest_post_id=None):
+        # Latest updates are processed later by the client side.
+        updated_posts = {}
+        for i in reversed(self._get_updated_indexes(updated_ids, oldest_post_id)):
+            post = self.get_live_post_by_index(i)
+            updated_posts[post.id] = {
+                "show": post.value["show"],
+                "content": render_live_post(post),
+            }
+        return updated_posts
+
+    def _get_current_posts(self, oldest_post_id=None):
+        live_post_ids = self.get_live_post_ids()
+        window_size = self._get_window_size(live_post_ids, oldest_post_id)
+        return list(reversed(live_post_ids[:window_size]))
+
+    def get_updates_since(self, last_update_ts, oldest_post_id=None):
         """
         Retrieves new updates since a given timestamp value.
 
+        Live posts updated are read from the update journal of the page.
+        If the journal doesn't go back to `last_update_ts`, all the live posts are checked.
+
         Args:
             last_update_ts (DateTime):
                 Timestamp of the last update.
+            oldest_post_id (str):
+                ID of the oldest live post loaded in the client side.
+                Older live posts are left out of the updates if given.
 
         Returns:
             (list, dict):
@@ -260,8 +1051,95 @@ class LivePageMixin(models.Model):
                 and the updated posts since `last_update_ts`.
         """
 
+        live_updates = self._get_live_updates_since(last_update_ts)
+        if live_updates is None:
+            return self._scan_updates_since(last_update_ts, oldest_post_id)
+
+        updated_posts = self._get_updated_posts(
+            self._get_updated_ids(live_updates), oldest_post_id
+        )
+        return (updated_posts, self._get_current_posts(oldest_post_id))
+
+    def get_updates_since_seq(self, last_update_seq, oldest_post_id=None):
+        """
+        Retrieves new updates since a given update sequence number.
+
+        Live posts updated are read from the update journal of the page.
+        If the journal doesn't go back to `last_update_seq`, all the live posts
+        are sent so the client side can resynchronize.
+
+        Args:
+            last_update_seq (int):
+                Sequence number of the last update received.
+            oldest_post_id (str):
+                ID of the oldest live post loaded in the client side.
+                Older live posts are left out of the updates if given.
+
+        Returns:
+            (list, dict):
+                a tuple containing the current live posts
+                and the updated posts since `last_update_seq`.
+        """
+
+        current_posts = self._get_current_posts(oldest_post_id)
+        if last_update_seq >= self.last_update_seq:
+            return ({}, current_posts)
+
+        live_updates = self._get_live_updates_since_seq(last_update_seq)
+        if live_updates is None:
+            updated_ids = current_posts
+        else:
+            updated_ids = self._get_updated_ids(live_updates)
+
+        updated_posts = self._get_updated_posts(updated_ids, oldest_post_id)
+        return (updated_posts, current_posts)
+
+    def get_update_delta_since_seq(self, last_update_seq, oldest_post_id=None):
+        """
+        Retrieves new updates since a given update sequence number as a delta.
+
+        Unlike `get_updates_since_seq`, the live posts removed since `last_update_seq`
+        are given instead of the IDs of all the current live posts,
+        so the cost doesn't grow with the number of live posts of the page.
+
+        Args:
+            last_update_seq (int):
+                Sequence number of the last update received.
+            oldest_post_id (str):
+                ID of the oldest live post loaded in the client side.
+                Older live posts are left out of the updates if given.
+
+        Returns:
+            (dict, list):
+                a tuple containing the updated posts and the IDs of the live posts
+                removed since `last_update_seq`, or `None` if the update journal
+                doesn't go back to `last_update_seq`.
+        """
+
+        if last_update_seq >= self.last_update_seq:
+            return ({}, [])
+
+        live_updates = self._get_live_updates_since_seq(last_update_seq)
+        if live_updates is None:
+            return
+
+        live_updates = list(live_updates)
+        removals = {}
+        for _, removed_ids in live_updates:
+            removals.update(dict.fromkeys(json.loads(removed_ids)))
+
+        updated_posts = self._get_updated_posts(
+            self._get_updated_ids(live_updates), oldest_post_id
+        )
+        return (updated_posts, list(removals))
+
+    def _scan_updates_since(self, last_update_ts, oldest_post_id=None):
+        window_size = self._get_window_size(self.get_live_post_ids(), oldest_post_id)
+
         # Reverse posts list so that latest updates are processed later by the client side.
-        posts = reversed(self.live_posts)
+        posts = (
+            get_stream_child(self.live_posts, i) for i in reversed(range(window_size))
+        )
         current_posts, updated_posts = [], {}
         for post in posts:
             post_id = post.id
@@ -271,7 +1149,7 @@ class LivePageMixin(models.Model):
             if created >= last_update_ts:  # This is a new post
                 updated_posts[post_id] = {
                     "show": post.value["show"],
-                    "content": post.render(context={"block_id": post.id}),
+                    "content": render_live_post(post),
                 }
                 continue
 
@@ -280,7 +1158,7 @@ class LivePageMixin(models.Model):
                 # This is an edited post
                 updated_posts[post_id] = {
                     "show": post.value["show"],
-                    "content": post.render(context={"block_id": post.id}),
+                    "content": render_live_post(post),
                 }
 
         return (updated_posts, current_posts)
@@ -23,7 +23,12 @@ class DjangoChannelsApp(AsyncJsonWebsocketConsumer):
         """Receives messages from room group and sends them to websocket client."""
 
         await self.send_json(
-            {"renders": event["renders"], "removals": event["removals"]}
+            {
+                "renders": event["renders"],
+                "removals": event["removals"],
+                "seq": event.get("seq"),
+                "closed": event.get("closed", False),
+            }
         )
 
 
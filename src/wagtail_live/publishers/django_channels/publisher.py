@@ -7,7 +7,7 @@ from wagtail_live.publishers.websocket import BaseWebsocketPublisher
 class DjangoChannelsPublisher(BaseWebsocketPublisher):
     """Django channels publisher."""
 
-    def publish(self, channel_id, renders, removals):
+    def publish(self, channel_id, renders, removals, seq=None, closed=False):
         """Sends updates to the room group corresponding to channel_id."""
 
         channel_layer = get_channel_layer()
@@ -16,6 +16,8 @@ class DjangoChannelsPublisher(BaseWebsocketPublisher):
             "type": "update",
             "renders": renders,
             "removals": removals,
+            "seq": seq,
+            "closed": closed,
         }
 
         async_to_sync(channel_layer.group_send)(group_name, message)
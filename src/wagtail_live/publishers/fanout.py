@@ -0,0 +1,240 @@
+"""Fan-out of messages to websocket connections isolating slow consumers."""
+
+import asyncio
+import json
+import logging
+
+from django.core.exceptions import ImproperlyConfigured
+
+from .utils import get_send_queue_size, get_slow_consumer_policy
+
+logger = logging.getLogger(__name__)
+
+DROP_POLICY = "drop"
+DISCONNECT_POLICY = "disconnect"
+SLOW_CONSUMER_POLICIES = [DROP_POLICY, DISCONNECT_POLICY]
+
+# Close code telling clients to try again later.
+TRY_AGAIN_LATER = 1013
+
+
+class PreparedMessage:
+    """
+    Message prepared once and sent verbatim to every connection.
+
+    Attributes:
+        text (str):
+            The message, as published on the bus.
+    """
+
+    __slots__ = ("text", "_data")
+
+    def __init__(self, text):
+        self.text = text
+        self._data = None
+
+    @property
+    def data(self):
+        """The message encoded in UTF-8, ready to be written in a text frame."""
+
+        if self._data is None:
+            self._data = self.text.encode("utf-8")
+        return self._data
+
+
+class FanOut:
+    """
+    Broadcasts messages to websocket connections through a send queue per connection.
+
+    Each connection has its own task sending the messages of its queue,
+    so a slow connection doesn't delay the others.
+    Messages are only queued for the connections registered, from their subscription
+    until they are discarded.
+    When the queue of a connection is full, the connection is a slow consumer and:
+
+    - its oldest message is dropped with the `"drop"` policy,
+    - it is disconnected with the `"disconnect"` policy.
+
+    Attributes:
+        send (callable):
+            Coroutine function sending a message to a connection.
+        close (callable):
+            Coroutine function closing a connection given a close code.
+        maxsize (int):
+            Maximum number of messages waiting to be sent to a connection.
+        policy (str):
+            Policy applied to slow consumers.
+        queues (dict):
+            Maps the connections to their send queues.
+        stats (dict):
+            Number of messages `sent` and `dropped` and of connections `disconnected`.
+    """
+
+    def __init__(self, send, close, maxsize=None, policy=None):
+        self.send = send
+        self.close = close
+        self.maxsize = maxsize or get_send_queue_size()
+        self.policy = policy or get_slow_consumer_policy()
+        if self.policy not in SLOW_CONSUMER_POLICIES:
+            raise ImproperlyConfigured(
+                f"Unknown slow consumer policy {self.policy}. "
+                f"Expected one of {SLOW_CONSUMER_POLICIES}."
+            )
+
+        self.queues = {}
+        self.stats = {"sent": 0, "dropped": 0, "disconnected": 0}
+        self._senders = {}
+
+    def get_queue_depths(self):
+        """
+        Retrieves the number of messages waiting to be sent to each connection.
+
+        Returns:
+            dict: Maps the connections to the size of their send queues.
+        """
+
+        return {connection: queue.qsize() for connection, queue in self.queues.items()}
+
+    async def subscribe(self, bus, channel_group_name, connection, since=None):
+        """
+        Subscribes a connection to a channel group of a bus.
+
+        When the connection gives the stream ID of the last message it received,
+        the messages it missed are sent before the new ones.
+        If they can't be retrieved, a `resync` message asking to reload the page
+        is sent instead.
+
+        Args:
+            bus (RedisBus):
+                Bus the messages are published on.
+            channel_group_name (str):
+                Channel group to subscribe to.
+            connection (*):
+                Connection to subscribe.
+            since (str):
+                Stream ID of the last message received by the connection.
+        """
+
+        if not since:
+            self.register(connection)
+            await bus.subscribe(channel_group_name, connection)
+            return
+
+        # Hold the new messages until the missed ones are sent.
+        self.queues[connection] = asyncio.Queue(maxsize=self.maxsize)
+        await bus.subscribe(channel_group_name, connection)
+
+        messages = await bus.get_missed_messages(channel_group_name, since)
+        if messages is None:
+            messages = [json.dumps({"resync": True, "reload": True})]
+        try:
+            for message in messages:
+                await self.send(connection, PreparedMessage(message))
+                self.stats["sent"] += 1
+        except Exception:
+            logger.warning("Failed sending a message to a websocket connection.")
+            self.discard(connection)
+            return
+
+        queue = self.queues.get(connection)
+        if queue is not None and connection not in self._senders:
+            self._senders[connection] = asyncio.create_task(
+                self.run_sender(connection, queue)
+            )
+
+    def register(self, connection):
+        """
+        Creates the send queue of a connection and starts sending its messages.
+
+        Args:
+            connection (*):
+                Connection to register.
+        """
+
+        queue = self.queues[connection] = asyncio.Queue(maxsize=self.maxsize)
+        self._senders[connection] = asyncio.create_task(
+            self.run_sender(connection, queue)
+        )
+
+    async def broadcast(self, message, connections):
+        """
+        Adds a message to the send queues of the given connections.
+
+        This returns without waiting for the message to be sent.
+
+        Args:
+            message (*):
+                Message to send.
+            connections (iterable):
+                Connections to send the message to.
+        """
+
+        for connection in list(connections):
+            self.put(connection, message)
+
+    def put(self, connection, message):
+        """
+        Adds a message to the send queue of a connection, applying the slow consumer policy.
+
+        Args:
+            connection (*):
+                Connection to send the message to.
+            message (*):
+                Message to send.
+        """
+
+        queue = self.queues.get(connection)
+        if queue is None:
+            # The connection has been discarded, e.g. disconnected as a slow consumer,
+            # or hasn't subscribed yet.
+            return
+
+        if queue.full():
+            if self.policy == DISCONNECT_POLICY:
+                logger.warning("Disconnecting a slow websocket connection.")
+                self.stats["disconnected"] += 1
+                self.discard(connection)
+                asyncio.create_task(self.close(connection, TRY_AGAIN_LATER))
+                return
+
+            queue.get_nowait()
+            self.stats["dropped"] += 1
+
+        queue.put_nowait(message)
+
+    async def run_sender(self, connection, queue):
+        """
+        Sends the messages of the queue of a connection as long as it is open.
+
+        Args:
+            connection (*):
+                Connection to send the messages to.
+            queue (Queue):
+                Send queue of the connection.
+        """
+
+        while True:
+            message = await queue.get()
+            try:
+                await self.send(connection, message)
+            except Exception:
+                logger.warning("Failed sending a message to a websocket connection.")
+                self.discard(connection, cancel=False)
+                return
+            self.stats["sent"] += 1
+
+    def discard(self, connection, cancel=True):
+        """
+        Removes the send queue of a connection.
+
+        Args:
+            connection (*):
+                Connection closed or disconnected.
+            cancel (bool):
+                Whether to cancel the task sending the messages to the connection.
+        """
+
+        self.queues.pop(connection, None)
+        sender = self._senders.pop(connection, None)
+        if cancel and sender is not None:
+            sender.cancel()
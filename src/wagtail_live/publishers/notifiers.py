@@ -0,0 +1,188 @@
+"""Notifiers waking up pending long polling requests when a live page is updated."""
+
+import asyncio
+import threading
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+
+
+def _set_result(future, result):
+    if not future.done():
+        future.set_result(result)
+
+
+class BaseUpdateNotifier:
+    """
+    Base class for update notifiers.
+
+    Pending long polling requests subscribe to the channel of the page they wait updates for.
+    Notifiers listen to the `live_page_update` signal and publish the update
+    to all the processes serving long polling requests.
+    Each process then wakes up the requests waiting for the channel of the updated page.
+
+    Attributes:
+        waiters (dict):
+            Maps a channel ID to the futures of the requests waiting for an update
+            and the event loops running them.
+    """
+
+    def __init__(self):
+        self.waiters = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, sender, channel_id, seq=None, **kwargs):
+        """
+        Listens to the `live_page_update` signal.
+
+        Args:
+            sender (LivePageMixin):
+                Sender of the signal.
+            channel_id (str):
+                ID of the channel corresponding to the updated page.
+            seq (int):
+                Sequence number of the update.
+        """
+
+        self.publish(channel_id=channel_id, seq=seq)
+
+    def publish(self, channel_id, seq=None):
+        """
+        Informs the processes serving long polling requests that a page has been updated.
+
+        Args:
+            channel_id (str):
+                ID of the channel corresponding to the updated page.
+            seq (int):
+                Sequence number of the update.
+        """
+
+        raise NotImplementedError
+
+    async def start(self):
+        """
+        Starts listening to the updates published by all processes if not done yet.
+
+        Pending long polling requests call this before subscribing.
+        """
+
+    def handle_message(self, message):
+        """
+        Wakes up the requests waiting for an update published by a process.
+
+        Args:
+            message (dict):
+                Message published, containing the `channel_id` of the updated page
+                and the `seq` of the update.
+        """
+
+        self.notify(channel_id=message["channel_id"], seq=message.get("seq"))
+
+    def subscribe(self, channel_id):
+        """
+        Registers a request waiting for an update of a page.
+
+        This must be called from the event loop running the request.
+
+        Args:
+            channel_id (str):
+                ID of the channel corresponding to the page.
+
+        Returns:
+            Future: resolved with the sequence number of the update when the page is updated.
+        """
+
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+        with self._lock:
+            self.waiters.setdefault(channel_id, {})[future] = loop
+        return future
+
+    def unsubscribe(self, channel_id, future):
+        """
+        Unregisters a request waiting for an update of a page.
+
+        Args:
+            channel_id (str):
+                ID of the channel corresponding to the page.
+            future (Future):
+                Future returned when the request subscribed.
+        """
+
+        with self._lock:
+            waiters = self.waiters.get(channel_id)
+            if waiters is not None:
+                waiters.pop(future, None)
+                if not waiters:
+                    del self.waiters[channel_id]
+
+    def notify(self, channel_id, seq=None):
+        """
+        Wakes up the requests of this process waiting for an update of a page.
+
+        This can be called from any thread.
+
+        Args:
+            channel_id (str):
+                ID of the channel corresponding to the updated page.
+            seq (int):
+                Sequence number of the update.
+        """
+
+        with self._lock:
+            waiters = list(self.waiters.get(channel_id, {}).items())
+
+        for future, loop in waiters:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(_set_result, future, seq)
+
+
+class InProcessNotifier(BaseUpdateNotifier):
+    """
+    Notifier waking up the requests pending in the process where the page is updated.
+
+    Suitable for deployments running a single process.
+    """
+
+    def publish(self, channel_id, seq=None):
+        """See base class."""
+
+        self.notify(channel_id=channel_id, seq=seq)
+
+
+@lru_cache(maxsize=1)
+def get_update_notifier():
+    """
+    Retrieves the notifier used by the asynchronous long polling publisher.
+
+    The user can set this parameter in his settings by doing so:
+    ```python
+    WAGTAIL_LIVE_UPDATE_NOTIFIER = "path.to.notifier.class"
+    ```
+
+    The default value is `"wagtail_live.publishers.notifiers.InProcessNotifier"`.
+
+    Returns:
+        BaseUpdateNotifier: An instance of the notifier specified.
+
+    Raises:
+        ImproperlyConfigured: if the notifier specified doesn't inherit from
+            `wagtail_live.publishers.notifiers.BaseUpdateNotifier`.
+        ImportError: if the notifier class couldn't be loaded.
+    """
+
+    notifier_class = getattr(
+        settings,
+        "WAGTAIL_LIVE_UPDATE_NOTIFIER",
+        "wagtail_live.publishers.notifiers.InProcessNotifier",
+    )
+
+    notifier = import_string(notifier_class)
+    if not issubclass(notifier, BaseUpdateNotifier):
+        raise ImproperlyConfigured(
+            f"The notifier {notifier_class} doesn't inherit from "
+            "wagtail_live.publishers.notifiers.BaseUpdateNotifier."
+        )
+    return notifier()
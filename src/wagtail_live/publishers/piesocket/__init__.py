@@ -1,9 +1,15 @@
 from .publisher import PieSocketPublisher
-from .utils import get_piesocket_api_key, get_piesocket_endpoint, get_piesocket_secret
+from .utils import (
+    get_piesocket_api_key,
+    get_piesocket_endpoint,
+    get_piesocket_secret,
+    get_piesocket_timeout,
+)
 
 __all__ = [
     "PieSocketPublisher",
     "get_piesocket_api_key",
     "get_piesocket_endpoint",
     "get_piesocket_secret",
+    "get_piesocket_timeout",
 ]
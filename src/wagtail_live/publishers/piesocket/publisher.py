@@ -1,11 +1,15 @@
 import json
 import logging
+import random
+import threading
+import time
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from wagtail_live.publishers.websocket import BaseWebsocketPublisher
 
-from .utils import get_piesocket_api_key, get_piesocket_secret
+from .utils import get_piesocket_api_key, get_piesocket_secret, get_piesocket_timeout
 
 logger = logging.getLogger(__name__)
 
@@ -14,20 +18,117 @@ headers = {"Content-Type": "application/json"}
 
 
 class PieSocketPublisher(BaseWebsocketPublisher):
-    """PieSocket publisher."""
+    """
+    PieSocket publisher.
 
-    def publish(self, channel_id, renders, removals):
-        """See base class."""
+    Updates are sent to the PieSocket API through a session keeping its connections alive.
+    Set the `WAGTAIL_LIVE_PUBLISH_BATCH_WINDOW` setting to send the updates of a page
+    received during a short window in a single API call.
+
+    Attributes:
+        publish_url (str):
+            URL of the PieSocket publish API.
+        pool_maxsize (int):
+            Maximum number of connections kept alive with the PieSocket API.
+        max_retries (int):
+            Number of times a failed request is retried.
+        retry_backoff (float):
+            Duration, in seconds, to wait before the first retry.
+            The delay doubles with each retry and is randomized to spread the retries.
+    """
+
+    publish_url = publish_url
+    pool_maxsize = 10
+    max_retries = 2
+    retry_backoff = 0.2
+
+    def __init__(self):
+        super().__init__()
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self):
+        """Session used to send requests to the PieSocket API."""
+
+        with self._session_lock:
+            if self._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_maxsize=self.pool_maxsize)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update(headers)
+                self._session = session
+        return self._session
+
+    def get_retry_delay(self, attempt):
+        """
+        Computes the duration to wait before retrying a request.
+
+        Args:
+            attempt (int): Number of the retry, starting at 1.
+
+        Returns:
+            float: Duration in seconds.
+        """
+
+        return self.retry_backoff * 2 ** (attempt - 1) * random.uniform(0.5, 1.5)
+
+    def send(self, payload):
+        """
+        Sends a payload to the PieSocket API, retrying on connection errors and server errors.
+
+        Args:
+            payload (str): JSON payload to send.
+
+        Returns:
+            Response: Response of the API, `None` if it couldn't be reached.
+        """
+
+        response = None
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                time.sleep(self.get_retry_delay(attempt))
+            try:
+                response = self.session.post(
+                    self.publish_url, data=payload, timeout=get_piesocket_timeout()
+                )
+            except requests.RequestException:
+                logger.warning("Couldn't reach the PieSocket API.", exc_info=True)
+                response = None
+                continue
+
+            if response.status_code < 500:
+                break
+
+        return response
+
+    def publish(self, channel_id, renders, removals, seq=None, closed=False):
+        """
+        See base class.
+
+        Raises:
+            RequestException: if the update couldn't be published, even after retrying.
+        """
 
         payload = json.dumps(
             {
                 "key": get_piesocket_api_key(),
                 "secret": get_piesocket_secret(),
                 "channelId": channel_id,
-                "message": {"renders": renders, "removals": removals},
+                "message": {
+                    "renders": renders,
+                    "removals": removals,
+                    "seq": seq,
+                    "closed": closed,
+                },
             }
         )
 
-        response = requests.post(publish_url, headers=headers, data=payload)
-        if not response.ok:
+        response = self.send(payload)
+        if response is None or not response.ok:
             logger.error("Failed publishing new update to PieSocket API.")
+            # Let the publish worker know the update hasn't been published.
+            if response is None:
+                raise requests.ConnectionError("Couldn't reach the PieSocket API.")
+            response.raise_for_status()
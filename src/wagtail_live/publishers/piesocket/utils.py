@@ -1,5 +1,7 @@
 from functools import lru_cache
 
+from django.conf import settings
+
 from wagtail_live.utils import get_setting_or_raise
 
 
@@ -52,3 +54,20 @@ def get_piesocket_endpoint():
     return get_setting_or_raise(
         setting="PIESOCKET_ENDPOINT", setting_str="PieSocket endpoint"
     )
+
+
+def get_piesocket_timeout():
+    """
+    Retrieves the timeout of the requests sent to the PieSocket API.
+
+    The user can set this parameter in his settings by doing so:
+    ```python
+    PIESOCKET_TIMEOUT = (duration in seconds)
+    ```
+    The default value is 5 seconds.
+
+    Returns:
+        float: The timeout of the requests if defined else 5.
+    """
+
+    return getattr(settings, "PIESOCKET_TIMEOUT", 5)
@@ -1,13 +1,22 @@
+import asyncio
+import functools
 import time
 from datetime import datetime, timezone
 
+import django
 from django.conf import settings
-from django.http import JsonResponse
+from django.core.exceptions import ImproperlyConfigured
+from django.http import Http404, JsonResponse
 from django.shortcuts import get_object_or_404
 from django.urls import path
+from django.utils.cache import get_conditional_response, patch_cache_control
 from django.utils.functional import cached_property
+from django.utils.http import quote_etag
 from django.views import View
 
+from wagtail_live.cache import get_cached_last_update, set_cached_last_update
+from wagtail_live.models import get_update_timestamp
+from wagtail_live.publishers.notifiers import get_update_notifier
 from wagtail_live.utils import (
     get_live_page_model,
     get_polling_interval,
@@ -43,6 +52,41 @@ class PollingPublisherMixin(View):
             path(cls.url_path, cls.as_view(), name=cls.url_name),
         ]
 
+    def get_last_update(self, channel_id):
+        """
+        Retrieves the last update of a page without loading the page.
+
+        The last update is read from the cache defined by the `WAGTAIL_LIVE_LAST_UPDATE_CACHE`
+        setting if any. The database is queried on cache misses only.
+
+        Args:
+            channel_id (str):
+                Id of the channel to get the last update from.
+
+        Returns:
+            (int, DateTime, int):
+                a tuple containing the ID of the page, the date and time
+                and the sequence number of its last update.
+
+        Raises:
+            Http404: if no page corresponds to the `channel_id` given.
+        """
+
+        last_update = get_cached_last_update(channel_id)
+        if last_update is not None:
+            return last_update
+
+        last_update = (
+            self.model.objects.filter(channel_id=channel_id)
+            .values_list("pk", "last_updated_at", "last_update_seq")
+            .first()
+        )
+        if last_update is None:
+            raise Http404
+
+        set_cached_last_update(channel_id, *last_update)
+        return last_update
+
     @staticmethod
     def get_last_update_client_from_request(request):
         """
@@ -57,6 +101,139 @@ class PollingPublisherMixin(View):
 
         return float(request.GET.get("last_update_ts"))
 
+    @staticmethod
+    def get_last_update_seq_from_request(request):
+        """
+        Retrieves the sequence number of the last update received in the client side.
+
+        Args:
+            request (HttpRequest): client side request
+
+        Returns:
+            int: Sequence number of the last update received in the client side
+                if sent along with the request else `None`.
+        """
+
+        last_update_seq = request.GET.get("last_update_seq")
+        if last_update_seq is not None:
+            return int(last_update_seq)
+
+    @staticmethod
+    def get_oldest_post_from_request(request):
+        """
+        Retrieves the ID of the oldest live post loaded in the client side.
+
+        Args:
+            request (HttpRequest): client side request
+
+        Returns:
+            str: ID of the oldest live post loaded in the client side
+                if sent along with the request else `None`.
+        """
+
+        return request.GET.get("oldest_post")
+
+    def has_new_updates(self, request, last_updated_at, last_update_seq):
+        """
+        Checks if new updates are available for the client side.
+
+        The sequence number of the last update received is used if the client side
+        sends it, else the timestamp of the last update received.
+
+        Args:
+            request (HttpRequest): client side request
+            last_updated_at (DateTime): Date of the last update of the page requested.
+            last_update_seq (int): Sequence number of the last update of the page requested.
+
+        Returns:
+            bool: `True` if new updates are available, `False` else.
+        """
+
+        last_update_seq_client = self.get_last_update_seq_from_request(request=request)
+        if last_update_seq_client is not None:
+            return last_update_seq > last_update_seq_client
+
+        last_update_client = self.get_last_update_client_from_request(request=request)
+        return get_update_timestamp(last_updated_at) > last_update_client
+
+    def get_updates(self, request, live_page):
+        """
+        Retrieves the updates the client side hasn't received yet.
+
+        The sequence number of the last update received is used if the client side
+        sends it, else the timestamp of the last update received.
+        Live posts older than the oldest live post loaded in the client side are left out.
+
+        Args:
+            request (HttpRequest): client side request
+            live_page (LivePageMixin): Live page requested.
+
+        Returns:
+            (dict, list):
+                a tuple containing the updated posts and the current live posts.
+        """
+
+        oldest_post_id = self.get_oldest_post_from_request(request=request)
+        last_update_seq = self.get_last_update_seq_from_request(request=request)
+        if last_update_seq is not None:
+            return live_page.get_updates_since_seq(
+                last_update_seq, oldest_post_id=oldest_post_id
+            )
+
+        last_update_client = self.get_last_update_client_from_request(request=request)
+        tz = timezone.utc if settings.USE_TZ else None
+        return live_page.get_updates_since(
+            last_update_ts=datetime.fromtimestamp(last_update_client, tz=tz),
+            oldest_post_id=oldest_post_id,
+        )
+
+    def get_updates_data(self, request, live_page):
+        """
+        Retrieves the updates the client side hasn't received yet, ready to be sent.
+
+        When the client side sends the sequence number of the last update it received
+        and the update journal of the page goes back to it, the IDs of the live posts
+        removed since are sent.
+        Otherwise, the IDs of all the current live posts are sent so the client side
+        can resynchronize.
+
+        Args:
+            request (HttpRequest): client side request
+            live_page (LivePageMixin): Live page requested.
+
+        Returns:
+            dict: The updated posts along with either the `removals` or
+                the `currentPosts` of the page.
+        """
+
+        last_update_seq = self.get_last_update_seq_from_request(request=request)
+        if last_update_seq is not None:
+            delta = live_page.get_update_delta_since_seq(
+                last_update_seq,
+                oldest_post_id=self.get_oldest_post_from_request(request=request),
+            )
+            if delta is not None:
+                updated_posts, removals = delta
+                return {"updates": updated_posts, "removals": removals}
+
+        updated_posts, current_posts = self.get_updates(
+            request=request, live_page=live_page
+        )
+        return {"updates": updated_posts, "currentPosts": current_posts}
+
+    @staticmethod
+    def get_closed_response():
+        """
+        Informs the client side that the page requested is closed.
+
+        Client side stops fetching updates when receiving this response.
+
+        Returns:
+            JsonResponse: Gone response.
+        """
+
+        return JsonResponse({"closed": True}, status=410)
+
     def post(self, request, channel_id, *args, **kwargs):
         """
         Initiates communication with client side and sends current live posts.
@@ -70,18 +247,20 @@ class PollingPublisherMixin(View):
         Returns:
             HttpResponse:
             - JSONResponse with the following informations:
-                - A list of the IDs of the current live posts for the page requested.
+                - A list of the IDs of the live posts rendered for the page requested.
 
                     Client side uses this list to keep track of live posts that have been deleted.
 
-                - Timestamp of the last update for the page requested.
+                - Timestamp and sequence number of the last update for the page requested.
 
-                    Client side uses this to know when new updates are available.
+                    Client side uses these to know when new updates are available.
 
                 - The duration of the polling interval for interval polling.
 
                 if a page corresponding to the `channel_id` given exists.
 
+            - Gone: if the page corresponding to the `channel_id` given is closed.
+
             - Http404 else.
         """
 
@@ -93,28 +272,36 @@ class PollingPublisherMixin(View):
 
         Args:
             request (HttpRequest):
-                Client side's request sent along with the timestamp of the
-                last update received.
+                Client side's request sent along with the sequence number or
+                the timestamp of the last update received.
             channel_id (str):
                 Id of the channel to get last update's timestamp from.
 
         Returns:
             HttpResponse:
             - JSONResponse with the following informations:
-                - A mapping of the live posts updated since client side's last update timestamp.
+                - A mapping of the live posts updated since client side's last update.
 
                     Keys represents IDs of the live posts edited and the values
                     are the new content of those live posts.
 
+                - A list of the IDs of the live posts removed since client side's last update.
+
+                    Sent when the update journal of the page goes back to the client side's
+                    last update.
+
                 - A list of the IDs of the current live posts for the page requested.
 
+                    Sent instead of the removals when the client side needs to resynchronize.
                     Client side compares this list to the one it has and remove the live posts
                     whose IDs aren't in this new list.
 
-                - Timestamp of the last update for the page requested.
+                - Timestamp and sequence number of the last update for the page requested.
 
                 if a page corresponding to the `channel_id` given exists.
 
+            - Gone: if the page corresponding to the `channel_id` given is closed.
+
             - Http404 else.
         """
 
@@ -136,25 +323,75 @@ class IntervalPollingPublisher(PollingPublisherMixin):
         and repeats this step.
 
     3. If new updates are available, client side sends a GET request to get the new updates.
+
+    HEAD and GET responses support conditional requests.
+    They carry an `ETag` derived from the sequence number of the last update of the page,
+    so unchanged pages get a `304 Not Modified` response with an empty body.
+    No `Last-Modified` header is sent: it only has a precision of one second and
+    the date of the last update of a page can move backwards when an older live post
+    is added, so it can't tell reliably whether a page has been updated.
     """
 
     url_name = "interval-polling"
 
+    @staticmethod
+    def get_etag(last_updated_at, last_update_seq):
+        """Computes the ETag of the responses for a page given its last update."""
+
+        return quote_etag(f"{last_update_seq}-{get_update_timestamp(last_updated_at)}")
+
+    def get_not_modified_response(self, request, last_updated_at, last_update_seq):
+        """
+        Checks the conditional headers sent by the client side against
+        the last update of the page requested.
+
+        Args:
+            request (HttpRequest):
+                Client side's request
+            last_updated_at (DateTime):
+                Date of the last update of the page requested.
+            last_update_seq (int):
+                Sequence number of the last update of the page requested.
+
+        Returns:
+            HttpResponse: A `304 Not Modified` response if the client side already has
+                the last update of the page else `None`.
+        """
+
+        return get_conditional_response(
+            request,
+            etag=self.get_etag(last_updated_at, last_update_seq),
+        )
+
+    def set_validators(self, response, last_updated_at, last_update_seq):
+        """Sets the `ETag` header of a response."""
+
+        response["ETag"] = self.get_etag(last_updated_at, last_update_seq)
+
+        # Caches must check with the server that the page hasn't been updated
+        # before using a stored response.
+        patch_cache_control(response, no_cache=True)
+        return response
+
     def post(self, request, channel_id, *args, **kwargs):
         """See base class."""
 
         live_page = get_object_or_404(self.model, channel_id=channel_id)
+        if live_page.closed:
+            return self.get_closed_response()
+
         return JsonResponse(
             {
-                "livePosts": [live_post.id for live_post in live_page.live_posts],
+                "livePosts": live_page.get_live_posts_window_ids(),
                 "lastUpdateTimestamp": live_page.last_update_timestamp,
+                "lastUpdateSeq": live_page.last_update_seq,
                 "pollingInterval": get_polling_interval(),
             }
         )
 
     def head(self, request, channel_id, *args, **kwargs):
         """
-        Sends the timestamp of the last update for the page requested.
+        Sends the timestamp and the sequence number of the last update for the page requested.
 
         Args:
             request (HttpRequest):
@@ -166,36 +403,53 @@ class IntervalPollingPublisher(PollingPublisherMixin):
             HttpResponse:
             - OK: if a page corresponding to the `channel_id` given exists.
 
-                The timestamp of the last update for the page requested is sent in the response.
-                Client side checks if this value is greater than the last one received.
+                The timestamp and the sequence number of the last update for the page requested
+                are sent in the response.
+                Client side checks if these values are greater than the last ones received.
                 In such case, the client side knows that new updates are available and sends a
                 GET request to get those updates.
 
-            - Http404: else.
+            - Not Modified: if the client side sends the `ETag` of a previous response
+                and the page hasn't been updated since.
+
+            - Http404: if no page corresponds to the `channel_id` given.
         """
 
-        live_page = get_object_or_404(self.model, channel_id=channel_id)
-        response = JsonResponse(data={}, status=200)
-        response["Last-Update-At"] = live_page.last_update_timestamp
-        return response
+        _, last_updated_at, last_update_seq = self.get_last_update(channel_id)
+        response = self.get_not_modified_response(
+            request, last_updated_at, last_update_seq
+        )
+        if response is None:
+            response = JsonResponse(data={}, status=200)
+            response["Last-Update-At"] = get_update_timestamp(last_updated_at)
+            response["Last-Update-Seq"] = last_update_seq
+
+        return self.set_validators(response, last_updated_at, last_update_seq)
 
     def get(self, request, channel_id, *args, **kwargs):
         """See base class."""
 
-        live_page = get_object_or_404(self.model, channel_id=channel_id)
-        last_update_client = self.get_last_update_client_from_request(request=request)
-        tz = timezone.utc if settings.USE_TZ else None
-        updated_posts, current_posts = live_page.get_updates_since(
-            last_update_ts=datetime.fromtimestamp(last_update_client, tz=tz),
+        page_id, last_updated_at, last_update_seq = self.get_last_update(channel_id)
+        response = self.get_not_modified_response(
+            request, last_updated_at, last_update_seq
         )
+        if response is not None:
+            return self.set_validators(response, last_updated_at, last_update_seq)
 
-        return JsonResponse(
+        live_page = get_object_or_404(self.model, pk=page_id)
+        if live_page.closed:
+            return self.get_closed_response()
+
+        response = JsonResponse(
             {
-                "updates": updated_posts,
-                "currentPosts": current_posts,
+                **self.get_updates_data(request=request, live_page=live_page),
                 "lastUpdateTimestamp": live_page.last_update_timestamp,
+                "lastUpdateSeq": live_page.last_update_seq,
             }
         )
+        return self.set_validators(
+            response, live_page.last_updated_at, live_page.last_update_seq
+        )
 
 
 class LongPollingPublisher(PollingPublisherMixin):
@@ -224,10 +478,42 @@ class LongPollingPublisher(PollingPublisherMixin):
         """See base class."""
 
         live_page = get_object_or_404(self.model, channel_id=channel_id)
+        if live_page.closed:
+            return self.get_closed_response()
+
         return JsonResponse(
             {
-                "livePosts": [live_post.id for live_post in live_page.live_posts],
+                "livePosts": live_page.get_live_posts_window_ids(),
                 "lastUpdateTimestamp": live_page.last_update_timestamp,
+                "lastUpdateSeq": live_page.last_update_seq,
+            }
+        )
+
+    def get_updates_response(self, request, page_id):
+        """
+        Sends the updates the client side hasn't received yet.
+
+        Args:
+            request (HttpRequest):
+                Client side's request
+            page_id (int):
+                ID of the page requested.
+
+        Returns:
+            JsonResponse: The new updates, the removals or the current live posts
+                and the last update of the page requested.
+                Gone if the page requested is closed.
+        """
+
+        live_page = get_object_or_404(self.model, pk=page_id)
+        if live_page.closed:
+            return self.get_closed_response()
+
+        return JsonResponse(
+            {
+                **self.get_updates_data(request=request, live_page=live_page),
+                "lastUpdateTimestamp": live_page.last_update_timestamp,
+                "lastUpdateSeq": live_page.last_update_seq,
             }
         )
 
@@ -238,28 +524,110 @@ class LongPollingPublisher(PollingPublisherMixin):
         See base class.
         """
 
-        last_update_client = self.get_last_update_client_from_request(request=request)
         polling_timeout = get_polling_timeout()
         starting_time = time.time()
 
         while time.time() - starting_time < polling_timeout:
-            live_page = get_object_or_404(self.model, channel_id=channel_id)
-            last_update_ts = live_page.last_update_timestamp
-            if last_update_ts > last_update_client:
-                tz = timezone.utc if settings.USE_TZ else None
-                updated_posts, current_posts = live_page.get_updates_since(
-                    last_update_ts=datetime.fromtimestamp(last_update_client, tz=tz),
-                )
-
-                return JsonResponse(
-                    {
-                        "updates": updated_posts,
-                        "currentPosts": current_posts,
-                        "lastUpdateTimestamp": last_update_ts,
-                    }
-                )
+            page_id, last_updated_at, last_update_seq = self.get_last_update(channel_id)
+            if self.has_new_updates(
+                request=request,
+                last_updated_at=last_updated_at,
+                last_update_seq=last_update_seq,
+            ):
+                return self.get_updates_response(request=request, page_id=page_id)
 
             # Maybe propose a setting so the user can define this value
             time.sleep(0.5)
 
         return JsonResponse({"timeOutReached": "Timeout duration reached."})
+
+
+class AsyncLongPollingPublisher(LongPollingPublisher):
+    """
+    Asynchronous long polling Publisher. Class Based View.
+
+    This class follows the same steps as the `LongPollingPublisher`
+    but pending GET requests don't hold a worker thread nor query the database periodically.
+    They wait until the page requested is updated, which is notified by the notifier
+    defined by the `WAGTAIL_LIVE_UPDATE_NOTIFIER` setting.
+
+    It requires Django 3.1 or higher and an ASGI server.
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        """
+        Wraps the view in a coroutine function so Django serves it asynchronously.
+
+        Raises:
+            ImproperlyConfigured: if Django doesn't support asynchronous views.
+        """
+
+        if django.VERSION < (3, 1):
+            raise ImproperlyConfigured(
+                f"{cls.__name__} requires Django 3.1 or higher. "
+                "Use the LongPollingPublisher with older versions of Django."
+            )
+
+        view = super().as_view(**initkwargs)
+
+        async def async_view(request, *args, **kwargs):
+            response = view(request, *args, **kwargs)
+            if asyncio.iscoroutine(response):
+                response = await response
+            return response
+
+        functools.update_wrapper(async_view, view)
+        return async_view
+
+    async def post(self, request, channel_id, *args, **kwargs):
+        """See base class."""
+
+        from asgiref.sync import sync_to_async
+
+        return await sync_to_async(super().post)(request, channel_id, *args, **kwargs)
+
+    async def get(self, request, channel_id, *args, **kwargs):
+        """
+        Sends updates when they are available as long as the polling timeout isn't reached.
+
+        See base class.
+        """
+
+        from asgiref.sync import sync_to_async
+
+        notifier = get_update_notifier()
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + get_polling_timeout()
+        await notifier.start()
+
+        while True:
+            # Subscribe before checking the last update of the page
+            # so that updates happening meanwhile aren't missed.
+            waiter = notifier.subscribe(channel_id)
+            try:
+                page_id, last_updated_at, last_update_seq = await sync_to_async(
+                    self.get_last_update
+                )(channel_id)
+                if self.has_new_updates(
+                    request=request,
+                    last_updated_at=last_updated_at,
+                    last_update_seq=last_update_seq,
+                ):
+                    return await sync_to_async(self.get_updates_response)(
+                        request=request, page_id=page_id
+                    )
+
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+
+                try:
+                    await asyncio.wait_for(waiter, timeout)
+                except asyncio.TimeoutError:
+                    break
+
+            finally:
+                notifier.unsubscribe(channel_id, waiter)
+
+        return JsonResponse({"timeOutReached": "Timeout duration reached."})
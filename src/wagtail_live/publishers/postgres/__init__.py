@@ -0,0 +1,3 @@
+from .notifier import PostgresNotifier
+
+__all__ = ["PostgresNotifier"]
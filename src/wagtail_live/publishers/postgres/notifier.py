@@ -0,0 +1,107 @@
+import asyncio
+import json
+import logging
+
+import psycopg2
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from ..notifiers import BaseUpdateNotifier
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresNotifier(BaseUpdateNotifier):
+    """
+    Notifier based on PostgreSQL LISTEN/NOTIFY.
+
+    Updates are notified on the database connection of the process updating the page,
+    so they are delivered once the transaction updating the page is committed.
+    Each process listens to the notifications with a dedicated connection.
+    Suitable for deployments running several processes or hosts without a Redis server.
+
+    Attributes:
+        channel_name (str):
+            PostgreSQL channel updates are notified on.
+        using (str):
+            Alias of the database to use.
+    """
+
+    channel_name = "wagtail_live_updates"
+    using = DEFAULT_DB_ALIAS
+
+    def __init__(self):
+        super().__init__()
+        self._listener = None
+        self._loop = None
+        self._starting = None
+
+    def publish(self, channel_id, seq=None):
+        """See base class."""
+
+        message = json.dumps({"channel_id": channel_id, "seq": seq})
+        with connections[self.using].cursor() as cursor:
+            cursor.execute("SELECT pg_notify(%s, %s)", [self.channel_name, message])
+
+    async def start(self):
+        """See base class."""
+
+        loop = asyncio.get_event_loop()
+        # Concurrent requests wait for the same connection to be opened.
+        if (
+            self._starting is None
+            or self._loop is not loop
+            or (self._starting.done() and not self.is_listening())
+        ):
+            self._loop = loop
+            self._starting = loop.create_task(self.listen())
+
+        # Don't cancel the connection when a waiting request is cancelled.
+        await asyncio.shield(self._starting)
+
+    async def listen(self):
+        """Opens the connection listening to the notifications and starts reading them."""
+
+        loop = asyncio.get_event_loop()
+        listener = await loop.run_in_executor(None, self.connect)
+        self._listener = listener
+        loop.add_reader(listener.fileno(), self.poll)
+
+    def is_listening(self):
+        """
+        Whether the connection listening to the notifications is open.
+
+        Returns:
+            bool: True if the notifier is listening, False else.
+        """
+
+        return self._listener is not None and not self._listener.closed
+
+    def connect(self):
+        """
+        Opens the connection used to listen to the notifications.
+
+        Returns:
+            connection: A psycopg2 connection listening to `channel_name`.
+        """
+
+        params = connections[self.using].get_connection_params()
+        connection = psycopg2.connect(**params)
+        connection.set_session(autocommit=True)
+        with connection.cursor() as cursor:
+            cursor.execute(f'LISTEN "{self.channel_name}"')
+        return connection
+
+    def poll(self):
+        """Reads the notifications received by the listening connection."""
+
+        try:
+            self._listener.poll()
+        except psycopg2.Error:
+            logger.exception("PostgreSQL notifier lost its connection.")
+            self._loop.remove_reader(self._listener.fileno())
+            self._listener.close()
+            return
+
+        while self._listener.notifies:
+            notify = self._listener.notifies.pop(0)
+            self.handle_message(json.loads(notify.payload))
@@ -1,4 +1,20 @@
 from .bus import RedisBus
-from .publisher import RedisPubSubPublisher, make_channel_group_name
+from .cluster import ShardedPubSub, key_slot
+from .notifier import RedisNotifier
+from .publisher import (
+    RedisPubSubPublisher,
+    add_stream_id,
+    make_channel_group_name,
+    make_stream_name,
+)
 
-__all__ = ["RedisBus", "RedisPubSubPublisher", "make_channel_group_name"]
+__all__ = [
+    "RedisBus",
+    "RedisNotifier",
+    "RedisPubSubPublisher",
+    "ShardedPubSub",
+    "add_stream_id",
+    "key_slot",
+    "make_channel_group_name",
+    "make_stream_name",
+]
@@ -1,9 +1,24 @@
 import asyncio
+import json
+import logging
 from collections import defaultdict
 
 import aioredis
+from aioredis.exceptions import ConnectionError as RedisConnectionError
+from aioredis.exceptions import ResponseError
+from aioredis.exceptions import TimeoutError as RedisTimeoutError
+from django.core.exceptions import ImproperlyConfigured
 
-from ..utils import get_redis_url
+from ..utils import (
+    get_redis_pattern_subscription,
+    get_redis_sharded_pubsub,
+    get_redis_teardown_delay,
+    get_redis_url,
+)
+from .cluster import ShardedPubSub
+from .publisher import add_stream_id, make_channel_group_name, make_stream_name
+
+logger = logging.getLogger(__name__)
 
 
 class RedisBus:
@@ -21,33 +36,178 @@ class RedisBus:
     The message is then broadcasted to users that have subscribed to that
     channel group.
 
+    By default, the bus subscribes in Redis to the channel groups having subscribers.
+    With pattern subscription, the bus subscribes once to all the channel groups
+    and dispatches the messages of the channel groups having subscribers.
+
+    With sharded Pub/Sub, the bus subscribes to each channel group with SSUBSCRIBE
+    on the Redis Cluster node serving its hash slot.
+
+    When the connection to Redis is lost, the bus reconnects with an exponential
+    backoff and subscribes again to its channel groups.
+    The connections of the channel groups are then sent a `resync` message
+    as they may have missed messages in the meantime.
+
     Attributes:
+        redis (Redis):
+            Redis client used by the bus.
         pubsub (PubSub):
             Redis PubSub class which allows to do pub/sub operations.
+            A `ShardedPubSub` with sharded Pub/Sub.
         broadcast (callable):
             The function to use when broadcasting a message to clients.
         channel_groups (dict):
             Maps a channel group to the connections that have subscribed to it.
+        use_pattern (bool):
+            Whether to subscribe to all the channel groups with a single pattern.
+        sharded (bool):
+            Whether to subscribe to the channel groups as sharded channels.
+        teardown_delay (float):
+            Duration, in seconds, to wait before discarding a channel group
+            when its last subscriber leaves.
+            A connection subscribing again in the meantime keeps the channel group.
+        stats (dict):
+            Number of times the bus lost its connection to Redis (`disconnections`),
+            reconnected to it (`reconnections`) and failed to (`reconnect_failures`).
+        retry_interval (float):
+            Duration, in seconds, to wait before the first reconnection attempt.
+            It doubles after each failed attempt.
+        max_retry_interval (float):
+            Maximum duration, in seconds, to wait between reconnection attempts.
 
     """
 
-    def __init__(self, url, broadcast):
-        redis = aioredis.from_url(get_redis_url(), decode_responses=True)
-        self.pubsub = redis.pubsub(ignore_subscribe_messages=True)
+    pattern = make_channel_group_name("*")
+    retry_interval = 1
+    max_retry_interval = 30
+
+    def __init__(
+        self, url, broadcast, use_pattern=None, teardown_delay=None, sharded=None
+    ):
+        self.redis = aioredis.from_url(get_redis_url(), decode_responses=True)
         self.broadcast = broadcast
         self.channel_groups = defaultdict(set)
+        self.use_pattern = (
+            get_redis_pattern_subscription() if use_pattern is None else use_pattern
+        )
+        self.sharded = get_redis_sharded_pubsub() if sharded is None else sharded
+        if self.use_pattern and self.sharded:
+            raise ImproperlyConfigured(
+                "Sharded Pub/Sub doesn't support pattern subscriptions."
+            )
+        self.pubsub = self.make_pubsub()
+        self.teardown_delay = (
+            get_redis_teardown_delay() if teardown_delay is None else teardown_delay
+        )
         # Tracks when the bus starts running i.e on the first connection.
         self._running = None
+        # Channel groups or pattern subscribed to in Redis.
+        self._subscribed = set()
+        # Maps channel groups without subscribers to their pending teardown.
+        self._teardowns = {}
+        self.stats = {"disconnections": 0, "reconnections": 0, "reconnect_failures": 0}
+
+    def make_pubsub(self):
+        """
+        Creates the PubSub instance used to subscribe to the channel groups.
+
+        Returns:
+            PubSub: A `ShardedPubSub` with sharded Pub/Sub, a Redis PubSub else.
+        """
+
+        if self.sharded:
+            return ShardedPubSub(get_redis_url())
+        return self.redis.pubsub(ignore_subscribe_messages=True)
 
     async def run(self):
-        """Retrieves messages from Redis and dispatches them as long as the server is running."""
+        """
+        Retrieves messages from Redis and dispatches them as long as the server is running.
+
+        Reconnects to Redis when the connection is lost.
+        """
 
         # We will have an error if we try to run the bus if we haven't
         # subscribed to any channel yet.
         # Therefore, wait for the bus to start running before calling pubsub.run.
         self._running = asyncio.Event()
-        await self._running.wait()
-        await self.pubsub.run()
+        connected = True
+        attempts = 0
+        while True:
+            await self._running.wait()
+            try:
+                if not connected:
+                    await self.reconnect()
+                    connected = True
+                    attempts = 0
+                    self.stats["reconnections"] += 1
+                    logger.info("Redis bus reconnected.")
+                    await self.resync()
+                    continue
+
+                await self.pubsub.run()
+
+            except (RedisConnectionError, RedisTimeoutError, OSError):
+                if connected:
+                    connected = False
+                    self.stats["disconnections"] += 1
+                    logger.exception("Redis bus lost its connection.")
+                else:
+                    self.stats["reconnect_failures"] += 1
+                    logger.warning("Redis bus failed to reconnect.")
+
+                attempts += 1
+                await asyncio.sleep(self.get_retry_delay(attempts))
+
+    def get_retry_delay(self, attempts):
+        """
+        Computes the duration to wait before a reconnection attempt.
+
+        Args:
+            attempts (int):
+                Number of reconnection attempts, including this one.
+
+        Returns:
+            float: The duration to wait, in seconds.
+        """
+
+        return min(self.retry_interval * 2 ** (attempts - 1), self.max_retry_interval)
+
+    async def reconnect(self):
+        """Replaces the PubSub instance and subscribes again to the channel groups."""
+
+        await self.pubsub.reset()
+        self.pubsub = self.make_pubsub()
+
+        # Connections subscribing from now on use the new PubSub instance.
+        subscribed = set(self._subscribed)
+        if not subscribed:
+            # Nothing to listen to: wait for the next subscription.
+            self._running.clear()
+            return
+
+        if self.pattern in subscribed:
+            await self.pubsub.psubscribe(**{self.pattern: self.handle_message})
+            subscribed.remove(self.pattern)
+        if subscribed:
+            await self.pubsub.subscribe(
+                **{channel_group: self.handle_message for channel_group in subscribed}
+            )
+
+    async def resync(self):
+        """Informs the connections they may have missed messages while the bus was disconnected."""
+
+        message = json.dumps({"resync": True})
+        for connections in list(self.channel_groups.values()):
+            if connections:
+                await self.broadcast(message, connections)
+
+    async def _execute(self, command, *args, **kwargs):
+        # Subscriptions made while the bus is disconnected are restored
+        # when it reconnects, so connection errors are only logged.
+        try:
+            await command(*args, **kwargs)
+        except (RedisConnectionError, RedisTimeoutError, OSError):
+            logger.warning("Redis bus is disconnected, subscriptions will be restored.")
 
     def _set_running(self):
         if self._running is not None and not self._running.is_set():
@@ -78,8 +238,11 @@ class RedisBus:
             message (str): The message published on Redis.
         """
 
-        connections = self.get_channel_group_subscribers(message["channel"])
-        asyncio.create_task(self.broadcast(message["data"], connections))
+        # Use `get` so messages of channel groups without subscribers,
+        # received with pattern subscription, don't create empty channel groups.
+        connections = self.channel_groups.get(message["channel"])
+        if connections:
+            asyncio.create_task(self.broadcast(message["data"], connections))
 
     async def subscribe(self, channel_group_name, ws_connection):
         """
@@ -93,11 +256,24 @@ class RedisBus:
                 It must have a method to send messages.
         """
 
+        teardown = self._teardowns.pop(channel_group_name, None)
+        if teardown is not None:
+            teardown.cancel()
+
         # Subscribe to this channel group in Redis if not done yet.
-        if not self.get_channel_group_subscribers(channel_group_name):
-            # Passing parameters as `channel=handler` to the pubsub.subscribe method
-            # has the effect to call `handler` whenever a message is published on `channel`.
-            await self.pubsub.subscribe(**{channel_group_name: self.handle_message})
+        # Passing parameters as `channel=handler` to the pubsub.subscribe method
+        # has the effect to call `handler` whenever a message is published on `channel`.
+        if self.use_pattern:
+            if self.pattern not in self._subscribed:
+                self._subscribed.add(self.pattern)
+                await self._execute(
+                    self.pubsub.psubscribe, **{self.pattern: self.handle_message}
+                )
+        elif channel_group_name not in self._subscribed:
+            self._subscribed.add(channel_group_name)
+            await self._execute(
+                self.pubsub.subscribe, **{channel_group_name: self.handle_message}
+            )
 
         self.channel_groups[channel_group_name].add(ws_connection)
         self._set_running()
@@ -116,8 +292,74 @@ class RedisBus:
 
         self.channel_groups[channel_group_name].remove(ws_connection)
 
-        # Unsubscribe from this channel_group in Redis if no more
-        # connections are subscribed to it.
+        # Discard this channel group if no more connections are subscribed to it.
         if not self.get_channel_group_subscribers(channel_group_name):
-            await self.pubsub.unsubscribe(channel_group_name)
-            del self.channel_groups[channel_group_name]
+            if self.teardown_delay:
+                loop = asyncio.get_event_loop()
+                self._teardowns[channel_group_name] = loop.call_later(
+                    self.teardown_delay, self._start_teardown, channel_group_name
+                )
+            else:
+                await self.teardown(channel_group_name)
+
+    def _start_teardown(self, channel_group_name):
+        asyncio.ensure_future(self.teardown(channel_group_name))
+
+    async def teardown(self, channel_group_name):
+        """
+        Discards a channel group without subscribers and unsubscribes from it in Redis.
+
+        Args:
+            channel_group_name (str):
+                Channel group to discard.
+        """
+
+        self._teardowns.pop(channel_group_name, None)
+        if self.get_channel_group_subscribers(channel_group_name):
+            # A connection has subscribed again in the meantime.
+            return
+
+        self.channel_groups.pop(channel_group_name, None)
+        if not self.use_pattern:
+            self._subscribed.discard(channel_group_name)
+            await self._execute(self.pubsub.unsubscribe, channel_group_name)
+
+    async def get_missed_messages(self, channel_group_name, since):
+        """
+        Retrieves the messages published on a channel group after a given message.
+
+        Messages are kept in the stream of the channel group when the
+        `WAGTAIL_LIVE_REDIS_STREAM_MAXLEN` setting is defined.
+
+        Args:
+            channel_group_name (str):
+                Channel group the messages have been published on.
+            since (str):
+                Stream ID of the last message received.
+
+        Returns:
+            list: The messages published after `since`, `None` if the stream
+                doesn't go back to `since`.
+        """
+
+        if self.sharded:
+            # The stream is on the node serving the channel group.
+            redis = await self.pubsub.get_node_client(channel_group_name)
+        else:
+            redis = self.redis
+
+        try:
+            entries = await redis.xrange(
+                make_stream_name(channel_group_name), min=since, max="+"
+            )
+        except ResponseError:
+            # `since` isn't a valid stream ID.
+            return None
+
+        if not entries or entries[0][0] != since:
+            return None
+
+        return [
+            add_stream_id(fields["message"], stream_id)
+            for stream_id, fields in entries[1:]
+        ]
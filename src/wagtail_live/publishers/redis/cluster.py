@@ -0,0 +1,346 @@
+"""Sharded Pub/Sub, spreading the channel groups over the nodes of a Redis Cluster."""
+
+import asyncio
+import bisect
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+import aioredis
+from aioredis.client import PubSub
+from aioredis.exceptions import ConnectionError as RedisConnectionError
+from aioredis.exceptions import ResponseError
+from aioredis.utils import str_if_bytes
+
+HASH_SLOTS = 16384
+
+
+def crc16(data):
+    """CRC16 (XMODEM) checksum used by Redis Cluster to hash keys."""
+
+    crc = 0
+    for byte in data:
+        crc ^= byte << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x1021 if crc & 0x8000 else crc << 1) & 0xFFFF
+    return crc
+
+
+def key_slot(key):
+    """
+    Computes the hash slot of a key or a sharded channel in a Redis Cluster.
+
+    As in Redis, only the part of the key between the first `{` and the next `}`
+    is hashed when it isn't empty.
+
+    Args:
+        key (str):
+            Key or channel to compute the hash slot of.
+
+    Returns:
+        int: The hash slot of the key.
+    """
+
+    key = key.encode() if isinstance(key, str) else key
+    start = key.find(b"{") + 1
+    if start:
+        end = key.find(b"}", start)
+        if end > start:
+            key = key[start:end]
+    return crc16(key) % HASH_SLOTS
+
+
+def is_moved_error(error):
+    """Whether a Redis error means that the hash slot of a key is served by another node."""
+
+    return str(error).startswith("MOVED")
+
+
+class ClusterSlots:
+    """
+    Maps the hash slots of a Redis Cluster to the URLs of the nodes serving them.
+
+    A Redis server with cluster support disabled serves all the hash slots.
+
+    Attributes:
+        url (str):
+            URL of the node the slots are retrieved from.
+        ranges (list):
+            Sorted `(first slot, last slot, node URL)` tuples,
+            `None` until the slots are retrieved.
+    """
+
+    def __init__(self, url):
+        self.url = url
+        self.ranges = None
+
+    async def refresh(self, redis):
+        """
+        Retrieves the nodes serving the hash slots.
+
+        Args:
+            redis (Redis):
+                Client connected to `url`.
+        """
+
+        try:
+            response = await redis.execute_command("CLUSTER", "SLOTS")
+        except ResponseError:
+            # Cluster support is disabled.
+            self.ranges = [(0, HASH_SLOTS - 1, self.url)]
+            return
+
+        self.ranges = sorted(
+            (int(first), int(last), self.make_node_url(node[0], node[1]))
+            for first, last, node, *replicas in response
+        )
+
+    def make_node_url(self, host, port):
+        """
+        Builds the URL of a node, using the credentials of `url`.
+
+        Args:
+            host (str):
+                Host of the node, the host of `url` if empty.
+            port (int):
+                Port of the node.
+
+        Returns:
+            str: The URL of the node.
+        """
+
+        url = urlsplit(self.url)
+        netloc = f"{str_if_bytes(host) or url.hostname}:{port}"
+        if "@" in url.netloc:
+            netloc = url.netloc.rsplit("@", 1)[0] + "@" + netloc
+        return url._replace(netloc=netloc).geturl()
+
+    def get_node_url(self, key):
+        """
+        Retrieves the URL of the node serving the hash slot of a key or sharded channel.
+
+        Args:
+            key (str):
+                Key or channel.
+
+        Returns:
+            str: The URL of the node.
+
+        Raises:
+            LookupError: if no node serves the hash slot of the key.
+        """
+
+        slot = key_slot(key)
+        index = bisect.bisect_right(self.ranges, (slot, HASH_SLOTS)) - 1
+        if index < 0 or self.ranges[index][1] < slot:
+            raise LookupError(f"No Redis node serves the hash slot {slot}.")
+        return self.ranges[index][2]
+
+
+class ShardPubSub(PubSub):
+    """PubSub subscribing to the sharded channels of a node with SSUBSCRIBE."""
+
+    PUBLISH_MESSAGE_TYPES = ("message", "pmessage", "smessage")
+    UNSUBSCRIBE_MESSAGE_TYPES = ("unsubscribe", "punsubscribe", "sunsubscribe")
+
+    async def on_connect(self, connection):
+        """Subscribes again to the sharded channels previously subscribed to."""
+
+        self.pending_unsubscribe_channels.clear()
+        # A single SSUBSCRIBE command only accepts channels of the same hash slot.
+        slots = defaultdict(dict)
+        for channel, handler in self.channels.items():
+            channel = self.encoder.decode(channel, force=True)
+            slots[key_slot(channel)][channel] = handler
+        for channels in slots.values():
+            await self.ssubscribe(**channels)
+
+    async def ssubscribe(self, **channels):
+        """
+        Subscribes to sharded channels of the same hash slot.
+
+        Args:
+            channels (callable):
+                Maps the channels to the handlers called with their messages.
+        """
+
+        await self.execute_command("SSUBSCRIBE", *channels.keys())
+        channels = self._normalize_keys(channels)
+        self.channels.update(channels)
+        self.pending_unsubscribe_channels.difference_update(channels)
+
+    async def sunsubscribe(self, *channels):
+        """
+        Unsubscribes from sharded channels of the same hash slot.
+
+        Args:
+            channels (str):
+                Channels to unsubscribe from.
+        """
+
+        self.pending_unsubscribe_channels.update(
+            self._normalize_keys(dict.fromkeys(channels))
+        )
+        await self.execute_command("SUNSUBSCRIBE", *channels)
+
+
+class ShardedPubSub:
+    """
+    PubSub subscribing to each channel on the node serving its hash slot.
+
+    It provides the part of the aioredis `PubSub` interface used by `RedisBus`,
+    with channels subscribed to as sharded channels.
+    A Redis server with cluster support disabled is handled as a single node cluster.
+
+    Attributes:
+        slots (ClusterSlots):
+            Nodes serving the hash slots.
+        shards (dict):
+            Maps the URL of a node to the `ShardPubSub` subscribed to its channels.
+    """
+
+    def __init__(self, url):
+        self.slots = ClusterSlots(url)
+        self.shards = {}
+        self._clients = {}
+        self._failure = None
+        self._tasks = {}
+
+    @property
+    def channels(self):
+        """Maps the channels subscribed to, on all the nodes, to their handlers."""
+
+        return {
+            channel: handler
+            for shard in self.shards.values()
+            for channel, handler in shard.channels.items()
+        }
+
+    def get_client(self, url):
+        """
+        Retrieves the client connected to a node.
+
+        Args:
+            url (str):
+                URL of the node.
+
+        Returns:
+            Redis: Client connected to the node.
+        """
+
+        client = self._clients.get(url)
+        if client is None:
+            client = self._clients[url] = aioredis.from_url(url, decode_responses=True)
+        return client
+
+    async def get_node_client(self, channel):
+        """
+        Retrieves the client connected to the node serving the hash slot of a channel.
+
+        Args:
+            channel (str):
+                Channel or key.
+
+        Returns:
+            Redis: Client connected to the node.
+        """
+
+        if self.slots.ranges is None:
+            await self.slots.refresh(self.get_client(self.slots.url))
+        return self.get_client(self.slots.get_node_url(channel))
+
+    async def get_shard(self, channel):
+        """
+        Retrieves the `ShardPubSub` of the node serving the hash slot of a channel.
+
+        Args:
+            channel (str):
+                Channel.
+
+        Returns:
+            ShardPubSub: PubSub connected to the node.
+        """
+
+        client = await self.get_node_client(channel)
+        url = self.slots.get_node_url(channel)
+        shard = self.shards.get(url)
+        if shard is None:
+            shard = self.shards[url] = ShardPubSub(
+                client.connection_pool, ignore_subscribe_messages=True
+            )
+        return shard
+
+    async def subscribe(self, **channels):
+        """
+        Subscribes to channels, on the nodes serving them, with SSUBSCRIBE.
+
+        Args:
+            channels (callable):
+                Maps the channels to the handlers called with their messages.
+        """
+
+        for channel, handler in channels.items():
+            shard = await self.get_shard(channel)
+            await shard.ssubscribe(**{channel: handler})
+            self._start(shard)
+
+    async def unsubscribe(self, *channels):
+        """
+        Unsubscribes from channels, on the nodes serving them, with SUNSUBSCRIBE.
+
+        Args:
+            channels (str):
+                Channels to unsubscribe from.
+        """
+
+        for channel in channels:
+            shard = await self.get_shard(channel)
+            await shard.sunsubscribe(channel)
+
+    async def run(self):
+        """
+        Processes the messages received from all the nodes using the channel handlers.
+
+        Raises:
+            ConnectionError: if the connection to a node is lost
+                or the hash slots of the channels have moved.
+        """
+
+        self._failure = asyncio.get_event_loop().create_future()
+        for shard in self.shards.values():
+            if shard.connection is not None:
+                self._start(shard)
+
+        try:
+            await self._failure
+        finally:
+            for task in self._tasks.values():
+                task.cancel()
+            self._tasks = {}
+            self._failure = None
+
+    def _start(self, shard):
+        if self._failure is not None and shard not in self._tasks:
+            self._tasks[shard] = asyncio.ensure_future(
+                self._run_shard(shard, self._failure)
+            )
+
+    async def _run_shard(self, shard, failure):
+        try:
+            await shard.run()
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            if isinstance(error, ResponseError) and is_moved_error(error):
+                error = RedisConnectionError(f"Hash slots have moved: {error}")
+            if not failure.done():
+                failure.set_exception(error)
+
+    async def reset(self):
+        """Unsubscribes from all the channels and closes the connections to the nodes."""
+
+        for shard in self.shards.values():
+            await shard.reset()
+        for client in self._clients.values():
+            await client.connection_pool.disconnect()
+        self.shards = {}
+        self._clients = {}
@@ -0,0 +1,87 @@
+import asyncio
+import json
+import logging
+
+import aioredis
+from aioredis.exceptions import ConnectionError as RedisConnectionError
+
+from ..notifiers import BaseUpdateNotifier
+from ..utils import get_redis_url
+from .publisher import publish_message
+
+logger = logging.getLogger(__name__)
+
+
+class RedisNotifier(BaseUpdateNotifier):
+    """
+    Notifier based on Redis PubSub.
+
+    Updates are published on a Redis channel every process listens to.
+    Suitable for deployments running several processes or hosts.
+
+    Attributes:
+        channel_name (str):
+            Redis channel updates are published on.
+        start_timeout (float):
+            Maximum duration, in seconds, requests wait for the notifier to be listening.
+        retry_interval (float):
+            Duration, in seconds, to wait before listening again when the connection is lost.
+    """
+
+    channel_name = "wagtail_live:updates"
+    start_timeout = 5
+    retry_interval = 1
+
+    def __init__(self):
+        super().__init__()
+        self._listener = None
+        self._listening = None
+        self._loop = None
+
+    def publish(self, channel_id, seq=None):
+        """See base class."""
+
+        message = {"channel_id": channel_id, "seq": seq}
+        publish_message(self.channel_name, message)
+
+    async def start(self):
+        """See base class."""
+
+        loop = asyncio.get_event_loop()
+        if self._listener is None or self._listener.done() or self._loop is not loop:
+            self._loop = loop
+            self._listening = asyncio.Event()
+            self._listener = loop.create_task(self.listen())
+
+        try:
+            await asyncio.wait_for(self._listening.wait(), self.start_timeout)
+        except asyncio.TimeoutError:
+            logger.error("Redis notifier couldn't start listening to updates.")
+
+    async def listen(self):
+        """Listens to the updates published on Redis as long as the server is running."""
+
+        redis = aioredis.from_url(get_redis_url(), decode_responses=True)
+        try:
+            while True:
+                pubsub = redis.pubsub(ignore_subscribe_messages=True)
+                try:
+                    await pubsub.subscribe(self.channel_name)
+                    self._listening.set()
+
+                    async for message in pubsub.listen():
+                        if message is not None and message["type"] == "message":
+                            self.handle_message(json.loads(message["data"]))
+
+                except (RedisConnectionError, OSError):
+                    self._listening.clear()
+                    logger.exception("Redis notifier lost its connection.")
+
+                finally:
+                    # Release the connection of this PubSub before listening again.
+                    await pubsub.reset()
+
+                await asyncio.sleep(self.retry_interval)
+
+        finally:
+            await redis.connection_pool.disconnect()
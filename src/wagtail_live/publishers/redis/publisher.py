@@ -1,17 +1,116 @@
+import asyncio
 import json
+import threading
+import weakref
+from functools import lru_cache
 
 import aioredis
-from asgiref.sync import async_to_sync
+from aioredis.exceptions import ResponseError
 
-from ..utils import get_redis_url
+from ..utils import get_redis_sharded_pubsub, get_redis_stream_maxlen, get_redis_url
 from ..websocket import BaseWebsocketPublisher
+from .cluster import ClusterSlots, is_moved_error
+
+# Redis clients are bound to the event loop they are used in.
+_redis_clients = weakref.WeakKeyDictionary()
+
+
+# Adds a message to the stream of a channel group and publishes it along with
+# the ID of the stream entry, atomically so messages are published in the stream order.
+# ARGV[3] is the publishing command: PUBLISH or SPUBLISH for sharded channels.
+STREAM_PUBLISH_SCRIPT = """
+local stream_id = redis.call(
+    "XADD", KEYS[1], "MAXLEN", "~", ARGV[1], "*", "message", ARGV[2]
+)
+local message = string.sub(ARGV[2], 1, -2) .. ', "streamId": "' .. stream_id .. '"}'
+redis.call(ARGV[3], KEYS[2], message)
+return stream_id
+"""
 
 
 def make_channel_group_name(channel_id):
     return f"group_{channel_id}"
 
 
-async def redis_publish(channel_group_name, message):
+def make_stream_name(channel_group_name):
+    # The hash tag keeps the stream in the hash slot of its channel group.
+    return f"stream_{{{channel_group_name}}}"
+
+
+def add_stream_id(message, stream_id):
+    """
+    Adds the ID of its stream entry to a message.
+
+    Args:
+        message (str):
+            Message stored in a stream, encoded as a JSON object.
+        stream_id (str):
+            ID of the stream entry of the message.
+
+    Returns:
+        str: The message including its `streamId`, as published by `redis_stream_publish`.
+    """
+
+    return f'{message[:-1]}, "streamId": "{stream_id}"}}'
+
+
+def get_redis_client(url=None):
+    """
+    Retrieves the Redis client of the running event loop.
+
+    The clients and their connection pools are created once per event loop
+    and reused by all the messages published from that loop.
+
+    Args:
+        url (str):
+            URL of the Redis node to connect to, `WAGTAIL_LIVE_REDIS_URL` by default.
+
+    Returns:
+        Redis: Redis client connected to `url`.
+    """
+
+    url = url or get_redis_url()
+    clients = _redis_clients.setdefault(asyncio.get_event_loop(), {})
+    client = clients.get(url)
+    if client is None:
+        client = clients[url] = aioredis.from_url(url)
+    return client
+
+
+@lru_cache(maxsize=1)
+def get_cluster_slots():
+    return ClusterSlots(get_redis_url())
+
+
+async def run_on_node(channel_group_name, command):
+    """
+    Runs a command on the Redis node serving the hash slot of a channel.
+
+    The hash slots are retrieved again when the slot of the channel has moved.
+
+    Args:
+        channel_group_name (str):
+            Channel the command is about.
+        command (callable):
+            Called with the client of the node, returns the coroutine to run.
+
+    Returns:
+        *: Result of the command.
+    """
+
+    slots = get_cluster_slots()
+    for attempt in range(2):
+        if slots.ranges is None or attempt:
+            await slots.refresh(get_redis_client())
+        client = get_redis_client(slots.get_node_url(channel_group_name))
+        try:
+            return await command(client)
+        except ResponseError as error:
+            if attempt or not is_moved_error(error):
+                raise
+
+
+async def redis_publish(channel_group_name, message, sharded=False):
     """
     Publishes a message to the given channel in Redis.
 
@@ -20,16 +119,161 @@ async def redis_publish(channel_group_name, message):
             Channel to publish the message to.
         message (*):
             Message to publish.
+        sharded (bool):
+            Whether to publish to a sharded channel, with SPUBLISH,
+            on the node serving its hash slot.
     """
 
-    redis = aioredis.from_url(get_redis_url())
-    await redis.publish(channel_group_name, json.dumps(message))
+    data = json.dumps(message)
+    if not sharded:
+        await get_redis_client().publish(channel_group_name, data)
+        return
+
+    await run_on_node(
+        channel_group_name,
+        lambda client: client.execute_command("SPUBLISH", channel_group_name, data),
+    )
+
+
+async def redis_stream_publish(channel_group_name, message, maxlen, sharded=False):
+    """
+    Adds a message to the stream of the given channel in Redis and publishes it.
+
+    The published message includes the ID of its stream entry, as `streamId`.
+
+    Args:
+        channel_group_name (str):
+            Channel to publish the message to.
+        message (dict):
+            Message to publish.
+        maxlen (int):
+            Approximate number of messages kept in the stream.
+        sharded (bool):
+            Whether to publish to a sharded channel, with SPUBLISH,
+            on the node serving its hash slot.
+
+    Returns:
+        str: ID of the stream entry of the message.
+    """
+
+    args = (
+        STREAM_PUBLISH_SCRIPT,
+        2,
+        make_stream_name(channel_group_name),
+        channel_group_name,
+        maxlen,
+        json.dumps(message),
+        "SPUBLISH" if sharded else "PUBLISH",
+    )
+    if sharded:
+        stream_id = await run_on_node(
+            channel_group_name, lambda client: client.eval(*args)
+        )
+    else:
+        stream_id = await get_redis_client().eval(*args)
+    return stream_id.decode() if isinstance(stream_id, bytes) else stream_id
+
+
+class RedisPublisherLoop:
+    """
+    Event loop running in a dedicated thread to publish messages from synchronous code.
+
+    The loop, and therefore its Redis client, lives as long as the process.
+
+    Attributes:
+        timeout (float):
+            Maximum duration, in seconds, to wait for a message to be published.
+    """
+
+    timeout = 5
+
+    def __init__(self):
+        self.loop = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Starts the event loop thread if not done yet."""
+
+        with self._lock:
+            if self.loop is None:
+                self.loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=self.loop.run_forever,
+                    name="wagtail-live-redis-publisher",
+                    daemon=True,
+                )
+                thread.start()
+
+    def run(self, coroutine):
+        """
+        Runs a coroutine in the event loop thread and waits for its result.
+
+        Args:
+            coroutine (coroutine): Coroutine to run.
+
+        Returns:
+            *: Result of the coroutine.
+        """
+
+        self.start()
+        future = asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+        return future.result(self.timeout)
+
+    def publish(self, channel_group_name, message, sharded=False):
+        """
+        Publishes a message to the given channel in Redis and waits for the result.
+
+        See `redis_publish`.
+        """
+
+        self.run(redis_publish(channel_group_name, message, sharded=sharded))
+
+
+publisher_loop = RedisPublisherLoop()
+
+
+def publish_message(channel_group_name, message, sharded=False):
+    """
+    Publishes a message to the given channel in Redis from synchronous code.
+
+    Args:
+        channel_group_name (str):
+            Channel to publish the message to.
+        message (*):
+            Message to publish.
+        sharded (bool):
+            Whether to publish to a sharded channel.
+    """
+
+    publisher_loop.publish(channel_group_name, message, sharded=sharded)
+
+
+def publish_stream_message(channel_group_name, message, maxlen, sharded=False):
+    """
+    Adds a message to the stream of the given channel in Redis and publishes it
+    from synchronous code.
+
+    See `redis_stream_publish`.
+    """
+
+    return publisher_loop.run(
+        redis_stream_publish(channel_group_name, message, maxlen, sharded=sharded)
+    )
 
 
 class RedisPubSubPublisher(BaseWebsocketPublisher):
-    """Publisher using Redis PubSub functionality."""
+    """
+    Publisher using Redis PubSub functionality.
+
+    When the `WAGTAIL_LIVE_REDIS_STREAM_MAXLEN` setting is defined, messages are also
+    added to a stream per channel group, so websocket servers can replay
+    the messages missed by reconnecting clients.
+
+    When the `WAGTAIL_LIVE_REDIS_SHARDED_PUBSUB` setting is `True`, messages are
+    published to sharded channels, spread over the nodes of a Redis Cluster.
+    """
 
-    def publish(self, channel_id, renders, removals):
+    def publish(self, channel_id, renders, removals, seq=None, closed=False):
         """
         Publishes in Redis the renders and removals to the channel group
         corresponding to channel_id.
@@ -38,6 +282,18 @@ class RedisPubSubPublisher(BaseWebsocketPublisher):
         """
 
         channel_group_name = make_channel_group_name(channel_id)
-        message = {"renders": renders, "removals": removals}
+        message = {
+            "renders": renders,
+            "removals": removals,
+            "seq": seq,
+            "closed": closed,
+        }
 
-        async_to_sync(redis_publish)(channel_group_name, message)
+        sharded = get_redis_sharded_pubsub()
+        stream_maxlen = get_redis_stream_maxlen()
+        if stream_maxlen:
+            publish_stream_message(
+                channel_group_name, message, stream_maxlen, sharded=sharded
+            )
+        else:
+            publish_message(channel_group_name, message, sharded=sharded)
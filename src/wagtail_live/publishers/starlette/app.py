@@ -1,18 +1,29 @@
 import asyncio
-import json
 
 from starlette.applications import Starlette
 from starlette.endpoints import WebSocketEndpoint
 from starlette.middleware.cors import CORSMiddleware
 
+from ..fanout import FanOut, PreparedMessage
 from ..redis import RedisBus, make_channel_group_name
 from ..utils import get_redis_url
 
 
+async def send(websocket, message):
+    # Messages are published as JSON on the bus: send them as they are.
+    await websocket.send_text(message.text)
+
+
+async def close(websocket, code):
+    await websocket.close(code=code)
+
+
+FAN_OUT = FanOut(send=send, close=close)
+
+
 # Define the broadcast method to be used by the bus.
 async def broadcast(message, connections):
-    message = json.loads(message)
-    await asyncio.wait([ws.send_json(message) for ws in connections])
+    await FAN_OUT.broadcast(PreparedMessage(message), connections)
 
 
 BUS = RedisBus(url=get_redis_url(), broadcast=broadcast)
@@ -41,9 +52,11 @@ class StarlettePublisherApp(WebSocketEndpoint):
 
         channel_id = websocket.path_params["channel_id"]
         self.channel_group_name = make_channel_group_name(channel_id)
-        await BUS.subscribe(self.channel_group_name, websocket)
+        since = websocket.query_params.get("since")
+        await FAN_OUT.subscribe(BUS, self.channel_group_name, websocket, since=since)
 
     async def on_disconnect(self, websocket, close_code):
         """Removes this connection from its channel group."""
 
+        FAN_OUT.discard(websocket)
         await BUS.unsubscribe(self.channel_group_name, websocket)
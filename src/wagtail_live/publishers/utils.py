@@ -16,3 +16,33 @@ def get_live_server_host():
 @lru_cache(maxsize=1)
 def get_live_server_port():
     return getattr(settings, "WAGTAIL_LIVE_SERVER_PORT", 8765)
+
+
+@lru_cache(maxsize=1)
+def get_send_queue_size():
+    return getattr(settings, "WAGTAIL_LIVE_SEND_QUEUE_SIZE", 100)
+
+
+@lru_cache(maxsize=1)
+def get_slow_consumer_policy():
+    return getattr(settings, "WAGTAIL_LIVE_SLOW_CONSUMER_POLICY", "disconnect")
+
+
+@lru_cache(maxsize=1)
+def get_redis_pattern_subscription():
+    return getattr(settings, "WAGTAIL_LIVE_REDIS_PATTERN_SUBSCRIPTION", False)
+
+
+@lru_cache(maxsize=1)
+def get_redis_teardown_delay():
+    return getattr(settings, "WAGTAIL_LIVE_REDIS_TEARDOWN_DELAY", 0)
+
+
+@lru_cache(maxsize=1)
+def get_redis_stream_maxlen():
+    return getattr(settings, "WAGTAIL_LIVE_REDIS_STREAM_MAXLEN", None)
+
+
+@lru_cache(maxsize=1)
+def get_redis_sharded_pubsub():
+    return getattr(settings, "WAGTAIL_LIVE_REDIS_SHARDED_PUBSUB", False)
@@ -1,7 +1,86 @@
+import logging
+import threading
+
+from django.db import connections
+
+from wagtail_live.cache import render_live_post
+from wagtail_live.publishers.worker import get_publish_worker
+from wagtail_live.utils import get_publish_batch_window, get_update_timestamp
+
+logger = logging.getLogger(__name__)
+
+
+class UpdateBatch:
+    """
+    Updates of a live page merged during the batch window of a websocket publisher.
+
+    Attributes:
+        renders (dict):
+            Maps the IDs of the live posts added or edited to the latest version of the posts.
+        removals (list):
+            IDs of the live posts removed.
+        seq (int):
+            Sequence number of the latest update merged.
+        closed (bool):
+            Whether the page has been closed.
+    """
+
+    def __init__(self):
+        self.renders = {}
+        self.removals = []
+        self.seq = None
+        self.closed = False
+
+    def add(self, renders, removals, seq=None, closed=False):
+        """
+        Merges an update of the page into this batch.
+
+        Args:
+            renders (list):
+                Live posts added or edited by the update.
+            removals (list):
+                IDs of the live posts removed by the update.
+            seq (int):
+                Sequence number of the update.
+            closed (bool):
+                Whether the page has been closed by the update.
+        """
+
+        for post in renders:
+            # Move the post to the end so the posts are still published
+            # in the order of their latest update.
+            self.renders.pop(post.id, None)
+            self.renders[post.id] = post
+            if post.id in self.removals:
+                self.removals.remove(post.id)
+
+        for post_id in removals:
+            self.renders.pop(post_id, None)
+            if post_id not in self.removals:
+                self.removals.append(post_id)
+
+        if seq is not None and (self.seq is None or seq > self.seq):
+            self.seq = seq
+        self.closed = self.closed or closed
+
+
 class BaseWebsocketPublisher:
-    """Base class for publishers using the websocket technique."""
+    """
+    Base class for publishers using the websocket technique.
+
+    When the `WAGTAIL_LIVE_PUBLISH_BATCH_WINDOW` setting is defined, the updates of a page
+    received during the batch window are merged and published in a single message.
+    When the `WAGTAIL_LIVE_PUBLISH_QUEUE_SIZE` setting is defined, updates are published
+    by a background worker so the requests updating live pages don't wait for them.
+    """
 
-    def __call__(self, sender, channel_id, renders, removals, **kwargs):
+    def __init__(self):
+        self._batches = {}
+        self._lock = threading.Lock()
+
+    def __call__(
+        self, sender, channel_id, renders, removals, seq=None, closed=False, **kwargs
+    ):
         """
         Listens to the `live_page_update` signal.
 
@@ -10,22 +89,124 @@ class BaseWebsocketPublisher:
                 Sender of the signal.
             channel_id (str):
                 ID of the channel corresponding to the updated page.
-            renders (dict):
-                Dict containing the new posts and the edited posts of the updated page.
+            renders (list):
+                New posts and edited posts of the updated page.
+            removals (list):
+                List containing the id of the deleted posts for the updated page.
+            seq (int):
+                Sequence number of the update.
+            closed (bool):
+                Whether the updated page has been closed.
+        """
+
+        batch_window = get_publish_batch_window()
+        if not batch_window:
+            return self.schedule(
+                channel_id=channel_id,
+                renders=renders,
+                removals=removals,
+                seq=seq,
+                closed=closed,
+            )
+
+        with self._lock:
+            batch = self._batches.get(channel_id)
+            if batch is None:
+                batch = self._batches[channel_id] = UpdateBatch()
+                timer = threading.Timer(
+                    batch_window / 1000, self._flush_from_timer, args=[channel_id]
+                )
+                timer.daemon = True
+                timer.start()
+            batch.add(renders=renders, removals=removals, seq=seq, closed=closed)
+
+    def _flush_from_timer(self, channel_id):
+        try:
+            self.flush(channel_id)
+        finally:
+            # Rendering the live posts may have opened database connections in this thread.
+            connections.close_all()
+
+    def flush(self, channel_id):
+        """
+        Publishes the updates of a page merged during the batch window.
+
+        Args:
+            channel_id (str):
+                ID of the channel corresponding to the updated page.
+        """
+
+        with self._lock:
+            batch = self._batches.pop(channel_id, None)
+
+        if batch is not None:
+            self.schedule(
+                channel_id=channel_id,
+                renders=list(batch.renders.values()),
+                removals=batch.removals,
+                seq=batch.seq,
+                closed=batch.closed,
+            )
+
+    def schedule(self, channel_id, renders, removals, seq=None, closed=False):
+        """
+        Dispatches an update, in the background worker if enabled.
+
+        See `dispatch` for the arguments.
+        """
+
+        update = {
+            "channel_id": channel_id,
+            "renders": renders,
+            "removals": removals,
+            "seq": seq,
+            "closed": closed,
+        }
+
+        publish_worker = get_publish_worker()
+        if publish_worker is None:
+            try:
+                return self.dispatch(**update)
+            except Exception:
+                # The update is saved already, failing the request wouldn't undo it.
+                logger.exception("Failed publishing a live page update.")
+                return
+        publish_worker.submit(self.dispatch, **update)
+
+    def dispatch(self, channel_id, renders, removals, seq=None, closed=False):
+        """
+        Renders the live posts of an update and publishes it.
+
+        Args:
+            channel_id (str):
+                ID of the channel corresponding to the updated page.
+            renders (list):
+                New posts and edited posts of the updated page.
             removals (list):
                 List containing the id of the deleted posts for the updated page.
+            seq (int):
+                Sequence number of the update.
+            closed (bool):
+                Whether the updated page has been closed.
         """
 
         renders = {
             post.id: {
                 "show": post.value["show"],
-                "content": post.render(context={"block_id": post.id}),
+                "created": get_update_timestamp(post.value["created"]),
+                "content": render_live_post(post),
             }
             for post in renders
         }
-        return self.publish(channel_id=channel_id, renders=renders, removals=removals)
+        return self.publish(
+            channel_id=channel_id,
+            renders=renders,
+            removals=removals,
+            seq=seq,
+            closed=closed,
+        )
 
-    def publish(self, channel_id, renders, removals):
+    def publish(self, channel_id, renders, removals, seq=None, closed=False):
         """
         Sends a new update:
 
@@ -40,6 +221,12 @@ class BaseWebsocketPublisher:
                 Dict containing the new posts and the edited posts of the updated page.
             removals (list):
                 List containing the id of the deleted posts for the updated page.
+            seq (int):
+                Sequence number of the update.
+                Client side uses it to know which updates it has received.
+            closed (bool):
+                Whether the updated page has been closed.
+                Client side stops listening to updates when it is.
         """
 
         raise NotImplementedError
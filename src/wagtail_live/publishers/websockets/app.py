@@ -1,18 +1,40 @@
-import asyncio
+from urllib.parse import parse_qs, urlsplit
 
 import websockets
+from websockets.frames import OP_TEXT
 
+from ..fanout import FanOut, PreparedMessage
 from ..redis import RedisBus, make_channel_group_name
 from ..utils import get_live_server_host, get_live_server_port, get_redis_url
 
 
+async def send(websocket, message):
+    if not hasattr(websocket, "write_frame"):
+        # `ensure_open` and `write_frame` aren't part of the public API of websockets
+        # and only exist in its legacy protocol implementation.
+        await websocket.send(message.text)
+        return
+
+    # Write the message encoded once for all the connections in a text frame.
+    await websocket.ensure_open()
+    await websocket.write_frame(True, OP_TEXT, message.data)
+
+
+async def close(websocket, code):
+    await websocket.close(code=code)
+
+
+FAN_OUT = FanOut(send=send, close=close)
+
+
 # Define the broadcast method to be used by the bus.
 async def broadcast(message, recipients):
-    await asyncio.wait([ws.send(message) for ws in recipients])
+    await FAN_OUT.broadcast(PreparedMessage(message), recipients)
 
 
 class WebsocketsPublisherApp:
     bus = RedisBus(url=get_redis_url(), broadcast=broadcast)
+    fan_out = FAN_OUT
 
     async def __call__(self):
         """Called once per session."""
@@ -28,17 +50,22 @@ class WebsocketsPublisherApp:
 
         Adds/removes the websocket connection to/from the channel group
         corresponding to the channel id found in the request's path.
+        The messages missed since the `since` stream ID found in the query string
+        are sent first.
         """
 
-        channel_id = path.split("/")[-2]
+        url = urlsplit(path)
+        channel_id = url.path.split("/")[-2]
         channel_name = make_channel_group_name(channel_id)
+        since = parse_qs(url.query).get("since", [None])[0]
 
-        await self.bus.subscribe(channel_name, websocket)
+        await self.fan_out.subscribe(self.bus, channel_name, websocket, since=since)
 
         try:
             await websocket.wait_closed()
 
         finally:
+            self.fan_out.discard(websocket)
             await self.bus.unsubscribe(channel_name, websocket)
 
 
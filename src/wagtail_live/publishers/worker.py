@@ -0,0 +1,151 @@
+"""Background worker publishing live page updates outside of the requests."""
+
+import logging
+import queue
+import threading
+import time
+from functools import lru_cache
+
+from django.db import close_old_connections
+
+from wagtail_live.utils import get_publish_max_retries, get_publish_queue_size
+
+logger = logging.getLogger(__name__)
+
+
+class PublishWorker:
+    """
+    Publishes live page updates from a bounded queue in a background thread.
+
+    Jobs are processed one at a time so the updates of a page are published in order.
+    A failing job is retried before moving on to the next one.
+    When the queue is full, jobs run in the thread submitting them,
+    which slows down the producers instead of losing updates.
+
+    Attributes:
+        maxsize (int):
+            Maximum number of jobs waiting in the queue.
+        max_retries (int):
+            Number of times a failing job is retried.
+        retry_delay (float):
+            Duration, in seconds, to wait before the first retry.
+            The delay doubles with each retry.
+        stats (dict):
+            Number of jobs `published`, `retried`, `failed` and
+            run in the submitting thread because the queue was full (`overflowed`).
+    """
+
+    retry_delay = 0.1
+
+    def __init__(self, maxsize, max_retries=3):
+        self.maxsize = maxsize
+        self.max_retries = max_retries
+        self.queue = queue.Queue(maxsize=maxsize)
+        self.stats = {"published": 0, "retried": 0, "failed": 0, "overflowed": 0}
+        self._thread = None
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self):
+        """Number of jobs waiting in the queue."""
+
+        return self.queue.qsize()
+
+    def start(self):
+        """Starts the worker thread if it isn't running."""
+
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self.run, name="wagtail-live-publisher", daemon=True
+                )
+                self._thread.start()
+
+    def submit(self, func, **kwargs):
+        """
+        Adds a job to the queue.
+
+        Args:
+            func (callable):
+                Function publishing an update.
+            kwargs:
+                Keyword arguments `func` is called with.
+
+        Returns:
+            bool: `True` if the job has been queued,
+                `False` if it has been run at once because the queue is full.
+        """
+
+        self.start()
+        try:
+            self.queue.put_nowait((func, kwargs))
+        except queue.Full:
+            self._count("overflowed")
+            logger.warning(
+                "The publish queue is full, publishing the update in the current thread."
+            )
+            self.process(func, **kwargs)
+            return False
+        return True
+
+    def run(self):
+        """Processes the jobs of the queue as long as the process is running."""
+
+        while True:
+            func, kwargs = self.queue.get()
+            try:
+                self.process(func, **kwargs)
+            finally:
+                self.queue.task_done()
+                # Rendering the live posts may have used a database connection.
+                close_old_connections()
+
+    def process(self, func, **kwargs):
+        """
+        Runs a job, retrying it if it fails.
+
+        Args:
+            func (callable):
+                Function publishing an update.
+            kwargs:
+                Keyword arguments `func` is called with.
+        """
+
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self._count("retried")
+                time.sleep(self.retry_delay * 2 ** (attempt - 1))
+            try:
+                func(**kwargs)
+            except Exception:
+                logger.exception("Failed publishing a live page update.")
+            else:
+                self._count("published")
+                return
+
+        self._count("failed")
+
+    def join(self):
+        """Blocks until all the jobs of the queue have been processed."""
+
+        self.queue.join()
+
+    def _count(self, stat):
+        with self._lock:
+            self.stats[stat] += 1
+
+
+@lru_cache(maxsize=1)
+def get_publish_worker():
+    """
+    Retrieves the worker publishing the updates of websocket publishers.
+
+    Returns:
+        PublishWorker: The worker if the `WAGTAIL_LIVE_PUBLISH_QUEUE_SIZE` setting
+            is defined else `None`, in which case updates are published in the requests.
+    """
+
+    maxsize = get_publish_queue_size()
+    if not maxsize:
+        return None
+    return PublishWorker(maxsize=maxsize, max_retries=get_publish_max_retries())
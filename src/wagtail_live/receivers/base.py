@@ -19,6 +19,7 @@ from wagtail_live.blocks import (
     construct_image_block,
     construct_live_post_block,
     construct_text_block,
+    get_live_post_fingerprint,
 )
 from wagtail_live.exceptions import RequestVerificationError
 from wagtail_live.utils import SUPPORTED_MIME_TYPES, get_live_page_model, is_embed
@@ -71,6 +72,8 @@ class BaseMessageReceiver:
         """
         Retrieves the live page with a given channel ID.
 
+        Closed live pages are left out so their live posts aren't changed anymore.
+
         Args:
             channel_id (str): Channel ID
 
@@ -81,7 +84,7 @@ class BaseMessageReceiver:
             Http404: if a page with the given `channel_id` doesn't exist.
         """
 
-        return self.model.objects.get(channel_id=channel_id)
+        return self.model.objects.get(channel_id=channel_id, closed=False)
 
     def get_message_id_from_message(self, message):
         """
@@ -386,6 +389,7 @@ class BaseMessageReceiver:
 
         message_id = self.get_message_id_from_edited_message(message=message)
         live_post = live_page.get_live_post_by_message_id(message_id=message_id)
+        fingerprint = live_post.value["fingerprint"]
         clear_live_post_content(live_post=live_post)
 
         message_text = self.get_message_text_from_edited_message(message=message)
@@ -394,6 +398,11 @@ class BaseMessageReceiver:
         files = self.get_message_files_from_edited_message(message=message)
         self.process_files(live_post=live_post.value, files=files)
 
+        if fingerprint and get_live_post_fingerprint(live_post) == fingerprint:
+            # The content of the message hasn't changed,
+            # e.g. a link preview has been added to the message.
+            return
+
         live_page.update_live_post(live_post=live_post)
 
     def delete_message(self, message):
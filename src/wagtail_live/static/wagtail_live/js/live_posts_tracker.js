@@ -21,6 +21,22 @@
         this.currentLivePosts = new Set(livePosts);
     }
 
+    /**
+     * Adds live posts to the current live posts.
+     * @param {Array} livePosts - Live posts to add.
+     */
+    addLivePosts(livePosts) {
+        livePosts.forEach(post => this.currentLivePosts.add(post));
+    }
+
+    /**
+     * Removes live posts from the current live posts.
+     * @param {Array} livePosts - Live posts to remove.
+     */
+    removeLivePosts(livePosts) {
+        livePosts.forEach(post => this.currentLivePosts.delete(post));
+    }
+
     /**
      * Retrieves the live posts to delete.
      * @param {Array} newLivePosts - Represents the current live posts on this page.
@@ -28,9 +44,10 @@
      */
     getLivePostsToDelete(newLivePosts) {
         /** A live post has been deleted if it's in currentLivePosts and not in newLivePosts */
+        let newLivePostsSet = new Set(newLivePosts);
         let postsToDelete = [];
         this.currentLivePosts.forEach(post => {
-            if (!newLivePosts.includes(post)) {postsToDelete.push(post)};
+            if (!newLivePostsSet.has(post)) {postsToDelete.push(post)};
         });
 
         return postsToDelete;
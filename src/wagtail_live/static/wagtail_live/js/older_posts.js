@@ -0,0 +1,52 @@
+const olderPostsURL = `/wagtail_live/older-posts/${channelID}/`;
+
+/**
+ * Loads the live posts older than the oldest live post displayed
+ * and adds them at the end of the live posts.
+ * The button used to load older posts is removed when there aren't older posts anymore.
+ */
+async function loadOlderPosts() {
+    let button = document.querySelector("#load-older-posts");
+    let oldestPostID = getOldestLivePostID();
+    if (oldestPostID == null) {
+        return;
+    }
+
+    button.disabled = true;
+    let url = olderPostsURL + '?' + new URLSearchParams({before: oldestPostID});
+    let response = await fetch(url);
+    button.disabled = false;
+
+    if (response.status != 200) {
+        return;
+    }
+
+    const {livePosts, hasMore} = await response.json();
+    let postsDiv = document.querySelector("#live-posts");
+    livePosts.forEach(post => {
+        if (getPostByID(post.id) != null) {
+            /** This live post is already displayed. */
+            return;
+        }
+        let livePost = createLivePostWrapper(post.content);
+        if (!post.show) {
+            livePost.style.display = "none";
+        }
+        postsDiv.insertAdjacentElement("beforeend", livePost);
+    });
+
+    /** Publishers tracking the current live posts track the older ones too. */
+    if (typeof livePostsTracker !== "undefined") {
+        livePostsTracker.addLivePosts(livePosts.map(post => post.id));
+    }
+
+    if (!hasMore) {
+        button.remove();
+    } else if (livePosts.length > 0) {
+        button.dataset.oldestCreated = livePosts[livePosts.length - 1].created;
+    }
+}
+
+document.addEventListener('DOMContentLoaded', () => {
+    document.querySelector("#load-older-posts").addEventListener("click", loadOlderPosts);
+});
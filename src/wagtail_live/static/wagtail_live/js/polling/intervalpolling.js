@@ -3,7 +3,7 @@ let POLLING_INTERVAL;
 /**
  * Initiates communication with server side.
  * If response status is 200, this function initializes the current live posts, 
- * the polling interval and the timestamp of the last update received then it waits
+ * the polling interval and the timestamp and sequence number of the last update received then it waits
  * for the duration of the polling interval and calls getUpdates.
  * If response status isn't 200, it waits for the duration of the shaking interval and tries again.
  */
@@ -13,14 +13,19 @@ async function shake() {
         method: 'POST',
     });
 
+    if (response.status == 410) {
+        /** The live page is closed, no more updates will come. */
+        return;
+    }
+
     if (response.status != 200) {
         setTimeout(async () => await shake(), SHAKING_INTERVAL);
         return;
     } 
 
-    const {livePosts, lastUpdateTimestamp, pollingInterval} = await response.json();
+    const {livePosts, lastUpdateTimestamp, lastUpdateSeq, pollingInterval} = await response.json();
     livePostsTracker.setLivePosts(livePosts);
-    [lastUpdateReceivedAt, POLLING_INTERVAL] = [lastUpdateTimestamp, pollingInterval];
+    [lastUpdateReceivedAt, lastUpdateSeqReceived, POLLING_INTERVAL] = [lastUpdateTimestamp, lastUpdateSeq, pollingInterval];
 
     setTimeout(async () => await getUpdates(), POLLING_INTERVAL);
 }
@@ -48,25 +53,25 @@ async function getUpdates() {
     /** If yes, try to get those updates. */
     response = await fetchUpdates();
 
+    if (response.status == 410) {
+        /** The live page is closed, no more updates will come. */
+        return;
+    }
+
     if (response.status != 200) {
         setTimeout(async () => await getUpdates(), POLLING_INTERVAL);
         return;
     }
 
-    const {updates, currentPosts, lastUpdateTimestamp} = await response.json();
-
-    /** Process new updates */
-    for (let i in updates) {process(i, updates[i])};
-
-    /** Retrieve and remove posts to remove. */
-    let postsToDelete = livePostsTracker.getLivePostsToDelete(currentPosts);
-    postsToDelete.forEach(post => removeLivePost(post));
+    const result = await response.json();
+    const {lastUpdateTimestamp, lastUpdateSeq} = result;
 
-    /** Set current live posts to new live posts. */
-    livePostsTracker.setLivePosts(currentPosts);
+    /** Process new updates and removals. */
+    applyUpdates(result);
 
-    /** Update the timestamp of the last update received. */
+    /** Update the timestamp and the sequence number of the last update received. */
     lastUpdateReceivedAt = lastUpdateTimestamp;
+    lastUpdateSeqReceived = lastUpdateSeq;
     
     setTimeout(async () => await getUpdates(), POLLING_INTERVAL);
 }
@@ -82,26 +87,32 @@ async function fetchLastUpdateAt() {
 
 /**
  * Checks if new updates are available.
- * We know that new updates are available if the timestamp of
+ * We know that new updates are available if the sequence number of
  * the last update of the current page is greater than the
- * timestamp of the last update received in the client side.
+ * sequence number of the last update received in the client side.
+ * The timestamps of the last updates are compared if no sequence number is available.
  * @param {*} response - HttpResponse from HEAD request 
  * @returns {boolean} true if new updates are available, false else.
  */
 function newUpdate(response) {
+    let lastUpdateSeq = response.headers.get('Last-Update-Seq');
+    if (lastUpdateSeq != null && lastUpdateSeqReceived !== undefined) {
+        return parseInt(lastUpdateSeq) > lastUpdateSeqReceived;
+    }
+
     let tsLastUpdateAt = response.headers.get('Last-Update-At');
     return parseFloat(tsLastUpdateAt) > parseFloat(lastUpdateReceivedAt);
 }
 
 /**
- * Fetches new updates from the server by sending the timestamp
- * of the last update received in the client side. 
+ * Fetches new updates from the server by sending the sequence number
+ * or the timestamp of the last update received in the client side. 
  * Server should respond with new updates, current live posts and 
- * the timestamp of the page's last update.
+ * the timestamp and sequence number of the page's last update.
  * @returns {*} HttpResponse
  */
 async function fetchUpdates() {
-    let url = basePollingURL + '?' +  new URLSearchParams({last_update_ts: lastUpdateReceivedAt});
+    let url = basePollingURL + '?' +  new URLSearchParams(getLastUpdateParams());
     return await fetch(url);
 }
 
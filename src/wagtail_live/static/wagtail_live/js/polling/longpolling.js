@@ -1,7 +1,7 @@
 /**
  * Initiates communication with server side.
  * If response status is 200, this function initializes the current live posts
- * and the timestamp of the last update received then it calls getUpdates.
+ * and the timestamp and sequence number of the last update received then it calls getUpdates.
  * If response status isn't 200, it waits for the duration of the shaking interval and tries again.
  */
 async function shake() {
@@ -10,14 +10,19 @@ async function shake() {
         method: 'POST',
     });
 
+    if (response.status == 410) {
+        /** The live page is closed, no more updates will come. */
+        return;
+    }
+
     if (response.status != 200) {
         setTimeout(async () => await shake(), SHAKING_INTERVAL);
         return;
     } 
     
-    const {livePosts, lastUpdateTimestamp} = await response.json();
+    const {livePosts, lastUpdateTimestamp, lastUpdateSeq} = await response.json();
     livePostsTracker.setLivePosts(livePosts);
-    lastUpdateReceivedAt = lastUpdateTimestamp;
+    [lastUpdateReceivedAt, lastUpdateSeqReceived] = [lastUpdateTimestamp, lastUpdateSeq];
 
     await getUpdates();
     return;
@@ -28,9 +33,14 @@ async function shake() {
  */
 async function getUpdates() {
 
-    let url = basePollingURL + '?' +  new URLSearchParams({last_update_ts: lastUpdateReceivedAt});
+    let url = basePollingURL + '?' +  new URLSearchParams(getLastUpdateParams());
     let response = await fetch(url);
 
+    if (response.status == 410) {
+        /** The live page is closed, no more updates will come. */
+        return;
+    }
+
     if (response.status != 200) {
         await getUpdates();
         return;
@@ -42,20 +52,14 @@ async function getUpdates() {
         return;
     }
 
-    const {updates, currentPosts, lastUpdateTimestamp} = result;
-
-    /** Process new updates */
-    for (let i in updates) {process(i, updates[i])};
-
-    /** Retrieve and remove posts to remove. */
-    let postsToDelete = livePostsTracker.getLivePostsToDelete(currentPosts);
-    postsToDelete.forEach(post => removeLivePost(post));
+    const {lastUpdateTimestamp, lastUpdateSeq} = result;
 
-    /** Set current live posts to new live posts. */
-    livePostsTracker.setLivePosts(currentPosts);
+    /** Process new updates and removals. */
+    applyUpdates(result);
 
-    /** Update the timestamp of the last update received. */
+    /** Update the timestamp and the sequence number of the last update received. */
     lastUpdateReceivedAt = lastUpdateTimestamp;
+    lastUpdateSeqReceived = lastUpdateSeq;
     
     await getUpdates();
 }
@@ -7,6 +7,18 @@ function getPostByID(livePostID) {
     return document.querySelector(`[data-post-id='${livePostID}']`);
 }
 
+/**
+ * Retrieves the ID of the oldest live post displayed.
+ * @returns {str} ID of the oldest live post displayed if any, else null.
+ */
+function getOldestLivePostID() {
+    let posts = document.querySelectorAll("#live-posts [data-post-id]");
+    if (posts.length == 0) {
+        return null;
+    }
+    return posts[posts.length - 1].dataset.postId;
+}
+
 /**
  * Processes new updates.
  * Replaces a previous live post if it's been edited or 
@@ -30,8 +42,27 @@ function process(updateID, value) {
 }
 
 
+/**
+ * Checks if a live post is older than the live posts loaded.
+ * When only the latest live posts are loaded, older live posts are added by
+ * loadOlderPosts, so their updates mustn't add them to the latest live posts.
+ * @param {string} livePostID - ID of the live post.
+ * @param {number} created - Timestamp of the creation of the live post.
+ * @returns {boolean} true if the live post isn't displayed and is older than
+ * the oldest live post loaded, else false.
+ */
+function isOlderThanLoadedPosts(livePostID, created) {
+    let button = document.querySelector("#load-older-posts");
+    if (button == null || created === undefined || getPostByID(livePostID) != null) {
+        return false;
+    }
+    return created < parseFloat(button.dataset.oldestCreated);
+}
+
 function process_updates(data) {
-    for (let i in data.renders) {process(i, data.renders[i])};
+    for (let i in data.renders) {
+        if (!isOlderThanLoadedPosts(i, data.renders[i].created)) {process(i, data.renders[i])};
+    }
     data.removals.forEach(post => removeLivePost(post));
 }
 
@@ -1,4 +1,6 @@
 const scheme = useSecureWsConnection === true ? "wss" : "ws";
+const RECONNECT_INTERVAL = 1000;
+const MAX_RECONNECT_INTERVAL = 30000;
 
 class WebsocketPublisher {
     /**
@@ -37,22 +39,87 @@ class WebsocketPublisher {
 
 }
 
+/**
+ * Compares the IDs of 2 entries of a Redis stream.
+ * @param {string} a - ID of the first entry.
+ * @param {string} b - ID of the second entry.
+ * @returns {number} A negative number if a is older than b, 0 if they are equal,
+ *  a positive number else.
+ */
+function compareStreamIDs(a, b) {
+    const [aTime, aSeq] = a.split("-").map(Number);
+    const [bTime, bSeq] = b.split("-").map(Number);
+    return aTime - bTime || aSeq - bSeq;
+}
+
 class GenericWebsocketPublisher extends WebsocketPublisher {
     initialize_websocket_connection() {
         this.websocket = new WebSocket(
-            `${scheme}://${this.baseURL}/ws/channel/${channelID}/`
+            `${scheme}://${this.baseURL}/ws/channel/${channelID}/${this.getQueryString()}`
         );
     }
 
+    /**
+     * Sends the stream ID of the last message received when reconnecting
+     * so the server side sends the messages missed in the meantime.
+     * @returns {string} Query string of the websocket URL.
+     */
+    getQueryString() {
+        if (this.lastStreamID === undefined) {
+            return "";
+        }
+        return "?" + new URLSearchParams({since: this.lastStreamID});
+    }
+
     initialize_on_message_event() {
-        this.websocket.onmessage = function (e) {
-            process_updates(JSON.parse(e.data))
+        this.websocket.onmessage = (e) => {
+            const data = JSON.parse(e.data);
+            if (data.resync) {
+                if (data.reload || this.lastStreamID === undefined) {
+                    /** The messages missed can't be retrieved, load the page again. */
+                    window.location.reload();
+                } else {
+                    /** Reconnect to retrieve the messages missed from the stream. */
+                    this.websocket.close();
+                }
+                return;
+            }
+
+            if (data.streamId !== undefined) {
+                if (this.lastStreamID !== undefined && compareStreamIDs(data.streamId, this.lastStreamID) <= 0) {
+                    /** This message has already been received. */
+                    return;
+                }
+                this.lastStreamID = data.streamId;
+            }
+
+            process_updates(data);
+            if (data.closed) {
+                /** The live page has been closed, no more updates will come. */
+                this.closed = true;
+                this.websocket.close();
+            }
         };
     }
 
     initialize_on_error_event() {
-        this.websocket.onclose = function(e) {
-            console.error('Websocket closed unexpectedly.');
+        this.websocket.onopen = (e) => {
+            this.reconnectInterval = RECONNECT_INTERVAL;
+        };
+
+        this.websocket.onclose = (e) => {
+            if (this.closed) {
+                return;
+            }
+            console.error('Websocket closed unexpectedly. Reconnecting.');
+
+            /** Wait longer after each failed attempt. */
+            const interval = this.reconnectInterval || RECONNECT_INTERVAL;
+            this.reconnectInterval = Math.min(interval * 2, MAX_RECONNECT_INTERVAL);
+            setTimeout(() => {
+                this.initialize_websocket_connection();
+                this.start();
+            }, interval);
         };
     }
 }
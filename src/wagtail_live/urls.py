@@ -3,13 +3,21 @@
 import logging
 
 from django.core.exceptions import ImproperlyConfigured
+from django.urls import path
 
 from wagtail_live.exceptions import WebhookSetupError
 from wagtail_live.utils import get_live_publisher, get_live_receiver
+from wagtail_live.views import OlderLivePostsView
 
 logger = logging.getLogger(__name__)
 
-urlpatterns = []
+urlpatterns = [
+    path(
+        "older-posts/<str:channel_id>/",
+        OlderLivePostsView.as_view(),
+        name="older-live-posts",
+    ),
+]
 
 try:
     live_publisher = get_live_publisher()
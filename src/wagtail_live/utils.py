@@ -10,6 +10,10 @@ from wagtail.embeds.oembed_providers import all_providers
 
 SUPPORTED_MIME_TYPES = ["png", "jpeg", "gif"]
 
+STREAMFIELD_STORAGE = "streamfield"
+TABLE_STORAGE = "table"
+LIVE_POST_STORAGES = [STREAMFIELD_STORAGE, TABLE_STORAGE]
+
 
 def get_setting_or_raise(setting, setting_str):
     """
@@ -150,6 +154,146 @@ def get_polling_interval():
     return getattr(settings, "WAGTAIL_LIVE_POLLING_INTERVAL", 3000)
 
 
+def get_live_post_storage():
+    """
+    Retrieves the storage used to persist live posts.
+
+    The user can set this parameter in his settings by doing so:
+    ```python
+    WAGTAIL_LIVE_POST_STORAGE = "table"
+    ```
+
+    - `"streamfield"`: live posts are stored in the `live_posts` StreamField of the page.
+    - `"table"`: each live post is stored in its own row.
+        The `live_posts` StreamField is then a projection of these rows.
+
+    The default value is `"streamfield"`.
+
+    Returns:
+        str: The storage used to persist live posts.
+
+    Raises:
+        ImproperlyConfigured: if the storage specified isn't supported.
+    """
+
+    storage = getattr(settings, "WAGTAIL_LIVE_POST_STORAGE", STREAMFIELD_STORAGE)
+    if storage not in LIVE_POST_STORAGES:
+        raise ImproperlyConfigured(
+            f"Unknown live post storage {storage}. "
+            f"Supported storages are: {', '.join(LIVE_POST_STORAGES)}."
+        )
+    return storage
+
+
+def get_update_journal_size():
+    """
+    Retrieves the number of updates kept in the update journal of a live page.
+
+    The user can set this parameter in his settings by doing so:
+    ```python
+    WAGTAIL_LIVE_UPDATE_JOURNAL_SIZE = (number of updates)
+    ```
+
+    The default value is 1000.
+
+    Returns:
+        int: The number of updates kept per live page if defined else 1000.
+    """
+
+    return getattr(settings, "WAGTAIL_LIVE_UPDATE_JOURNAL_SIZE", 1000)
+
+
+def get_live_posts_window_size():
+    """
+    Retrieves the number of live posts rendered when a live page is loaded.
+
+    The user can set this parameter in his settings by doing so:
+    ```python
+    WAGTAIL_LIVE_POSTS_WINDOW_SIZE = (number of live posts)
+    ```
+
+    Older live posts are loaded on demand by the client side.
+    The default value is `None`, in which case all the live posts are rendered.
+
+    Returns:
+        int: The number of live posts rendered if defined else `None`.
+    """
+
+    return getattr(settings, "WAGTAIL_LIVE_POSTS_WINDOW_SIZE", None)
+
+
+def get_publish_batch_window():
+    """
+    Retrieves the duration during which the updates of a live page are merged
+    before being published by websocket publishers.
+
+    The user can set this parameter in his settings by doing so:
+    ```python
+    WAGTAIL_LIVE_PUBLISH_BATCH_WINDOW = (duration in ms)
+    ```
+    The default value is 0, in which case each update is published at once.
+
+    Returns:
+        int: the duration of the batch window if defined else 0.
+    """
+
+    return getattr(settings, "WAGTAIL_LIVE_PUBLISH_BATCH_WINDOW", 0)
+
+
+def get_publish_queue_size():
+    """
+    Retrieves the maximum number of updates waiting to be published by websocket publishers.
+
+    The user can set this parameter in his settings by doing so:
+    ```python
+    WAGTAIL_LIVE_PUBLISH_QUEUE_SIZE = (number of updates)
+    ```
+
+    When set, updates are published by a background worker instead of the requests
+    updating the live pages.
+    The default value is 0, in which case updates are published in the requests.
+
+    Returns:
+        int: The size of the publish queue if defined else 0.
+    """
+
+    return getattr(settings, "WAGTAIL_LIVE_PUBLISH_QUEUE_SIZE", 0)
+
+
+def get_publish_max_retries():
+    """
+    Retrieves the number of times the background worker retries publishing an update.
+
+    The user can set this parameter in his settings by doing so:
+    ```python
+    WAGTAIL_LIVE_PUBLISH_MAX_RETRIES = (number of retries)
+    ```
+    The default value is 3.
+
+    Returns:
+        int: The number of retries if defined else 3.
+    """
+
+    return getattr(settings, "WAGTAIL_LIVE_PUBLISH_MAX_RETRIES", 3)
+
+
+def get_update_timestamp(updated_at):
+    """
+    Converts the date and time of a live page update to a timestamp.
+
+    Args:
+        updated_at (DateTime): Date and time of the update.
+
+    Returns:
+        float: Timestamp of the update.
+    """
+
+    # Live posts are saved using a json format.
+    # We strip the microseconds here to follow that format.
+    microsecond = (updated_at.microsecond // 1000) * 1000
+    return updated_at.replace(microsecond=microsecond).timestamp()
+
+
 @lru_cache(maxsize=None)
 def is_embed(text):
     """
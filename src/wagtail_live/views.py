@@ -0,0 +1,73 @@
+"""Wagtail Live views."""
+
+from django.http import Http404, JsonResponse
+from django.shortcuts import get_object_or_404
+from django.utils.functional import cached_property
+from django.views import View
+
+from wagtail_live.cache import render_live_post
+from wagtail_live.utils import get_live_page_model, get_update_timestamp
+
+
+class OlderLivePostsView(View):
+    """
+    Sends the live posts older than a given live post.
+
+    Live pages render their latest live posts only when the `WAGTAIL_LIVE_POSTS_WINDOW_SIZE`
+    setting is defined. Client side loads older live posts from this view.
+    """
+
+    @cached_property
+    def model(self):
+        """Retrieves the live model defined."""
+
+        return get_live_page_model()
+
+    def get(self, request, channel_id, *args, **kwargs):
+        """
+        Retrieves and sends the live posts older than a given live post.
+
+        Args:
+            request (HttpRequest):
+                Client side's request sent along with the ID of the oldest
+                live post loaded in the `before` parameter.
+            channel_id (str):
+                Id of the channel to get live posts from.
+
+        Returns:
+            HttpResponse:
+            - JSONResponse with the following informations:
+                - A list of the live posts older than the one given, from the latest
+                    to the oldest. Each live post is given with its ID, its show value,
+                    the timestamp of its creation and its content.
+
+                - Whether even older live posts exist.
+
+                if a page corresponding to the `channel_id` given exists.
+
+            - Http404 if no page corresponds to the `channel_id` given or
+                the live post given doesn't exist.
+        """
+
+        live_page = get_object_or_404(self.model, channel_id=channel_id)
+        try:
+            live_posts, has_more = live_page.get_live_posts_before(
+                request.GET.get("before")
+            )
+        except KeyError:
+            raise Http404
+
+        return JsonResponse(
+            {
+                "livePosts": [
+                    {
+                        "id": live_post.id,
+                        "show": live_post.value["show"],
+                        "created": get_update_timestamp(live_post.value["created"]),
+                        "content": render_live_post(live_post),
+                    }
+                    for live_post in live_posts
+                ],
+                "hasMore": has_more,
+            }
+        )
@@ -0,0 +1,22 @@
+# Generated by Django 3.2.8 on 2021-11-10 09:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("testapp", "0007_alter_blogpage_live_posts"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="blogpage",
+            name="last_update_seq",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Sequence number of the last update of this page",
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 3.2.8 on 2021-11-18 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("testapp", "0008_blogpage_last_update_seq"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="blogpage",
+            name="live_posts_checksum",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="Checksum of the live posts of this page",
+                max_length=40,
+            ),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 3.2.8 on 2021-11-22 09:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("testapp", "0010_alter_blogpage_live_posts"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="blogpage",
+            name="closed",
+            field=models.BooleanField(
+                default=False,
+                help_text="Close this page once the live event is finished. "
+                "The live posts are archived and clients stop fetching updates.",
+            ),
+        ),
+        migrations.AddField(
+            model_name="blogpage",
+            name="live_posts_archive",
+            field=models.TextField(
+                blank=True,
+                editable=False,
+                help_text="Rendering of the live posts of this page once closed",
+            ),
+        ),
+    ]
@@ -1,10 +1,16 @@
+from wagtail_live.publishers.notifiers import BaseUpdateNotifier
 from wagtail_live.publishers.websocket import BaseWebsocketPublisher
 
 
 class DummyWebsocketPublisher(BaseWebsocketPublisher):
-    def publish(self, channel_id, renders, removals):
+    def publish(self, channel_id, renders, removals, seq=None, closed=False):
         pass
 
 
 class DummyPublisher:
     pass
+
+
+class DummyNotifier(BaseUpdateNotifier):
+    def publish(self, channel_id, seq=None):
+        pass
@@ -31,11 +31,16 @@ async def test_django_channels_app(settings):
     assert len(groups["liveblog_test"]) == 1
 
     # Ensure new_update method is called when a message is sent to liveblog_test group.
-    message = {"type": "update", "renders": {}, "removals": []}
+    message = {"type": "update", "renders": {}, "removals": [], "seq": 1}
     await channel_layer.group_send("liveblog_test", message)
 
     response = await communicator.receive_from()
-    assert json.loads(response) == {"renders": {}, "removals": []}
+    assert json.loads(response) == {
+        "renders": {},
+        "removals": [],
+        "seq": 1,
+        "closed": False,
+    }
 
     # Ensure websocket channel is discarded from liveblog_test group
     # when the websocket connection closes.
@@ -22,12 +22,22 @@ def test_publish_new_update_on_live_page_update_signal():
     try:
         # Send live_page_update signal
         live_page_update.send(
-            sender=LivePageMixin, channel_id="some_id", renders={}, removals=[]
+            sender=LivePageMixin,
+            channel_id="some_id",
+            renders={},
+            removals=[],
+            seq=1,
         )
 
         # Ensure that the update is published i.e sent to live page group
         message = async_to_sync(channel_layer.receive)("test-channel")
-        assert message == {"type": "update", "renders": {}, "removals": []}
+        assert message == {
+            "type": "update",
+            "renders": {},
+            "removals": [],
+            "seq": 1,
+            "closed": False,
+        }
 
     finally:
         live_page_update.disconnect(publisher)
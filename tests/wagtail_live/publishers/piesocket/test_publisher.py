@@ -1,27 +1,19 @@
 import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
 
 import pytest
 import requests
 from django.test import override_settings
 
-from wagtail_live.publishers.piesocket.publisher import (
-    PieSocketPublisher,
-    headers,
-    publish_url,
-)
+from wagtail_live.publishers import worker as publish_worker
+from wagtail_live.publishers.piesocket.publisher import PieSocketPublisher
 from wagtail_live.publishers.piesocket.utils import (
     get_piesocket_api_key,
     get_piesocket_secret,
 )
-
-
-class ResponseMock:
-    def __init__(self, ok):
-        self.ok = ok
-
-        def ok(self):
-            return self.ok
-
+from wagtail_live.publishers.worker import PublishWorker
 
 API_KEY = "api-key"
 SECRET = "not-secret"
@@ -35,33 +27,147 @@ def piesocket_overrides():
         yield
 
 
+class StubPieSocketServer(ThreadingMixIn, HTTPServer):
+    """Local HTTP server standing for the PieSocket publish API."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubPieSocketHandler)
+        self.requests = []
+        self.clients = []
+        self.statuses = []
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_port}/api/publish"
+
+
+class StubPieSocketHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.requests.append((self.headers, json.loads(body)))
+        self.server.clients.append(self.client_address)
+
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = StubPieSocketServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def publisher(stub_server, mocker):
+    publisher = PieSocketPublisher()
+    publisher.publish_url = stub_server.url
+    mocker.patch.object(publisher, "get_retry_delay", return_value=0)
+    yield publisher
+    publisher.session.close()
+
+
+@pytest.mark.usefixtures("piesocket_overrides")
+def test_publisher(publisher, stub_server):
+    publisher.publish("some-id", {}, [], seq=1)
+    publisher.publish("some-id", {}, ["post"], seq=2)
+
+    assert len(stub_server.requests) == 2
+    headers, payload = stub_server.requests[0]
+    assert headers["Content-Type"] == "application/json"
+    assert payload == {
+        "key": API_KEY,
+        "secret": SECRET,
+        "channelId": "some-id",
+        "message": {"renders": {}, "removals": [], "seq": 1, "closed": False},
+    }
+    assert stub_server.requests[1][1]["message"]["removals"] == ["post"]
+
+
 @pytest.mark.usefixtures("piesocket_overrides")
-def test_publisher(mocker):
+def test_publisher_keeps_connection_alive(publisher, stub_server):
+    publisher.publish("some-id", {}, [])
+    publisher.publish("some-id", {}, [])
+
+    # Both requests are sent on the same connection.
+    assert len(set(stub_server.clients)) == 1
+
+
+@pytest.mark.usefixtures("piesocket_overrides")
+def test_publisher_retries_server_errors(publisher, stub_server):
+    stub_server.statuses = [503, 200]
+    publisher.publish("some-id", {}, [])
+
+    assert len(stub_server.requests) == 2
+
+
+@pytest.mark.usefixtures("piesocket_overrides")
+def test_publisher_response_not_ok(publisher, stub_server, caplog):
+    stub_server.statuses = [400]
+    with pytest.raises(requests.HTTPError):
+        publisher.publish("some-id", {}, [])
+
+    # Client errors aren't retried.
+    assert len(stub_server.requests) == 1
+    assert caplog.messages[0] == "Failed publishing new update to PieSocket API."
+
+
+@pytest.mark.usefixtures("piesocket_overrides")
+@override_settings(PIESOCKET_TIMEOUT=0.5)
+def test_publisher_connection_error(mocker, caplog):
     publisher = PieSocketPublisher()
-    channel_id = "some-id"
-    renders = removals = []
-    mocker.patch.object(requests, "post", return_value=ResponseMock(ok=True))
-
-    publisher.publish(channel_id, renders, removals)
-
-    expected = json.dumps(
-        {
-            "key": API_KEY,
-            "secret": SECRET,
-            "channelId": channel_id,
-            "message": {"renders": renders, "removals": removals},
-        }
+    mocker.patch.object(publisher, "get_retry_delay", return_value=0)
+    post = mocker.patch.object(
+        requests.Session, "post", side_effect=requests.ConnectionError
     )
-    requests.post.assert_called_once_with(publish_url, headers=headers, data=expected)
+
+    with pytest.raises(requests.ConnectionError):
+        publisher.publish("some-id", {}, [])
+
+    assert post.call_count == publisher.max_retries + 1
+    assert post.call_args[1]["timeout"] == 0.5
+    assert caplog.messages[-1] == "Failed publishing new update to PieSocket API."
 
 
 @pytest.mark.usefixtures("piesocket_overrides")
-def test_publisher_response_not_ok(mocker, caplog):
-    publisher = PieSocketPublisher()
-    channel_id = "some-id"
-    renders = removals = []
-    mocker.patch.object(requests, "post", return_value=ResponseMock(ok=False))
+def test_publisher_failure_counted_by_worker(publisher, stub_server, mocker):
+    mocker.patch.object(publish_worker.time, "sleep")
+    worker = PublishWorker(maxsize=10, max_retries=1)
+    mocker.patch(
+        "wagtail_live.publishers.websocket.get_publish_worker", return_value=worker
+    )
+    stub_server.statuses = [503] * 6
 
-    publisher.publish(channel_id, renders, removals)
+    publisher(None, channel_id="some-id", renders=[], removals=["post"], seq=1)
+    worker.join()
 
-    assert caplog.messages[0] == "Failed publishing new update to PieSocket API."
+    # Each attempt of the worker retries the request.
+    assert len(stub_server.requests) == 2 * (publisher.max_retries + 1)
+    assert worker.stats == {"published": 0, "retried": 1, "failed": 1, "overflowed": 0}
+
+
+@pytest.mark.usefixtures("piesocket_overrides")
+def test_publisher_failure_without_worker(publisher, stub_server, caplog):
+    stub_server.statuses = [400]
+
+    # Updates published in the requests don't fail them.
+    publisher(None, channel_id="some-id", renders=[], removals=["post"], seq=1)
+    assert caplog.messages[-1] == "Failed publishing a live page update."
+
+
+def test_get_retry_delay():
+    publisher = PieSocketPublisher()
+    assert 0.1 <= publisher.get_retry_delay(1) <= 0.3
+    assert 0.2 <= publisher.get_retry_delay(2) <= 0.6
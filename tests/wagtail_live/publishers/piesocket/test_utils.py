@@ -6,6 +6,7 @@ from wagtail_live.publishers.piesocket import (
     get_piesocket_api_key,
     get_piesocket_endpoint,
     get_piesocket_secret,
+    get_piesocket_timeout,
 )
 
 
@@ -52,3 +53,10 @@ def test_get_piesocket_endpoint():
     get_piesocket_endpoint.cache_clear()
 
     assert get_piesocket_endpoint() == "endpoint"
+
+
+def test_get_piesocket_timeout():
+    assert get_piesocket_timeout() == 5
+
+    with override_settings(PIESOCKET_TIMEOUT=1):
+        assert get_piesocket_timeout() == 1
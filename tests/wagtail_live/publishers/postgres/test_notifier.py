@@ -0,0 +1,113 @@
+import asyncio
+import json
+import socket
+import time
+from collections import namedtuple
+
+import psycopg2
+import pytest
+from django.db import connection
+
+from wagtail_live.publishers.postgres import PostgresNotifier
+
+Notify = namedtuple("Notify", ["channel", "payload"])
+
+
+class Connection:
+    """Stands for a psycopg2 connection: notifications are read from a socket."""
+
+    def __init__(self):
+        self.reader, self.writer = socket.socketpair()
+        self.notifies = []
+        self.closed = False
+        self.lost = False
+
+    def fileno(self):
+        return self.reader.fileno()
+
+    def poll(self):
+        if self.lost:
+            raise psycopg2.OperationalError("Connection lost.")
+        self.reader.recv(1024)
+
+    def notify(self, message):
+        self.notifies.append(Notify(PostgresNotifier.channel_name, json.dumps(message)))
+        self.writer.send(b"!")
+
+    def close(self):
+        self.closed = True
+        self.reader.close()
+        self.writer.close()
+
+
+@pytest.fixture
+def notifier():
+    notifier = PostgresNotifier()
+    yield notifier
+    if notifier.is_listening():
+        notifier._loop.remove_reader(notifier._listener.fileno())
+        notifier._listener.close()
+
+
+def slow_connect():
+    time.sleep(0.05)
+    return Connection()
+
+
+@pytest.mark.asyncio
+async def test_postgres_notifier_concurrent_start(notifier, mocker):
+    connect = mocker.patch.object(notifier, "connect", side_effect=slow_connect)
+
+    # Requests starting the notifier at the same time share the same connection.
+    await asyncio.gather(*(notifier.start() for _ in range(5)))
+    assert connect.call_count == 1
+    assert notifier.is_listening()
+
+    await notifier.start()
+    assert connect.call_count == 1
+
+    waiter = notifier.subscribe("some-id")
+    try:
+        notifier._listener.notify({"channel_id": "some-id", "seq": 1})
+        assert await asyncio.wait_for(waiter, 1) == 1
+    finally:
+        notifier.unsubscribe("some-id", waiter)
+
+
+@pytest.mark.asyncio
+async def test_postgres_notifier_lost_connection(notifier, mocker):
+    connect = mocker.patch.object(notifier, "connect", side_effect=Connection)
+    await notifier.start()
+    listener = notifier._listener
+
+    listener.lost = True
+    listener.writer.send(b"!")
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert listener.closed
+    assert not notifier.is_listening()
+
+    # The next request opens a new connection.
+    await notifier.start()
+    assert connect.call_count == 2
+    assert notifier.is_listening()
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="requires PostgreSQL")
+async def test_postgres_notifier():
+    from asgiref.sync import sync_to_async
+
+    notifier = PostgresNotifier()
+    await notifier.start()
+    waiter = notifier.subscribe("some-id")
+
+    try:
+        await sync_to_async(notifier.publish)(channel_id="some-id", seq=1)
+        assert await asyncio.wait_for(waiter, 1) == 1
+
+    finally:
+        notifier.unsubscribe("some-id", waiter)
+        notifier._loop.remove_reader(notifier._listener.fileno())
+        notifier._listener.close()
@@ -1,8 +1,14 @@
 import asyncio
+import json
 
 import pytest
+from aioredis.exceptions import ConnectionError as RedisConnectionError
 
-from wagtail_live.publishers.redis import RedisBus, make_channel_group_name
+from wagtail_live.publishers.redis import (
+    RedisBus,
+    make_channel_group_name,
+    make_stream_name,
+)
 from wagtail_live.publishers.utils import get_redis_url
 
 from ..conftest import wait_for_message
@@ -93,3 +99,149 @@ async def test_run(bus, redis):
     # Reset values
     count = 0
     _message = _recipients = None
+
+
+@pytest.mark.asyncio
+async def test_pattern_subscription(redis):
+    global count, _message, _recipients
+    bus = RedisBus(get_redis_url(), broadcast, use_pattern=True)
+    channel_group_name = make_channel_group_name("test_channel")
+    other_channel_group_name = make_channel_group_name("other_channel")
+
+    await bus.subscribe(channel_group_name, "ws_1")
+    await bus.subscribe(other_channel_group_name, "ws_2")
+
+    # A single subscription is used for all the channel groups.
+    assert bus.pubsub.patterns == {bus.pattern: bus.handle_message}
+    assert bus.pubsub.channels == {}
+
+    await redis.publish(channel_group_name, "hey")
+    await wait_for_message(bus.pubsub)
+    assert count == 1
+    assert _message == "hey"
+    assert _recipients == {"ws_1"}
+
+    # Messages of channel groups without subscribers are ignored.
+    await redis.publish(make_channel_group_name("no_subscribers"), "hey")
+    await wait_for_message(bus.pubsub)
+    assert count == 1
+    assert set(bus.channel_groups) == {channel_group_name, other_channel_group_name}
+
+    await bus.unsubscribe(channel_group_name, "ws_1")
+    await bus.unsubscribe(other_channel_group_name, "ws_2")
+    assert bus.channel_groups == {}
+    assert bus.pubsub.patterns == {bus.pattern: bus.handle_message}
+
+    await bus.pubsub.punsubscribe()
+
+    # Reset values
+    count = 0
+    _message = _recipients = None
+
+
+@pytest.mark.asyncio
+async def test_teardown_delay(mocker):
+    bus = RedisBus(get_redis_url(), broadcast, teardown_delay=0.05)
+    channel_group_name = make_channel_group_name("test_channel")
+    subscribe = mocker.spy(bus.pubsub, "subscribe")
+    unsubscribe = mocker.spy(bus.pubsub, "unsubscribe")
+
+    await bus.subscribe(channel_group_name, "ws_1")
+    await bus.unsubscribe(channel_group_name, "ws_1")
+
+    # The connection comes back before the channel group is discarded.
+    await bus.subscribe(channel_group_name, "ws_1")
+    await asyncio.sleep(0.1)
+    assert subscribe.call_count == 1
+    assert unsubscribe.call_count == 0
+    assert bus.get_channel_group_subscribers(channel_group_name) == {"ws_1"}
+
+    await bus.unsubscribe(channel_group_name, "ws_1")
+    assert channel_group_name in bus.channel_groups
+
+    await asyncio.sleep(0.1)
+    assert unsubscribe.call_count == 1
+    assert bus.channel_groups == {}
+
+
+@pytest.mark.asyncio
+async def test_get_missed_messages(bus, redis):
+    channel_group_name = make_channel_group_name("stream_channel")
+    stream_name = make_stream_name(channel_group_name)
+    await redis.delete(stream_name)
+
+    first = await redis.xadd(stream_name, {"message": '{"seq": 1}'})
+    second = await redis.xadd(stream_name, {"message": '{"seq": 2}'})
+
+    messages = await bus.get_missed_messages(channel_group_name, first)
+    assert [json.loads(message) for message in messages] == [
+        {"seq": 2, "streamId": second}
+    ]
+    assert await bus.get_missed_messages(channel_group_name, second) == []
+
+    # The stream doesn't go back to these IDs.
+    assert await bus.get_missed_messages(channel_group_name, "0-1") is None
+    assert await bus.get_missed_messages(channel_group_name, "bad-id") is None
+
+    await redis.delete(stream_name)
+
+
+def test_get_retry_delay(bus):
+    assert [bus.get_retry_delay(attempts) for attempts in range(1, 8)] == [
+        1,
+        2,
+        4,
+        8,
+        16,
+        30,
+        30,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_run_reconnects(redis):
+    messages = []
+
+    async def broadcast(message, recipients):
+        messages.append((message, recipients))
+
+    bus = RedisBus(get_redis_url(), broadcast)
+    bus.retry_interval = 0.01
+    channel_group_name = make_channel_group_name("test_channel")
+    task = asyncio.create_task(bus.run())
+    await asyncio.sleep(0)
+    await bus.subscribe(channel_group_name, "ws_1")
+    await asyncio.sleep(1e-2)
+
+    # Close the connection of the bus.
+    await redis.execute_command("CLIENT", "KILL", "TYPE", "pubsub")
+    for _ in range(100):
+        if bus.stats["reconnections"]:
+            break
+        await asyncio.sleep(1e-2)
+
+    assert bus.stats["disconnections"] == 1
+    assert bus.stats["reconnections"] == 1
+    assert bus.pubsub.channels == {channel_group_name: bus.handle_message}
+    # The connections are informed they may have missed messages.
+    assert messages == [('{"resync": true}', {"ws_1"})]
+
+    await redis.publish(channel_group_name, "hey")
+    await asyncio.sleep(1e-2)
+    assert messages[-1] == ("hey", {"ws_1"})
+
+    task.cancel()
+    await bus.unsubscribe(channel_group_name, "ws_1")
+
+
+@pytest.mark.asyncio
+async def test_subscribe_while_disconnected(bus, mocker):
+    mocker.patch.object(
+        bus.pubsub, "subscribe", side_effect=RedisConnectionError("Connection lost.")
+    )
+    channel_group_name = make_channel_group_name("test_channel")
+
+    # The subscription is kept to be restored when the bus reconnects.
+    await bus.subscribe(channel_group_name, "ws_1")
+    assert bus.get_channel_group_subscribers(channel_group_name) == {"ws_1"}
+    assert channel_group_name in bus._subscribed
@@ -0,0 +1,158 @@
+import asyncio
+import os
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.test import override_settings
+
+from wagtail_live.publishers.redis import RedisBus, make_channel_group_name
+from wagtail_live.publishers.redis import publisher as r_publisher
+from wagtail_live.publishers.redis.cluster import (
+    HASH_SLOTS,
+    ClusterSlots,
+    ShardedPubSub,
+    key_slot,
+)
+from wagtail_live.publishers.utils import get_redis_url
+
+# URL of a node of a local Redis Cluster, to run the tests against several nodes.
+REDIS_CLUSTER_URL = os.environ.get("WAGTAIL_LIVE_TEST_REDIS_CLUSTER_URL")
+
+
+@pytest.fixture
+async def sharded_redis(redis):
+    info = await redis.info("server")
+    if int(info["redis_version"].split(".")[0]) < 7:
+        pytest.skip("Sharded Pub/Sub requires Redis 7 or later.")
+    return redis
+
+
+async def wait_for(condition, timeout=1):
+    for _ in range(int(timeout * 100)):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+
+
+def test_key_slot():
+    assert key_slot("foo") == 12182
+    assert key_slot("123456789") == 12739
+    assert key_slot(b"123456789") == 12739
+
+    # Only the hash tag is hashed.
+    assert key_slot("{user1000}.following") == key_slot("{user1000}.followers")
+    assert key_slot("stream_{group_1}") == key_slot("group_1")
+    # Empty hash tags are ignored.
+    assert key_slot("{}foo") != key_slot("foo")
+
+
+def test_cluster_slots_get_node_url():
+    slots = ClusterSlots("redis://127.0.0.1:7000/0")
+    slots.ranges = [
+        (0, 5460, "redis://127.0.0.1:7000/0"),
+        (5461, 10922, "redis://127.0.0.1:7001/0"),
+        (10923, 16000, "redis://127.0.0.1:7002/0"),
+    ]
+
+    assert slots.get_node_url("{user1000}") == "redis://127.0.0.1:7000/0"
+    assert slots.get_node_url("foo") == "redis://127.0.0.1:7002/0"
+
+    # No node serves this slot.
+    assert key_slot("x") > 16000
+    with pytest.raises(LookupError):
+        slots.get_node_url("x")
+
+
+def test_cluster_slots_make_node_url():
+    slots = ClusterSlots("redis://:password@127.0.0.1:7000/0")
+    assert slots.make_node_url("10.0.0.2", 7001) == "redis://:password@10.0.0.2:7001/0"
+    assert slots.make_node_url(b"", 7002) == "redis://:password@127.0.0.1:7002/0"
+
+
+@pytest.mark.asyncio
+async def test_cluster_slots_without_cluster(redis):
+    slots = ClusterSlots(get_redis_url())
+    await slots.refresh(redis)
+
+    # A Redis server with cluster support disabled serves all the slots.
+    assert slots.ranges == [(0, HASH_SLOTS - 1, get_redis_url())]
+
+
+@pytest.mark.asyncio
+async def test_sharded_pubsub(sharded_redis):
+    messages = []
+    pubsub = ShardedPubSub(get_redis_url())
+    channel_group_name = make_channel_group_name("test_channel")
+    other_channel_group_name = make_channel_group_name("other_channel")
+
+    await pubsub.subscribe(
+        **{
+            channel_group_name: messages.append,
+            other_channel_group_name: messages.append,
+        }
+    )
+    assert set(pubsub.channels) == {channel_group_name, other_channel_group_name}
+    task = asyncio.create_task(pubsub.run())
+
+    await r_publisher.redis_publish(channel_group_name, "hey", sharded=True)
+    await r_publisher.redis_publish(other_channel_group_name, "you", sharded=True)
+    await wait_for(lambda: len(messages) == 2)
+    assert [(message["channel"], message["data"]) for message in messages] == [
+        (channel_group_name, '"hey"'),
+        (other_channel_group_name, '"you"'),
+    ]
+
+    await pubsub.unsubscribe(other_channel_group_name)
+    await wait_for(lambda: len(pubsub.channels) == 1)
+    assert set(pubsub.channels) == {channel_group_name}
+
+    task.cancel()
+    await pubsub.reset()
+
+
+def test_bus_sharded_pattern_subscription():
+    with pytest.raises(ImproperlyConfigured):
+        RedisBus(get_redis_url(), None, use_pattern=True, sharded=True)
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(
+    REDIS_CLUSTER_URL is None,
+    reason="WAGTAIL_LIVE_TEST_REDIS_CLUSTER_URL isn't defined.",
+)
+async def test_bus_sharded_in_cluster():
+    messages = []
+
+    async def broadcast(message, recipients):
+        messages.append((message, recipients))
+
+    with override_settings(WAGTAIL_LIVE_REDIS_URL=REDIS_CLUSTER_URL):
+        r_publisher.get_cluster_slots.cache_clear()
+        bus = RedisBus(REDIS_CLUSTER_URL, broadcast, sharded=True)
+        task = asyncio.create_task(bus.run())
+        await asyncio.sleep(0)
+
+        # Find channel groups served by different nodes.
+        await bus.pubsub.slots.refresh(bus.pubsub.get_client(REDIS_CLUSTER_URL))
+        channel_groups = {}
+        for index in range(100):
+            channel_group_name = make_channel_group_name(f"channel_{index}")
+            url = bus.pubsub.slots.get_node_url(channel_group_name)
+            channel_groups.setdefault(url, channel_group_name)
+        assert len(channel_groups) > 1
+
+        for url, channel_group_name in channel_groups.items():
+            await bus.subscribe(channel_group_name, url)
+        assert set(bus.pubsub.shards) == set(channel_groups)
+
+        for url, channel_group_name in channel_groups.items():
+            await r_publisher.redis_publish(channel_group_name, url, sharded=True)
+        await wait_for(lambda: len(messages) == len(channel_groups))
+        assert sorted(messages) == sorted((f'"{url}"', {url}) for url in channel_groups)
+
+        for url, channel_group_name in channel_groups.items():
+            await bus.unsubscribe(channel_group_name, url)
+        task.cancel()
+        await bus.pubsub.reset()
+
+    r_publisher.get_cluster_slots.cache_clear()
@@ -0,0 +1,64 @@
+import asyncio
+import json
+
+import pytest
+from aioredis.client import PubSub
+
+from wagtail_live.publishers.redis import RedisNotifier
+from wagtail_live.publishers.redis import notifier as r_notifier
+
+
+def test_redis_notifier_publish(mocker):
+    notifier = RedisNotifier()
+    mocker.patch.object(r_notifier, "publish_message")
+    notifier.publish(channel_id="some-id", seq=1)
+
+    r_notifier.publish_message.assert_called_once_with(
+        "wagtail_live:updates", {"channel_id": "some-id", "seq": 1}
+    )
+
+
+@pytest.mark.asyncio
+async def test_redis_notifier(redis):
+    notifier = RedisNotifier()
+    await notifier.start()
+    waiter = notifier.subscribe("some-id")
+
+    try:
+        message = {"channel_id": "some-id", "seq": 2}
+        await redis.publish(notifier.channel_name, json.dumps(message))
+        assert await asyncio.wait_for(waiter, 1) == 2
+
+    finally:
+        notifier.unsubscribe("some-id", waiter)
+        notifier._listener.cancel()
+
+
+@pytest.mark.asyncio
+async def test_redis_notifier_reconnects(redis, mocker):
+    from_url = mocker.spy(r_notifier.aioredis, "from_url")
+    reset = mocker.spy(PubSub, "reset")
+
+    notifier = RedisNotifier()
+    notifier.retry_interval = 0.01
+    await notifier.start()
+
+    try:
+        for _ in range(3):
+            # Close the connection of the notifier.
+            await redis.execute_command("CLIENT", "KILL", "TYPE", "pubsub")
+            await asyncio.sleep(0.05)
+            await notifier.start()
+
+        # The notifier reuses its client and releases the connection of each PubSub.
+        assert from_url.call_count == 1
+        assert reset.call_count == 3
+
+        waiter = notifier.subscribe("some-id")
+        message = {"channel_id": "some-id", "seq": 2}
+        await redis.publish(notifier.channel_name, json.dumps(message))
+        assert await asyncio.wait_for(waiter, 1) == 2
+        notifier.unsubscribe("some-id", waiter)
+
+    finally:
+        notifier._listener.cancel()
@@ -1,8 +1,15 @@
-import sys
+import asyncio
+import json
+import time
 
 import pytest
 
-from wagtail_live.publishers.redis import RedisPubSubPublisher, make_channel_group_name
+from wagtail_live.publishers.redis import (
+    RedisPubSubPublisher,
+    add_stream_id,
+    make_channel_group_name,
+    make_stream_name,
+)
 from wagtail_live.publishers.redis import publisher as r_publisher
 
 from ..conftest import wait_for_message
@@ -30,12 +37,129 @@ async def test_redis_publish(redis):
     }
 
 
-@pytest.mark.skipif(sys.version_info < (3, 8), reason="requires python3.8 or higher")
+def test_get_redis_client():
+    loop = asyncio.new_event_loop()
+    try:
+        client = loop.run_until_complete(make_client())
+        assert loop.run_until_complete(make_client()) is client
+    finally:
+        loop.close()
+
+    other_loop = asyncio.new_event_loop()
+    try:
+        assert other_loop.run_until_complete(make_client()) is not client
+    finally:
+        other_loop.close()
+
+
+async def make_client():
+    return r_publisher.get_redis_client()
+
+
+@pytest.mark.asyncio
+async def test_publish_message(redis):
+    pubsub = redis.pubsub()
+    group = make_channel_group_name("test_channel")
+    await pubsub.subscribe(group)
+
+    r_publisher.publish_message(group, "hey")
+    r_publisher.publish_message(group, "you")
+
+    assert (await wait_for_message(pubsub))["data"] == '"hey"'
+    assert (await wait_for_message(pubsub))["data"] == '"you"'
+    assert r_publisher.publisher_loop.loop.is_running()
+
+
+@pytest.fixture
+def publisher_loop():
+    publisher_loop = r_publisher.RedisPublisherLoop()
+    yield publisher_loop
+    if publisher_loop.loop is not None:
+        client = publisher_loop.run(make_client())
+        publisher_loop.run(client.connection_pool.disconnect())
+        publisher_loop.loop.call_soon_threadsafe(publisher_loop.loop.stop)
+
+
+def test_publisher_loop_creates_client_once(publisher_loop, mocker):
+    from_url = mocker.spy(r_publisher.aioredis, "from_url")
+    group = make_channel_group_name("test_channel")
+    for seq in range(10):
+        publisher_loop.publish(group, {"seq": seq})
+
+    # The client and its connection pool are created once for the loop.
+    assert from_url.call_count == 1
+    client = publisher_loop.run(make_client())
+    assert client.connection_pool._created_connections == 1
+
+
+def test_publisher_loop_throughput(publisher_loop, mocker):
+    from_url = mocker.spy(r_publisher.aioredis, "from_url")
+    group = make_channel_group_name("test_channel")
+    message = {"renders": {}, "removals": [], "seq": 0, "closed": False}
+    count = 2000
+
+    start = time.perf_counter()
+    for _ in range(count):
+        publisher_loop.publish(group, message)
+    publishes_per_second = count / (time.perf_counter() - start)
+
+    # All the publishes share one connection. A local Redis server handles a few
+    # thousand publishes per second, the bound leaves room for slower machines.
+    assert from_url.call_count == 1
+    client = publisher_loop.run(make_client())
+    assert client.connection_pool._created_connections == 1
+    assert publishes_per_second > 500
+
+
 def test_redis_publisher(mocker):
     publisher = RedisPubSubPublisher()
-    mocker.patch.object(r_publisher, "redis_publish")
-    publisher.publish("test_channel", {}, [])
+    mocker.patch.object(r_publisher, "publish_message")
+    publisher.publish("test_channel", {}, [], seq=1)
+
+    r_publisher.publish_message.assert_called_once_with(
+        "group_test_channel",
+        {"renders": {}, "removals": [], "seq": 1, "closed": False},
+        sharded=False,
+    )
+
+
+def test_add_stream_id():
+    message = json.dumps({"renders": {}, "removals": []})
+    assert json.loads(add_stream_id(message, "1-0")) == {
+        "renders": {},
+        "removals": [],
+        "streamId": "1-0",
+    }
+
+
+@pytest.mark.asyncio
+async def test_redis_stream_publish(redis):
+    pubsub = redis.pubsub()
+    group = make_channel_group_name("stream_channel")
+    stream_name = make_stream_name(group)
+    await redis.delete(stream_name)
+    await pubsub.subscribe(group)
+
+    message = {"renders": {}, "removals": ["post"]}
+    stream_id = await r_publisher.redis_stream_publish(group, message, 10)
+
+    published = await wait_for_message(pubsub)
+    assert json.loads(published["data"]) == {**message, "streamId": stream_id}
+
+    entries = await redis.xrange(stream_name)
+    assert entries == [(stream_id, {"message": json.dumps(message)})]
+    await redis.delete(stream_name)
+
+
+def test_redis_publisher_with_stream(mocker):
+    publisher = RedisPubSubPublisher()
+    mocker.patch.object(r_publisher, "get_redis_stream_maxlen", return_value=100)
+    mocker.patch.object(r_publisher, "publish_stream_message")
+    publisher.publish("test_channel", {}, [], seq=1)
 
-    r_publisher.redis_publish.assert_called_once_with(
-        "group_test_channel", {"renders": {}, "removals": []}
+    r_publisher.publish_stream_message.assert_called_once_with(
+        "group_test_channel",
+        {"renders": {}, "removals": [], "seq": 1, "closed": False},
+        100,
+        sharded=False,
     )
@@ -0,0 +1,107 @@
+import asyncio
+from datetime import datetime
+
+import django
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.http import JsonResponse
+from django.test import RequestFactory, override_settings
+
+from wagtail_live.publishers.notifiers import get_update_notifier
+from wagtail_live.publishers.polling import (
+    AsyncLongPollingPublisher,
+    LongPollingPublisher,
+)
+
+requires_async_views = pytest.mark.skipif(
+    django.VERSION < (3, 1), reason="async views require django 3.1 or higher"
+)
+
+LAST_UPDATED_AT = datetime(2021, 1, 1, 12, 0, 0)
+
+
+def test_async_long_polling_publisher_instance():
+    assert isinstance(AsyncLongPollingPublisher(), LongPollingPublisher)
+
+
+def test_async_long_polling_publisher_old_django(mocker):
+    mocker.patch.object(django, "VERSION", (2, 2, 0, "final", 0))
+    with pytest.raises(ImproperlyConfigured):
+        AsyncLongPollingPublisher.as_view()
+
+
+@requires_async_views
+def test_async_long_polling_publisher_view():
+    view = AsyncLongPollingPublisher.as_view()
+    assert asyncio.iscoroutinefunction(view)
+    assert view.view_class is AsyncLongPollingPublisher
+
+
+@pytest.fixture
+def get_request():
+    return RequestFactory().get(
+        "/wagtail_live/get-updates/test_channel/", {"last_update_seq": 1}
+    )
+
+
+@requires_async_views
+@pytest.mark.asyncio
+@override_settings(WAGTAIL_LIVE_POLLING_TIMEOUT=0.05)
+async def test_get_timeout_reached(get_request, mocker):
+    publisher = AsyncLongPollingPublisher()
+    mocker.patch.object(
+        publisher, "get_last_update", return_value=(1, LAST_UPDATED_AT, 1)
+    )
+
+    response = await publisher.get(get_request, "test_channel")
+    assert response.status_code == 200
+    assert b"timeOutReached" in response.content
+
+    # The database isn't queried while waiting for updates.
+    assert publisher.get_last_update.call_count == 1
+    assert get_update_notifier().waiters == {}
+
+
+@requires_async_views
+@pytest.mark.asyncio
+async def test_get_new_updates(get_request, mocker):
+    publisher = AsyncLongPollingPublisher()
+    mocker.patch.object(
+        publisher, "get_last_update", return_value=(1, LAST_UPDATED_AT, 2)
+    )
+    mocker.patch.object(
+        publisher, "get_updates_response", return_value=JsonResponse({"updates": {}})
+    )
+
+    response = await publisher.get(get_request, "test_channel")
+    publisher.get_updates_response.assert_called_once_with(
+        request=get_request, page_id=1
+    )
+    assert response.status_code == 200
+
+
+@requires_async_views
+@pytest.mark.asyncio
+async def test_get_wakes_up_on_update(get_request, mocker):
+    publisher = AsyncLongPollingPublisher()
+    mocker.patch.object(
+        publisher,
+        "get_last_update",
+        side_effect=[(1, LAST_UPDATED_AT, 1), (1, LAST_UPDATED_AT, 2)],
+    )
+    mocker.patch.object(
+        publisher, "get_updates_response", return_value=JsonResponse({"updates": {}})
+    )
+
+    task = asyncio.ensure_future(publisher.get(get_request, "test_channel"))
+    while not get_update_notifier().waiters:
+        await asyncio.sleep(0.01)
+
+    get_update_notifier().publish(channel_id="test_channel", seq=2)
+    response = await asyncio.wait_for(task, 1)
+
+    assert response.status_code == 200
+    assert publisher.get_last_update.call_count == 2
+    publisher.get_updates_response.assert_called_once_with(
+        request=get_request, page_id=1
+    )
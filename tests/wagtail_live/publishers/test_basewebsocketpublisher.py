@@ -1,5 +1,10 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+from django.test import override_settings
+
 from wagtail_live.models import LivePageMixin
-from wagtail_live.publishers.websocket import BaseWebsocketPublisher
+from wagtail_live.publishers.websocket import BaseWebsocketPublisher, UpdateBatch
 from wagtail_live.signals import live_page_update
 
 
@@ -9,9 +14,93 @@ def test_publish_called_on_new_live_page_update_signal(mocker):
     live_page_update.connect(ws_publisher)
 
     try:
-        update = {"channel_id": "some-id", "renders": {}, "removals": []}
+        update = {"channel_id": "some-id", "renders": {}, "removals": [], "seq": 1}
         live_page_update.send(sender=LivePageMixin, **update)
-        ws_publisher.publish.assert_called_once_with(**update)
+        ws_publisher.publish.assert_called_once_with(**update, closed=False)
+
+    finally:
+        live_page_update.disconnect(ws_publisher)
+
+
+def test_publish_closed_page(mocker):
+    ws_publisher = BaseWebsocketPublisher()
+    mocker.patch.object(ws_publisher, "publish", return_value=None)
+    live_page_update.connect(ws_publisher)
+
+    try:
+        update = {"channel_id": "some-id", "renders": {}, "removals": [], "seq": 2}
+        live_page_update.send(sender=LivePageMixin, closed=True, **update)
+        ws_publisher.publish.assert_called_once_with(**update, closed=True)
 
     finally:
         live_page_update.disconnect(ws_publisher)
+
+
+def make_post(post_id):
+    return SimpleNamespace(
+        id=post_id, value={"show": True, "created": datetime(2021, 1, 1, 12)}
+    )
+
+
+def test_update_batch():
+    batch = UpdateBatch()
+    post_1, post_2 = make_post("post-1"), make_post("post-2")
+    batch.add(renders=[post_1], removals=[], seq=1)
+    batch.add(renders=[post_2], removals=["post-3"], seq=2)
+    edited_post_1 = make_post("post-1")
+    batch.add(renders=[edited_post_1], removals=[], seq=3)
+
+    assert list(batch.renders.values()) == [post_2, edited_post_1]
+    assert batch.removals == ["post-3"]
+    assert batch.seq == 3
+    assert batch.closed is False
+
+    batch.add(renders=[], removals=["post-2"], seq=4, closed=True)
+    assert list(batch.renders.values()) == [edited_post_1]
+    assert batch.removals == ["post-3", "post-2"]
+    assert batch.seq == 4
+    assert batch.closed is True
+
+
+@override_settings(WAGTAIL_LIVE_PUBLISH_BATCH_WINDOW=100)
+def test_publish_batch(mocker):
+    timer = mocker.patch("wagtail_live.publishers.websocket.threading.Timer")
+    mocker.patch(
+        "wagtail_live.publishers.websocket.render_live_post",
+        side_effect=lambda post: f"render-{post.id}",
+    )
+    ws_publisher = BaseWebsocketPublisher()
+    mocker.patch.object(ws_publisher, "publish", return_value=None)
+
+    ws_publisher(LivePageMixin, "some-id", [make_post("post-1")], [], seq=1)
+    ws_publisher(LivePageMixin, "some-id", [make_post("post-1")], ["post-2"], seq=2)
+    ws_publisher(LivePageMixin, "other-id", [], ["post-3"], seq=7)
+
+    # A timer is started for each channel with pending updates.
+    assert timer.call_count == 2
+    assert timer.call_args_list[0][0][0] == 0.1
+    ws_publisher.publish.assert_not_called()
+
+    ws_publisher.flush("some-id")
+    ws_publisher.publish.assert_called_once_with(
+        channel_id="some-id",
+        renders={
+            "post-1": {
+                "show": True,
+                "created": datetime(2021, 1, 1, 12).timestamp(),
+                "content": "render-post-1",
+            }
+        },
+        removals=["post-2"],
+        seq=2,
+        closed=False,
+    )
+
+    # Nothing is left to publish for this channel.
+    ws_publisher.flush("some-id")
+    assert ws_publisher.publish.call_count == 1
+
+    ws_publisher.flush("other-id")
+    ws_publisher.publish.assert_called_with(
+        channel_id="other-id", renders={}, removals=["post-3"], seq=7, closed=False
+    )
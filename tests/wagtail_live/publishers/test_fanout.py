@@ -0,0 +1,204 @@
+import asyncio
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+
+from wagtail_live.publishers.fanout import TRY_AGAIN_LATER, FanOut, PreparedMessage
+
+
+class Connection:
+    def __init__(self, slow=False):
+        self.messages = []
+        self.closed_with = None
+        self.unblocked = asyncio.Event()
+        if not slow:
+            self.unblocked.set()
+
+    async def send(self, message):
+        await self.unblocked.wait()
+        self.messages.append(message)
+
+
+async def send(connection, message):
+    await connection.send(message)
+
+
+async def close(connection, code):
+    connection.closed_with = code
+
+
+async def flush():
+    # Give a chance to the sender tasks to run.
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_fan_out_bad_policy():
+    with pytest.raises(ImproperlyConfigured):
+        FanOut(send=send, close=close, maxsize=1, policy="bad")
+
+
+@pytest.mark.asyncio
+async def test_fan_out_broadcast():
+    fan_out = FanOut(send=send, close=close, maxsize=2, policy="disconnect")
+    ws_1, ws_2 = Connection(), Connection()
+    fan_out.register(ws_1)
+    fan_out.register(ws_2)
+
+    await fan_out.broadcast("hey", {ws_1, ws_2})
+    await fan_out.broadcast("you", [ws_1])
+    await flush()
+
+    assert ws_1.messages == ["hey", "you"]
+    assert ws_2.messages == ["hey"]
+    assert fan_out.stats["sent"] == 3
+    assert fan_out.get_queue_depths() == {ws_1: 0, ws_2: 0}
+
+    fan_out.discard(ws_1)
+    fan_out.discard(ws_2)
+    assert fan_out.queues == {}
+
+
+@pytest.mark.asyncio
+async def test_fan_out_disconnects_slow_consumer():
+    fan_out = FanOut(send=send, close=close, maxsize=2, policy="disconnect")
+    fast, slow = Connection(), Connection(slow=True)
+    fan_out.register(fast)
+    fan_out.register(slow)
+
+    for message in ["1", "2", "3"]:
+        await fan_out.broadcast(message, [fast, slow])
+        await flush()
+
+    # The slow connection doesn't delay the others.
+    assert fast.messages == ["1", "2", "3"]
+    assert fan_out.get_queue_depths()[slow] == 2
+
+    await fan_out.broadcast("4", [fast, slow])
+    await flush()
+    assert slow.closed_with == TRY_AGAIN_LATER
+    assert slow not in fan_out.queues
+    assert fan_out.stats["disconnected"] == 1
+    assert fast.messages == ["1", "2", "3", "4"]
+
+    # The slow connection doesn't get a new queue until it subscribes again.
+    await fan_out.broadcast("5", [fast, slow])
+    await flush()
+    assert slow not in fan_out.queues
+    assert fast.messages == ["1", "2", "3", "4", "5"]
+
+    fan_out.discard(fast)
+
+
+@pytest.mark.asyncio
+async def test_fan_out_drops_messages_of_slow_consumer():
+    fan_out = FanOut(send=send, close=close, maxsize=2, policy="drop")
+    slow = Connection(slow=True)
+    fan_out.register(slow)
+
+    for message in ["1", "2", "3", "4"]:
+        await fan_out.broadcast(message, [slow])
+        await flush()
+
+    # "1" is being sent, "2" has been dropped.
+    assert fan_out.stats["dropped"] == 1
+    assert fan_out.get_queue_depths() == {slow: 2}
+
+    slow.unblocked.set()
+    await flush()
+    assert slow.messages == ["1", "3", "4"]
+    assert slow.closed_with is None
+
+    fan_out.discard(slow)
+
+
+@pytest.mark.asyncio
+async def test_fan_out_send_error():
+    async def failing_send(connection, message):
+        raise ConnectionError
+
+    fan_out = FanOut(send=failing_send, close=close, maxsize=2, policy="drop")
+    connection = Connection()
+    fan_out.register(connection)
+
+    await fan_out.broadcast("hey", [connection])
+    await flush()
+    assert connection not in fan_out.queues
+
+    await fan_out.broadcast("you", [connection])
+    assert connection not in fan_out.queues
+
+
+@pytest.mark.asyncio
+async def test_fan_out_subscribe_registers_connection():
+    fan_out = FanOut(send=send, close=close, maxsize=2, policy="drop")
+    bus, connection = Bus(fan_out, []), Connection()
+
+    # Messages aren't queued for connections which haven't subscribed.
+    await fan_out.broadcast("hey", [connection])
+    assert connection not in fan_out.queues
+
+    await fan_out.subscribe(bus, "group", connection)
+    await fan_out.broadcast("you", [connection])
+    await flush()
+    assert connection.messages == ["you"]
+
+    fan_out.discard(connection)
+    await fan_out.broadcast("again", [connection])
+    assert connection not in fan_out.queues
+
+
+def test_prepared_message():
+    message = PreparedMessage('{"renders": {"post": "\u00e9t\u00e9"}}')
+    assert message.data == message.text.encode("utf-8")
+    assert message.data is message.data
+
+
+class Bus:
+    def __init__(self, fan_out, missed_messages):
+        self.fan_out = fan_out
+        self.missed_messages = missed_messages
+        self.subscribers = []
+
+    async def subscribe(self, channel_group_name, connection):
+        self.subscribers.append(connection)
+
+    async def get_missed_messages(self, channel_group_name, since):
+        # A new message is published while the missed ones are retrieved.
+        self.fan_out.put(self.subscribers[-1], PreparedMessage("new"))
+        return self.missed_messages
+
+
+@pytest.mark.asyncio
+async def test_fan_out_subscribe_replays_missed_messages():
+    fan_out = FanOut(send=send, close=close, maxsize=2, policy="disconnect")
+    bus = Bus(fan_out, ['{"seq": 2}', '{"seq": 3}'])
+    connection = Connection()
+
+    await fan_out.subscribe(bus, "group", connection, since="1-0")
+    await flush()
+
+    assert bus.subscribers == [connection]
+    # The missed messages are sent before the new ones.
+    assert [message.text for message in connection.messages] == [
+        '{"seq": 2}',
+        '{"seq": 3}',
+        "new",
+    ]
+
+    fan_out.discard(connection)
+
+
+@pytest.mark.asyncio
+async def test_fan_out_subscribe_resync():
+    fan_out = FanOut(send=send, close=close, maxsize=2, policy="disconnect")
+    bus, connection = Bus(fan_out, None), Connection()
+
+    await fan_out.subscribe(bus, "group", connection, since="1-0")
+    await flush()
+
+    assert [message.text for message in connection.messages] == [
+        '{"resync": true, "reload": true}',
+        "new",
+    ]
+    fan_out.discard(connection)
@@ -1,12 +1,16 @@
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import pytest
+from django.core.cache import caches
 from django.test import override_settings
 from django.urls import resolve
+from django.utils.http import http_date
+from django.utils.timezone import now
 
 from tests.testapp.models import BlogPage
 from tests.utils import reload_urlconf
+from wagtail_live.blocks import construct_live_post_block
 from wagtail_live.publishers.polling import (
     IntervalPollingPublisher,
     PollingPublisherMixin,
@@ -86,6 +90,21 @@ class TestIntervalPolling:
 
         page = BlogPage.objects.get(channel_id="test_channel")
         assert payload["lastUpdateTimestamp"] == page.last_update_timestamp
+        assert payload["lastUpdateSeq"] == page.last_update_seq
+
+    @override_settings(WAGTAIL_LIVE_POSTS_WINDOW_SIZE=2)
+    def test_post_window(self, live_page, client):
+        response = client.post("/wagtail_live/get-updates/test_channel/")
+
+        assert response.json()["livePosts"] == ["post-1", "post-2"]
+
+    def test_post_closed(self, live_page, client):
+        live_page.closed = True
+        live_page.save()
+        response = client.post("/wagtail_live/get-updates/test_channel/")
+
+        assert response.status_code == 410
+        assert response.json() == {"closed": True}
 
     def test_post_bad_channel(self, blog_page_factory, client):
         blog_page_factory(channel_id="good_channel")
@@ -100,6 +119,69 @@ class TestIntervalPolling:
 
         page = BlogPage.objects.get(channel_id="test_channel")
         assert response["Last-Update-At"] == str(page.last_update_timestamp)
+        assert response["Last-Update-Seq"] == str(page.last_update_seq)
+
+    def test_head_conditional(self, live_page, client, django_assert_num_queries):
+        url = "/wagtail_live/get-updates/test_channel/"
+        response = client.head(url)
+        etag = response["ETag"]
+        assert "no-cache" in response["Cache-Control"]
+
+        # Only the last update of the page is queried.
+        with django_assert_num_queries(1):
+            response = client.head(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+        assert response["ETag"] == etag
+        assert response.content == b""
+
+        live_post = construct_live_post_block(message_id="4", created=now())
+        live_page.add_live_post(live_post=live_post)
+
+        response = client.head(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+
+    def test_head_conditional_older_live_post(self, live_page, client):
+        url = "/wagtail_live/get-updates/test_channel/"
+        response = client.head(url)
+        assert "Last-Modified" not in response
+        last_modified = http_date(live_page.last_updated_at.timestamp())
+
+        # Adding an older live post moves the date of the last update backwards.
+        live_post = construct_live_post_block(
+            message_id="4", created=live_page.last_updated_at - timedelta(minutes=1)
+        )
+        live_page.add_live_post(live_post=live_post)
+
+        response = client.head(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        assert response.status_code == 200
+
+    # The cache is written once the transaction updating the page is committed.
+    @pytest.mark.django_db(transaction=True, serialized_rollback=True)
+    def test_head_last_update_cache(self, live_page, client, django_assert_num_queries):
+        cache = caches["default"]
+        cache.clear()
+        url = "/wagtail_live/get-updates/test_channel/"
+
+        with override_settings(WAGTAIL_LIVE_LAST_UPDATE_CACHE="default"):
+            # The cache is filled on the first miss.
+            with django_assert_num_queries(1):
+                client.head(url)
+
+            with django_assert_num_queries(0):
+                response = client.head(url)
+            assert response["Last-Update-Seq"] == str(live_page.last_update_seq)
+
+            # Saving the page updates the cache.
+            live_post = construct_live_post_block(message_id="4", created=now())
+            live_page.add_live_post(live_post=live_post)
+
+            with django_assert_num_queries(0):
+                response = client.head(url)
+            assert response["Last-Update-Seq"] == str(live_page.last_update_seq)
+            assert response["Last-Update-At"] == str(live_page.last_update_timestamp)
+
+        cache.clear()
 
     def test_head_bad_channel(self, blog_page_factory, client):
         blog_page_factory(channel_id="good_channel")
@@ -122,6 +204,86 @@ class TestIntervalPolling:
 
         page = BlogPage.objects.get(channel_id="test_channel")
         assert payload["lastUpdateTimestamp"] == page.last_update_timestamp
+        assert payload["lastUpdateSeq"] == page.last_update_seq
+
+    def test_get_closed(self, live_page, client):
+        last_update_seq = live_page.last_update_seq
+        live_page.closed = True
+        live_page.save()
+
+        response = client.get(
+            "/wagtail_live/get-updates/test_channel/",
+            {"last_update_seq": last_update_seq},
+        )
+        assert response.status_code == 410
+        assert response.json() == {"closed": True}
+
+    def test_get_seq(self, live_page, client):
+        last_update_seq = live_page.last_update_seq
+        live_post = construct_live_post_block(message_id="4", created=now())
+        live_page.add_live_post(live_post=live_post)
+
+        response = client.get(
+            "/wagtail_live/get-updates/test_channel/",
+            {"last_update_seq": last_update_seq},
+        )
+        assert response.status_code == 200
+
+        page = BlogPage.objects.get(channel_id="test_channel")
+        new_post_id = page.get_live_post_by_message_id(message_id="4").id
+
+        payload = response.json()
+        assert list(payload["updates"]) == [new_post_id]
+        assert payload["removals"] == []
+        assert "currentPosts" not in payload
+        assert payload["lastUpdateSeq"] == last_update_seq + 1
+
+    def test_get_seq_removals(self, live_page, client):
+        last_update_seq = live_page.last_update_seq
+        live_page.delete_live_post(message_id="2")
+
+        response = client.get(
+            "/wagtail_live/get-updates/test_channel/",
+            {"last_update_seq": last_update_seq},
+        )
+        payload = response.json()
+        assert payload["updates"] == {}
+        assert payload["removals"] == ["post-2"]
+        assert "currentPosts" not in payload
+
+    @override_settings(WAGTAIL_LIVE_UPDATE_JOURNAL_SIZE=1)
+    def test_get_seq_resync(self, live_page, client):
+        last_update_seq = live_page.last_update_seq
+        live_page.delete_live_post(message_id="2")
+        live_page.delete_live_post(message_id="3")
+
+        # The journal doesn't go back to the last update received.
+        response = client.get(
+            "/wagtail_live/get-updates/test_channel/",
+            {"last_update_seq": last_update_seq},
+        )
+        payload = response.json()
+        assert "removals" not in payload
+        assert payload["currentPosts"] == ["post-1"]
+
+    def test_get_conditional(self, live_page, client, django_assert_num_queries):
+        url = "/wagtail_live/get-updates/test_channel/"
+        params = {"last_update_seq": live_page.last_update_seq}
+        response = client.get(url, params)
+        etag = response["ETag"]
+
+        with django_assert_num_queries(1):
+            response = client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+        assert response.content == b""
+
+        live_post = construct_live_post_block(message_id="4", created=now())
+        live_page.add_live_post(live_post=live_post)
+
+        response = client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert len(response.json()["updates"]) == 1
+        assert response["ETag"] != etag
 
     def test_get_bad_channel(self, blog_page_factory, client):
         blog_page_factory(channel_id="good_channel")
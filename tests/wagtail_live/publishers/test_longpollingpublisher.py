@@ -4,9 +4,11 @@ from datetime import datetime
 import pytest
 from django.test import override_settings
 from django.urls import resolve
+from django.utils.timezone import now
 
 from tests.testapp.models import BlogPage
 from tests.utils import reload_urlconf
+from wagtail_live.blocks import construct_live_post_block
 from wagtail_live.publishers.polling import LongPollingPublisher, PollingPublisherMixin
 
 
@@ -81,6 +83,15 @@ class TestLongPolling:
 
         page = BlogPage.objects.get(channel_id="test_channel")
         assert payload["lastUpdateTimestamp"] == page.last_update_timestamp
+        assert payload["lastUpdateSeq"] == page.last_update_seq
+
+    def test_post_closed(self, live_page, client):
+        live_page.closed = True
+        live_page.save()
+        response = client.post("/wagtail_live/get-updates/test_channel/")
+
+        assert response.status_code == 410
+        assert response.json() == {"closed": True}
 
     def test_post_bad_channel(self, blog_page_factory, client):
         blog_page_factory(channel_id="good_channel")
@@ -103,6 +114,67 @@ class TestLongPolling:
 
         page = BlogPage.objects.get(channel_id="test_channel")
         assert payload["lastUpdateTimestamp"] == page.last_update_timestamp
+        assert payload["lastUpdateSeq"] == page.last_update_seq
+
+    def test_get_closed(self, live_page, client):
+        last_update_seq = live_page.last_update_seq
+        live_page.closed = True
+        live_page.save()
+
+        response = client.get(
+            "/wagtail_live/get-updates/test_channel/",
+            {"last_update_seq": last_update_seq},
+        )
+        assert response.status_code == 410
+        assert response.json() == {"closed": True}
+
+    def test_get_seq(self, live_page, client):
+        last_update_seq = live_page.last_update_seq
+        live_post = construct_live_post_block(message_id="4", created=now())
+        live_page.add_live_post(live_post=live_post)
+
+        response = client.get(
+            "/wagtail_live/get-updates/test_channel/",
+            {"last_update_seq": last_update_seq},
+        )
+        assert response.status_code == 200
+
+        page = BlogPage.objects.get(channel_id="test_channel")
+        new_post_id = page.get_live_post_by_message_id(message_id="4").id
+
+        payload = response.json()
+        assert list(payload["updates"]) == [new_post_id]
+        assert payload["removals"] == []
+        assert "currentPosts" not in payload
+        assert payload["lastUpdateSeq"] == last_update_seq + 1
+
+    def test_get_seq_removals(self, live_page, client):
+        last_update_seq = live_page.last_update_seq
+        live_page.delete_live_post(message_id="2")
+
+        response = client.get(
+            "/wagtail_live/get-updates/test_channel/",
+            {"last_update_seq": last_update_seq},
+        )
+        payload = response.json()
+        assert payload["updates"] == {}
+        assert payload["removals"] == ["post-2"]
+        assert "currentPosts" not in payload
+
+    @override_settings(WAGTAIL_LIVE_UPDATE_JOURNAL_SIZE=1)
+    def test_get_seq_resync(self, live_page, client):
+        last_update_seq = live_page.last_update_seq
+        live_page.delete_live_post(message_id="2")
+        live_page.delete_live_post(message_id="3")
+
+        # The journal doesn't go back to the last update received.
+        response = client.get(
+            "/wagtail_live/get-updates/test_channel/",
+            {"last_update_seq": last_update_seq},
+        )
+        payload = response.json()
+        assert "removals" not in payload
+        assert payload["currentPosts"] == ["post-1"]
 
     def test_get_bad_channel(self, blog_page_factory, client):
         blog_page_factory(channel_id="good_channel")
@@ -122,3 +194,14 @@ class TestLongPolling:
 
         payload = response.json()
         assert payload["timeOutReached"] == "Timeout duration reached."
+
+    @override_settings(WAGTAIL_LIVE_POLLING_TIMEOUT=1e-6)
+    def test_get_seq_timeout_reached(self, live_page, client):
+        response = client.get(
+            "/wagtail_live/get-updates/test_channel/",
+            {"last_update_seq": live_page.last_update_seq},
+        )
+        assert response.status_code == 200
+
+        payload = response.json()
+        assert payload["timeOutReached"] == "Timeout duration reached."
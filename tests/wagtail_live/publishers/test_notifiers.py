@@ -0,0 +1,106 @@
+import asyncio
+import threading
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.test import override_settings
+
+from wagtail_live.models import LivePageMixin
+from wagtail_live.publishers.notifiers import (
+    BaseUpdateNotifier,
+    InProcessNotifier,
+    get_update_notifier,
+)
+from wagtail_live.signals import live_page_update
+
+
+def test_get_update_notifier():
+    notifier = get_update_notifier()
+    assert isinstance(notifier, InProcessNotifier)
+    assert get_update_notifier() is notifier
+
+
+@pytest.fixture
+def clear_update_notifier():
+    get_update_notifier.cache_clear()
+    yield
+    get_update_notifier.cache_clear()
+
+
+@override_settings(
+    WAGTAIL_LIVE_UPDATE_NOTIFIER="tests.testapp.publishers.DummyNotifier"
+)
+def test_get_update_notifier_from_settings(clear_update_notifier):
+    from tests.testapp.publishers import DummyNotifier
+
+    assert isinstance(get_update_notifier(), DummyNotifier)
+
+
+@override_settings(
+    WAGTAIL_LIVE_UPDATE_NOTIFIER="tests.testapp.publishers.DummyWebsocketPublisher"
+)
+def test_get_update_notifier_bad_class(clear_update_notifier):
+    expected_err = (
+        "The notifier tests.testapp.publishers.DummyWebsocketPublisher doesn't inherit "
+        "from wagtail_live.publishers.notifiers.BaseUpdateNotifier."
+    )
+    with pytest.raises(ImproperlyConfigured, match=expected_err):
+        get_update_notifier()
+
+
+@pytest.mark.asyncio
+async def test_notifier_handle_message():
+    notifier = InProcessNotifier()
+    waiter = notifier.subscribe("some-id")
+
+    notifier.handle_message({"channel_id": "some-id", "seq": 4})
+    assert await asyncio.wait_for(waiter, 1) == 4
+
+
+def test_base_update_notifier_publish():
+    with pytest.raises(NotImplementedError):
+        BaseUpdateNotifier().publish(channel_id="some-id", seq=1)
+
+
+@pytest.mark.asyncio
+async def test_in_process_notifier():
+    notifier = InProcessNotifier()
+    waiter = notifier.subscribe("some-id")
+    other_waiter = notifier.subscribe("other-id")
+
+    notifier.publish(channel_id="some-id", seq=1)
+    assert await asyncio.wait_for(waiter, 1) == 1
+    assert not other_waiter.done()
+
+    notifier.unsubscribe("some-id", waiter)
+    notifier.unsubscribe("other-id", other_waiter)
+    assert notifier.waiters == {}
+
+
+@pytest.mark.asyncio
+async def test_in_process_notifier_from_another_thread():
+    notifier = InProcessNotifier()
+    waiter = notifier.subscribe("some-id")
+
+    # Live pages are updated in worker threads.
+    thread = threading.Thread(target=notifier.publish, args=("some-id", 2))
+    thread.start()
+
+    assert await asyncio.wait_for(waiter, 1) == 2
+    thread.join()
+
+
+@pytest.mark.asyncio
+async def test_in_process_notifier_live_page_update_signal():
+    notifier = InProcessNotifier()
+    live_page_update.connect(notifier)
+    waiter = notifier.subscribe("some-id")
+
+    try:
+        live_page_update.send(
+            sender=LivePageMixin, channel_id="some-id", renders=[], removals=[], seq=3
+        )
+        assert await asyncio.wait_for(waiter, 1) == 3
+
+    finally:
+        live_page_update.disconnect(notifier)
@@ -0,0 +1,93 @@
+from unittest.mock import Mock
+
+from django.test import override_settings
+
+from wagtail_live.publishers import worker as publish_worker
+from wagtail_live.publishers.websocket import BaseWebsocketPublisher
+from wagtail_live.publishers.worker import PublishWorker, get_publish_worker
+
+
+def test_get_publish_worker():
+    get_publish_worker.cache_clear()
+    try:
+        assert get_publish_worker() is None
+
+        get_publish_worker.cache_clear()
+        with override_settings(
+            WAGTAIL_LIVE_PUBLISH_QUEUE_SIZE=10, WAGTAIL_LIVE_PUBLISH_MAX_RETRIES=1
+        ):
+            worker = get_publish_worker()
+            assert isinstance(worker, PublishWorker)
+            assert worker.maxsize == 10
+            assert worker.max_retries == 1
+
+    finally:
+        get_publish_worker.cache_clear()
+
+
+def test_publish_worker_submit():
+    worker = PublishWorker(maxsize=10)
+    func = Mock()
+
+    assert worker.submit(func, channel_id="some-id") is True
+    worker.join()
+
+    func.assert_called_once_with(channel_id="some-id")
+    assert worker.pending == 0
+    assert worker.stats["published"] == 1
+
+
+def test_publish_worker_retry(mocker):
+    mocker.patch.object(publish_worker.time, "sleep")
+    worker = PublishWorker(maxsize=10, max_retries=2)
+    func = Mock(side_effect=[ConnectionError, None])
+
+    worker.submit(func, channel_id="some-id")
+    worker.join()
+
+    assert func.call_count == 2
+    assert worker.stats == {"published": 1, "retried": 1, "failed": 0, "overflowed": 0}
+
+
+def test_publish_worker_failed(mocker, caplog):
+    mocker.patch.object(publish_worker.time, "sleep")
+    worker = PublishWorker(maxsize=10, max_retries=2)
+    func = Mock(side_effect=ConnectionError)
+
+    worker.submit(func, channel_id="some-id")
+    worker.join()
+
+    assert func.call_count == 3
+    assert worker.stats["failed"] == 1
+    assert "Failed publishing a live page update." in caplog.text
+
+
+def test_publish_worker_full(mocker):
+    worker = PublishWorker(maxsize=1)
+    # Keep the worker thread from consuming the queue.
+    mocker.patch.object(worker, "start")
+    func = Mock()
+
+    assert worker.submit(func, channel_id="first") is True
+    assert worker.submit(func, channel_id="second") is False
+
+    # The job is run at once when the queue is full.
+    func.assert_called_once_with(channel_id="second")
+    assert worker.stats["overflowed"] == 1
+    assert worker.pending == 1
+
+
+def test_websocket_publisher_uses_worker(mocker):
+    worker = PublishWorker(maxsize=10)
+    mocker.patch(
+        "wagtail_live.publishers.websocket.get_publish_worker", return_value=worker
+    )
+    ws_publisher = BaseWebsocketPublisher()
+    mocker.patch.object(ws_publisher, "publish", return_value=None)
+
+    ws_publisher(None, channel_id="some-id", renders=[], removals=["post"], seq=1)
+    worker.join()
+
+    ws_publisher.publish.assert_called_once_with(
+        channel_id="some-id", renders={}, removals=["post"], seq=1, closed=False
+    )
@@ -3,10 +3,13 @@ import json
 
 import pytest
 import websockets
+from websockets.frames import OP_TEXT
 
 from tests.wagtail_live.publishers.conftest import wait_for_message
+from wagtail_live.publishers.fanout import PreparedMessage
 from wagtail_live.publishers.redis import make_channel_group_name
 from wagtail_live.publishers.websockets import app
+from wagtail_live.publishers.websockets.app import send
 
 
 @pytest.mark.asyncio
@@ -39,3 +42,44 @@ async def test_app(redis):
 
     await wait_for_message(pubsub)
     assert pubsub.channels == {}
+
+
+class Connection:
+    def __init__(self):
+        self.frames = []
+
+    async def ensure_open(self):
+        pass
+
+    async def write_frame(self, fin, opcode, data):
+        self.frames.append((fin, opcode, data))
+
+
+@pytest.mark.asyncio
+async def test_send_prepared_message():
+    message = PreparedMessage(json.dumps({"renders": {}, "removals": []}))
+    ws_1, ws_2 = Connection(), Connection()
+
+    await send(ws_1, message)
+    await send(ws_2, message)
+
+    assert ws_1.frames == [(True, OP_TEXT, message.text.encode("utf-8"))]
+    # The message is encoded once for all the connections.
+    assert ws_1.frames[0][2] is ws_2.frames[0][2]
+
+
+class PublicAPIConnection:
+    def __init__(self):
+        self.messages = []
+
+    async def send(self, message):
+        self.messages.append(message)
+
+
+@pytest.mark.asyncio
+async def test_send_without_write_frame():
+    message = PreparedMessage(json.dumps({"renders": {}, "removals": []}))
+    websocket = PublicAPIConnection()
+
+    await send(websocket, message)
+    assert websocket.messages == [message.text]
@@ -25,6 +25,11 @@ def test_get_live_page_from_channel_id(base_receiver, blog_page_factory):
     with pytest.raises(BlogPage.DoesNotExist):
         base_receiver.get_live_page_from_channel_id(channel_id="bad_id")
 
+    page.closed = True
+    page.save()
+    with pytest.raises(BlogPage.DoesNotExist):
+        base_receiver.get_live_page_from_channel_id(channel_id="some_id")
+
 
 def test_get_embed(base_receiver):
     valid_embed = "https://www.youtube.com/watch?v=Wrc_gofwDR8"
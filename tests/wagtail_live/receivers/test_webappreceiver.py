@@ -243,6 +243,19 @@ def test_change_message(blog_page_factory, webapp_receiver, message):
     assert first_block.value.source == "Edited"
 
 
+@pytest.mark.django_db
+def test_change_message_same_content(
+    mocker, blog_page_factory, webapp_receiver, message
+):
+    blog_page_factory(channel_id="test_channel")
+    webapp_receiver.add_message(message)
+
+    # The message is edited but its content stays the same.
+    mocker.patch.object(BlogPage, "update_live_post")
+    webapp_receiver.change_message(message)
+    BlogPage.update_live_post.assert_not_called()
+
+
 @pytest.mark.django_db
 def test_change_message_wrong_channel(blog_page_factory, webapp_receiver, message):
     blog_page_factory(channel_id="test_channel")
@@ -20,3 +20,26 @@ def test_live_page_update_signal_receivers_websocket():
         receiver = live_page_update.receivers[0]
     finally:
         live_page_update.disconnect(receiver)
+
+
+@override_settings(
+    WAGTAIL_LIVE_PUBLISHER="tests.testapp.publishers.DummyPublisher",
+    WAGTAIL_LIVE_RENDER_CACHE="default",
+)
+def test_live_page_update_signal_receivers_render_cache():
+    app_config = apps.get_app_config("wagtail_live")
+    app_config.ready()
+
+    # Receiver should be connected
+    assert live_page_update.disconnect(dispatch_uid="invalidate_render_cache")
+
+
+@override_settings(
+    WAGTAIL_LIVE_PUBLISHER="wagtail_live.publishers.polling.AsyncLongPollingPublisher"
+)
+def test_live_page_update_signal_receivers_async_long_polling():
+    app_config = apps.get_app_config("wagtail_live")
+    app_config.ready()
+
+    # Receiver should be connected
+    assert live_page_update.disconnect(dispatch_uid="update_notifier")
@@ -6,6 +6,7 @@ from wagtail.core.blocks import StreamValue, StructValue
 from wagtail.core.rich_text import RichText
 from wagtail.embeds.blocks import EmbedValue
 
+from tests.testapp.models import BlogPage
 from wagtail_live.blocks import (
     ContentBlock,
     LivePostBlock,
@@ -14,6 +15,11 @@ from wagtail_live.blocks import (
     construct_embed_block,
     construct_live_post_block,
     construct_text_block,
+    get_live_post_content_hash,
+    get_live_post_fingerprint,
+    get_stream_child,
+    get_stream_raw_data,
+    set_live_post_fingerprint,
 )
 from wagtail_live.receivers.base import TEXT
 
@@ -47,6 +53,7 @@ def test_construct_live_post_block():
             "modified": None,
             "show": True,
             "content": StreamValue(ContentBlock(), []),
+            "fingerprint": "",
         },
     )
 
@@ -137,3 +144,101 @@ def test_clear_live_post_content_streamchild(blog_page_factory):
 
     assert isinstance(live_post, StreamValue.StreamChild)
     assert live_post.value["content"] == StreamValue(ContentBlock(), [])
+
+
+def test_get_live_post_content_hash():
+    raw_post_value = {
+        "message_id": "some-id",
+        "created": "2021-01-01T12:00:00",
+        "modified": None,
+        "show": True,
+        "content": [{"type": "text", "value": "Some text", "id": "text-id"}],
+    }
+    content_hash = get_live_post_content_hash(raw_post_value)
+
+    # Only the content of the live post is hashed.
+    other_value = dict(raw_post_value, created="2021-01-02T12:00:00")
+    assert get_live_post_content_hash(other_value) == content_hash
+
+    # IDs of the content blocks aren't part of the hash.
+    other_value = dict(
+        raw_post_value,
+        content=[{"type": "text", "value": "Some text", "id": "other-id"}],
+    )
+    assert get_live_post_content_hash(other_value) == content_hash
+
+    other_value = dict(raw_post_value, show=False)
+    assert get_live_post_content_hash(other_value) != content_hash
+
+    other_value = dict(
+        raw_post_value,
+        content=[{"type": "text", "value": "Other text", "id": "text-id"}],
+    )
+    assert get_live_post_content_hash(other_value) != content_hash
+
+
+def test_live_post_fingerprint_structvalue():
+    live_post = construct_live_post_block(message_id="some-id", created=datetime.now())
+    fingerprint = get_live_post_fingerprint(live_post)
+
+    text_block = construct_text_block(text="Some text")
+    add_block_to_live_post(TEXT, text_block, live_post)
+    assert get_live_post_fingerprint(live_post) != fingerprint
+
+    set_live_post_fingerprint(live_post)
+    assert live_post["fingerprint"] == get_live_post_fingerprint(live_post)
+
+
+def test_live_post_without_fingerprint():
+    value = {"message_id": "1234", "created": None, "modified": None, "show": True}
+    assert LivePostBlock().to_python(value)["fingerprint"] == ""
+    assert (
+        LivePostBlock().to_python({**value, "fingerprint": None})["fingerprint"] == ""
+    )
+
+
+@pytest.mark.django_db
+def test_live_post_fingerprint_streamchild(blog_page_factory):
+    live_post = construct_live_post_block(message_id="some-id", created=datetime.now())
+    add_block_to_live_post(TEXT, construct_text_block(text="Some text"), live_post)
+    fingerprint = get_live_post_fingerprint(live_post)
+
+    page = blog_page_factory(channel_id="some-id")
+    page.add_live_post(live_post=live_post)
+    live_post = page.get_live_post_by_index(live_post_index=0)
+    assert live_post.value["fingerprint"] == fingerprint
+
+    # Rebuilding the same content keeps the fingerprint.
+    clear_live_post_content(live_post)
+    add_block_to_live_post(TEXT, construct_text_block(text="Some text"), live_post)
+    assert get_live_post_fingerprint(live_post) == fingerprint
+
+    set_live_post_fingerprint(live_post)
+    assert live_post.value["fingerprint"] == fingerprint
+
+
+def test_get_stream_raw_data():
+    raw_live_posts = [
+        {
+            "type": "live_post",
+            "id": f"post-{i}",
+            "value": {
+                "message_id": str(i),
+                "created": "2021-01-01T12:00:00",
+                "modified": None,
+                "show": True,
+                "content": [],
+                "fingerprint": "",
+            },
+        }
+        for i in range(2)
+    ]
+    stream_block = BlogPage._meta.get_field("live_posts").stream_block
+    live_posts = StreamValue(stream_block, json.loads(json.dumps(raw_live_posts)), True)
+
+    # A converted child changed in memory is serialized again.
+    get_stream_child(live_posts, 0).value["show"] = False
+    raw_data = get_stream_raw_data(live_posts)
+    assert live_posts.raw_data[0]["value"]["show"] is True
+    assert raw_data[0]["value"]["show"] is False
+    assert raw_data[1] == raw_live_posts[1]
@@ -0,0 +1,224 @@
+from datetime import datetime
+
+import pytest
+from django.core.cache import caches
+from django.db import transaction
+from django.test import override_settings
+
+from tests.testapp.models import BlogPage
+from wagtail_live.blocks import construct_live_post_block
+from wagtail_live.cache import (
+    get_cached_last_update,
+    get_last_update_cache,
+    get_render_cache,
+    get_render_version,
+    invalidate_render_cache,
+    make_last_update_cache_key,
+    make_render_cache_key,
+    render_live_post,
+    set_cached_last_update,
+)
+
+
+@pytest.fixture
+def render_cache():
+    cache = caches["default"]
+    cache.clear()
+    with override_settings(WAGTAIL_LIVE_RENDER_CACHE="default"):
+        yield cache
+    cache.clear()
+
+
+@pytest.fixture
+def live_post():
+    value = construct_live_post_block(
+        message_id="some-id", created=datetime(2021, 1, 1, 12, 0, 0, 123456)
+    )
+    stream_block = BlogPage._meta.get_field("live_posts").stream_block
+    stream_value = stream_block.to_python([])
+    stream_value.insert(0, ("live_post", value, "some-post-id"))
+    return stream_value[0]
+
+
+def test_get_render_cache():
+    assert get_render_cache() is None
+
+    with override_settings(WAGTAIL_LIVE_RENDER_CACHE="default"):
+        assert get_render_cache() is caches["default"]
+
+
+def test_get_render_version(live_post):
+    version = get_render_version(live_post)
+    assert version == (
+        "2021-01-01T12:00:00.123000",
+        "",
+        live_post.block.meta.template,
+    )
+
+    live_post.value["modified"] = datetime(2021, 1, 1, 13, 0, 0)
+    assert get_render_version(live_post)[0] == "2021-01-01T13:00:00"
+
+    live_post.value["fingerprint"] = "some-fingerprint"
+    assert get_render_version(live_post)[1] == "some-fingerprint"
+
+
+def test_render_live_post_without_cache(live_post, mocker):
+    spy = mocker.spy(live_post, "render")
+
+    render_live_post(live_post)
+    render_live_post(live_post)
+    assert spy.call_count == 2
+
+
+def test_render_live_post_with_cache(render_cache, live_post, mocker):
+    spy = mocker.spy(live_post, "render")
+
+    render = render_live_post(live_post)
+    assert render_live_post(live_post) == render
+    assert spy.call_count == 1
+
+    cache_key = make_render_cache_key("some-post-id")
+    assert render_cache.get(cache_key) == (get_render_version(live_post), render)
+
+
+def test_render_live_post_edited(render_cache, live_post, mocker):
+    spy = mocker.spy(live_post, "render")
+
+    render_live_post(live_post)
+    live_post.value["modified"] = datetime(2021, 1, 2)
+    render_live_post(live_post)
+    assert spy.call_count == 2
+
+    render_live_post(live_post)
+    assert spy.call_count == 2
+
+
+def test_invalidate_render_cache(render_cache, live_post):
+    render_live_post(live_post)
+    cache_key = make_render_cache_key("some-post-id")
+    assert render_cache.get(cache_key) is not None
+
+    invalidate_render_cache(sender=None, channel_id="some-id", renders=[], removals=[])
+    assert render_cache.get(cache_key) is not None
+
+    invalidate_render_cache(
+        sender=None, channel_id="some-id", renders=[], removals=["some-post-id"]
+    )
+    assert render_cache.get(cache_key) is None
+
+
+def test_get_last_update_cache():
+    assert get_last_update_cache() is None
+
+    with override_settings(WAGTAIL_LIVE_LAST_UPDATE_CACHE="default"):
+        assert get_last_update_cache() is caches["default"]
+
+
+@pytest.fixture
+def last_update_cache():
+    cache = caches["default"]
+    cache.clear()
+    with override_settings(WAGTAIL_LIVE_LAST_UPDATE_CACHE="default"):
+        yield cache
+    cache.clear()
+
+
+def test_cached_last_update(last_update_cache):
+    assert get_cached_last_update("some-id") is None
+
+    last_updated_at = datetime(2021, 1, 1, 12, 0, 0)
+    set_cached_last_update("some-id", 1, last_updated_at, 3)
+    assert get_cached_last_update("some-id") == (1, last_updated_at, 3)
+    assert last_update_cache.get(make_last_update_cache_key("some-id")) == (
+        1,
+        last_updated_at,
+        3,
+    )
+
+
+def test_cached_last_update_is_monotonic(last_update_cache):
+    last_updated_at = datetime(2021, 1, 1, 12, 0, 0)
+    set_cached_last_update("some-id", 1, last_updated_at, 3)
+
+    # An older update doesn't overwrite the cached one.
+    set_cached_last_update("some-id", 1, datetime(2021, 1, 1, 11, 0, 0), 2)
+    assert get_cached_last_update("some-id") == (1, last_updated_at, 3)
+
+    # Even if its date is later.
+    set_cached_last_update("some-id", 1, datetime(2021, 1, 1, 13, 0, 0), 2)
+    assert get_cached_last_update("some-id") == (1, last_updated_at, 3)
+
+    later_updated_at = datetime(2021, 1, 1, 11, 0, 0)
+    set_cached_last_update("some-id", 1, later_updated_at, 4)
+    assert get_cached_last_update("some-id") == (1, later_updated_at, 4)
+
+    # Another page now uses this channel.
+    set_cached_last_update("some-id", 2, last_updated_at, 0)
+    assert get_cached_last_update("some-id") == (2, last_updated_at, 0)
+
+
+def test_cached_last_update_walks_forward(last_update_cache):
+    last_updated_at = datetime(2021, 1, 1, 12, 0, 0)
+    for seq in range(3, 6):
+        set_cached_last_update("some-id", 1, last_updated_at, seq)
+
+    # A delayed write brings the latest update of the channel back to an older one.
+    cache_key = make_last_update_cache_key("some-id")
+    last_update_cache.set(cache_key, (1, last_updated_at, 3))
+
+    # Readers still get the latest update, and fix the one of the channel.
+    assert get_cached_last_update("some-id") == (1, last_updated_at, 5)
+    assert last_update_cache.get(cache_key) == (1, last_updated_at, 5)
+
+    # The entries of an update are only written once.
+    set_cached_last_update("some-id", 1, datetime(2021, 1, 1, 13, 0, 0), 5)
+    assert get_cached_last_update("some-id") == (1, last_updated_at, 5)
+
+
+def test_cached_last_update_disabled():
+    set_cached_last_update("some-id", 1, datetime(2021, 1, 1, 12, 0, 0), 3)
+    assert get_cached_last_update("some-id") is None
+
+
+@pytest.mark.django_db(transaction=True, serialized_rollback=True)
+def test_live_page_save_sets_cached_last_update(last_update_cache, blog_page_factory):
+    page = blog_page_factory(channel_id="some-id")
+    assert get_cached_last_update("some-id") == (
+        page.pk,
+        page.last_updated_at,
+        page.last_update_seq,
+    )
+
+    live_post = construct_live_post_block(message_id="some-id", created=datetime.now())
+    page.add_live_post(live_post=live_post)
+    assert get_cached_last_update("some-id") == (page.pk, page.last_updated_at, 1)
+
+
+@pytest.mark.django_db(transaction=True, serialized_rollback=True)
+def test_live_page_rollback_keeps_cached_last_update(
+    last_update_cache, blog_page_factory
+):
+    page = blog_page_factory(channel_id="some-id")
+    last_update = get_cached_last_update("some-id")
+
+    with pytest.raises(RuntimeError):
+        with transaction.atomic():
+            live_post = construct_live_post_block(
+                message_id="some-id", created=datetime.now()
+            )
+            page.add_live_post(live_post=live_post)
+            # The cache is written once the transaction is committed.
+            assert get_cached_last_update("some-id") == last_update
+            raise RuntimeError
+
+    assert get_cached_last_update("some-id") == last_update
+
+
+@pytest.mark.django_db(transaction=True, serialized_rollback=True)
+@override_settings(WAGTAIL_LIVE_POST_STORAGE="table")
+def test_table_storage_sets_cached_last_update(last_update_cache, blog_page_factory):
+    page = blog_page_factory(channel_id="some-id")
+
+    live_post = construct_live_post_block(message_id="some-id", created=datetime.now())
+    page.add_live_post(live_post=live_post)
+    assert get_cached_last_update("some-id") == (page.pk, page.last_updated_at, 1)
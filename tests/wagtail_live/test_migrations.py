@@ -19,3 +19,20 @@ def test_has_all_migrations():
     output.seek(0)
     output = output.read().strip()
     assert "No changes detected in app 'testapp'" in output
+
+
+@pytest.mark.django_db
+def test_wagtail_live_has_all_migrations():
+    output = StringIO()
+    management.call_command(
+        "makemigrations",
+        "wagtail_live",
+        verbosity=1,
+        interactive=False,
+        stdout=output,
+        dry_run=True,
+    )
+
+    output.seek(0)
+    output = output.read().strip()
+    assert "No changes detected in app 'wagtail_live'" in output
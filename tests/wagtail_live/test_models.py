@@ -1,8 +1,11 @@
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import pytest
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.template.loader import render_to_string
+from django.test import override_settings
 from django.utils.timezone import now
 from wagtail.admin.edit_handlers import FieldPanel, StreamFieldPanel
 from wagtail.core.blocks.stream_block import StreamValue
@@ -11,8 +14,9 @@ from wagtail.images import get_image_model
 
 from tests.testapp.models import BlogPage
 from tests.utils import get_test_image_file
+from wagtail_live import models
 from wagtail_live.blocks import construct_live_post_block
-from wagtail_live.models import LivePageMixin
+from wagtail_live.models import LivePageMixin, LivePost, LiveUpdate
 from wagtail_live.signals import live_page_update
 
 
@@ -26,8 +30,10 @@ def test_live_page_mixin():
     assert hasattr(LivePageMixin, "panels")
     assert isinstance(LivePageMixin.panels[0], FieldPanel)
     assert LivePageMixin.panels[0].field_name == "channel_id"
-    assert isinstance(LivePageMixin.panels[1], StreamFieldPanel)
-    assert LivePageMixin.panels[1].field_name == "live_posts"
+    assert isinstance(LivePageMixin.panels[1], FieldPanel)
+    assert LivePageMixin.panels[1].field_name == "closed"
+    assert isinstance(LivePageMixin.panels[2], StreamFieldPanel)
+    assert LivePageMixin.panels[2].field_name == "live_posts"
     assert LivePageMixin._meta.abstract is True
 
 
@@ -363,7 +369,7 @@ def test_edit_live_posts_updates_last_updated_at(blog_page_factory):
     assert diff.total_seconds() == pytest.approx(0.0, abs=1)
 
 
-@pytest.mark.django_db
+@pytest.mark.django_db(transaction=True, serialized_rollback=True)
 def test_edit_live_posts_sends_signal(blog_page_factory):
     count = 0
     _channel_id = _renders = _removals = None
@@ -399,13 +405,42 @@ def test_edit_live_posts_sends_signal(blog_page_factory):
         page.delete_live_post(message_id="some-id")
         assert count == 3
         assert _channel_id == "some-id"
-        assert _renders == {}
+        assert _renders == []
         assert _removals == [live_post_id]
 
     finally:
         live_page_update.disconnect(callback)
 
 
+@pytest.mark.django_db(transaction=True, serialized_rollback=True)
+def test_edit_live_posts_signal_sent_on_commit(blog_page_factory):
+    page = blog_page_factory(channel_id="some-id")
+    seqs = []
+
+    def callback(sender, channel_id, seq, **kwargs):
+        # The update is in the journal once clients learn about it.
+        assert LiveUpdate.objects.filter(page_id=page.id, seq=seq).exists()
+        seqs.append(seq)
+
+    live_page_update.connect(callback)
+    try:
+        with transaction.atomic():
+            live_post = construct_live_post_block(message_id="some-id", created=now())
+            page.add_live_post(live_post=live_post)
+            assert seqs == []
+        assert seqs == [page.last_update_seq]
+
+        # Nothing is sent for a rolled back update.
+        with pytest.raises(RuntimeError):
+            with transaction.atomic():
+                page.delete_live_post(message_id="some-id")
+                raise RuntimeError
+        assert seqs == [page.last_update_seq - 1]
+
+    finally:
+        live_page_update.disconnect(callback)
+
+
 @pytest.mark.django_db
 def test_get_updates_since(blog_page_factory):
     live_posts = json.dumps(
@@ -508,7 +543,7 @@ def test_get_updates_since_hidden_posts(blog_page_factory):
     assert "1" not in updated_posts
 
 
-@pytest.mark.django_db
+@pytest.mark.django_db(transaction=True, serialized_rollback=True)
 def test_save_live_page_new_post(blog_page_factory):
     # Setup signal callback
     count = 0
@@ -589,7 +624,7 @@ def test_save_live_page_new_post(blog_page_factory):
         live_page_update.disconnect(callback)
 
 
-@pytest.mark.django_db
+@pytest.mark.django_db(transaction=True, serialized_rollback=True)
 def test_save_live_page_show_edited(blog_page_factory):
     # Setup signal callback
     count = 0
@@ -658,7 +693,7 @@ def test_save_live_page_show_edited(blog_page_factory):
         live_page_update.disconnect(callback)
 
 
-@pytest.mark.django_db
+@pytest.mark.django_db(transaction=True, serialized_rollback=True)
 def test_save_live_page_content_edited(blog_page_factory):
     # Setup signal callback
     count = 0
@@ -732,7 +767,7 @@ def test_save_live_page_content_edited(blog_page_factory):
         live_page_update.disconnect(callback)
 
 
-@pytest.mark.django_db
+@pytest.mark.django_db(transaction=True, serialized_rollback=True)
 def test_save_live_page_different_block_types(blog_page_factory):
     # Setup signal callback
     count = 0
@@ -811,7 +846,7 @@ def test_save_live_page_different_block_types(blog_page_factory):
         live_page_update.disconnect(callback)
 
 
-@pytest.mark.django_db
+@pytest.mark.django_db(transaction=True, serialized_rollback=True)
 def test_save_live_page_different_embed_values(blog_page_factory):
     # Setup signal callback
     count = 0
@@ -890,7 +925,7 @@ def test_save_live_page_different_embed_values(blog_page_factory):
         live_page_update.disconnect(callback)
 
 
-@pytest.mark.django_db
+@pytest.mark.django_db(transaction=True, serialized_rollback=True)
 def test_save_live_page_different_images(blog_page_factory):
     # Setup signal callback
     count = 0
@@ -955,7 +990,7 @@ def test_save_live_page_different_images(blog_page_factory):
         live_page_update.disconnect(callback)
 
 
-@pytest.mark.django_db
+@pytest.mark.django_db(transaction=True, serialized_rollback=True)
 def test_save_live_page_deleted_post(blog_page_factory):
     # Setup signal callback
     count = 0
@@ -1077,3 +1112,718 @@ def test_save_live_page_no_changes(blog_page_factory):
 
     finally:
         live_page_update.disconnect(callback)
+
+
+@pytest.mark.django_db
+@override_settings(WAGTAIL_LIVE_POST_STORAGE="table")
+def test_table_storage_projects_rows(blog_page_factory):
+    live_posts = json.dumps(
+        [
+            {
+                "type": "live_post",
+                "id": "post-1",
+                "value": {
+                    "message_id": "1",
+                    "created": "2021-01-01T13:00:00",
+                    "modified": None,
+                    "show": True,
+                    "content": [],
+                },
+            },
+            {
+                "type": "live_post",
+                "id": "post-2",
+                "value": {
+                    "message_id": "2",
+                    "created": "2021-01-01T12:00:00",
+                    "modified": None,
+                    "show": True,
+                    "content": [],
+                },
+            },
+        ]
+    )
+    page = blog_page_factory(channel_id="some-id", live_posts=live_posts)
+
+    # Each live post is stored in its own row.
+    rows = LivePost.objects.filter(page_id=page.id).order_by("-created")
+    assert [row.block_id for row in rows] == ["post-1", "post-2"]
+    assert [row.message_id for row in rows] == ["1", "2"]
+
+    # The live_posts StreamField is a projection of the rows.
+    LivePost.objects.filter(block_id="post-2").delete()
+    page = BlogPage.objects.get(id=page.id)
+    assert [post.id for post in page.live_posts] == ["post-1"]
+
+
+@pytest.mark.django_db
+@override_settings(WAGTAIL_LIVE_POST_STORAGE="table")
+def test_table_storage_loads_live_posts_lazily(
+    blog_page_factory, django_assert_num_queries
+):
+    blog_page_factory(channel_id="channel-1", live_posts=make_live_posts(2))
+    blog_page_factory(channel_id="channel-2", live_posts=make_live_posts(3))
+
+    # The live posts rows aren't fetched when loading pages,
+    # and the live_posts column is deferred.
+    with django_assert_num_queries(1):
+        pages = list(BlogPage.objects.order_by("id"))
+    assert all("live_posts" in page.get_deferred_fields() for page in pages)
+
+    # They are fetched on first access only.
+    with django_assert_num_queries(1):
+        assert len(pages[1].live_posts) == 3
+        assert len(pages[1].live_posts) == 3
+
+    # Refreshing the page reloads them from the rows.
+    LivePost.objects.filter(page_id=pages[1].id, block_id="post-0").delete()
+    pages[1].refresh_from_db()
+    assert [post.id for post in pages[1].live_posts] == ["post-1", "post-2"]
+
+    LivePost.objects.filter(page_id=pages[1].id, block_id="post-1").delete()
+    with django_assert_num_queries(1):
+        pages[1].refresh_from_db(fields=["live_posts"])
+    assert [post.id for post in pages[1].live_posts] == ["post-2"]
+
+
+@pytest.mark.django_db
+@override_settings(WAGTAIL_LIVE_POST_STORAGE="table")
+def test_table_storage_add_update_delete_live_post(blog_page_factory):
+    page = blog_page_factory(channel_id="some-id")
+
+    # ADD
+    live_post = construct_live_post_block(message_id="some-id", created=now())
+    page.add_live_post(live_post=live_post)
+
+    row = LivePost.objects.get(page_id=page.id, message_id="some-id")
+    page = BlogPage.objects.get(id=page.id)
+    live_post = page.get_live_post_by_message_id(message_id="some-id")
+    assert live_post.id == row.block_id
+    assert live_post.value["modified"] is None
+
+    # EDIT
+    page.update_live_post(live_post=live_post)
+    assert json.loads(LivePost.objects.get(id=row.id).value)["modified"] is not None
+
+    page = BlogPage.objects.get(id=page.id)
+    assert page.last_updated_at == live_post.value["modified"]
+    live_post = page.get_live_post_by_message_id(message_id="some-id")
+    assert live_post.value["modified"] is not None
+
+    # DELETE
+    page.delete_live_post(message_id="some-id")
+    assert not LivePost.objects.filter(page_id=page.id).exists()
+
+    page = BlogPage.objects.get(id=page.id)
+    assert len(page.live_posts) == 0
+
+
+@pytest.mark.django_db
+@override_settings(WAGTAIL_LIVE_POST_STORAGE="table")
+def test_table_storage_save_live_page(blog_page_factory):
+    live_posts = json.dumps(
+        [
+            {
+                "type": "live_post",
+                "id": "some-id",
+                "value": {
+                    "message_id": "some-id",
+                    "created": "2021-01-01T12:00:00",
+                    "modified": None,
+                    "show": True,
+                    "content": [],
+                },
+            },
+        ]
+    )
+    page = blog_page_factory(channel_id="channel_id", live_posts=live_posts)
+
+    new_posts = json.dumps(
+        [
+            {
+                "type": "live_post",
+                "id": "other-id",
+                "value": {
+                    "message_id": "other-id",
+                    "created": "2021-01-01T13:00:00",
+                    "modified": None,
+                    "show": True,
+                    "content": [],
+                },
+            },
+        ]
+    )
+    page.live_posts = new_posts
+    page.save()
+
+    rows = LivePost.objects.filter(page_id=page.id)
+    assert [row.block_id for row in rows] == ["other-id"]
+
+
+@pytest.mark.django_db
+def test_save_live_page_sets_live_posts_checksum(blog_page_factory):
+    page = blog_page_factory(channel_id="channel_id")
+    assert page.live_posts_checksum == page.get_live_posts_checksum()
+
+    live_post = construct_live_post_block(message_id="some-id", created=now())
+    page.add_live_post(live_post=live_post)
+    page.refresh_from_db()
+    assert page.live_posts_checksum == page.get_live_posts_checksum()
+
+
+@pytest.mark.django_db
+def test_save_live_page_unchanged_skips_diffing(blog_page_factory, mocker):
+    page = blog_page_factory(channel_id="channel_id", live_posts=make_live_posts(3))
+    last_update_seq = page.last_update_seq
+
+    spy = mocker.spy(BlogPage.objects, "get")
+    page.title = "Some title"
+    page.save()
+
+    # The live posts haven't been fetched nor compared.
+    spy.assert_not_called()
+    assert page.last_update_seq == last_update_seq
+
+
+@pytest.mark.django_db
+def test_save_live_page_compares_content_hashes(blog_page_factory, mocker):
+    page = blog_page_factory(channel_id="channel_id", live_posts=make_live_posts(3))
+    last_update_seq = page.last_update_seq
+
+    spy = mocker.patch("wagtail_live.models.compare_live_posts_values")
+    live_posts = json.loads(make_live_posts(3))
+    live_posts[0]["value"]["created"] = "2021-01-02T12:00:00"
+    page.live_posts = json.dumps(live_posts)
+    page.save()
+
+    # The live posts have the same content, so they haven't been compared.
+    spy.assert_not_called()
+    assert page.last_update_seq == last_update_seq
+
+
+@pytest.mark.django_db
+def test_save_live_page_sets_fingerprints(blog_page_factory, mocker):
+    page = blog_page_factory(channel_id="channel_id", live_posts=make_live_posts(2))
+    BlogPage.objects.filter(id=page.id).update(live_posts_checksum="")
+    page.save()
+
+    page = BlogPage.objects.get(id=page.id)
+    fingerprints = [post.value["fingerprint"] for post in page.live_posts]
+    assert all(fingerprints)
+
+    # Edit the first post.
+    spy = mocker.spy(models, "compare_live_posts_values")
+    page.live_posts[0].value["show"] = False
+    page.save()
+
+    # Only the edited post has been compared.
+    assert spy.call_count == 1
+    page = BlogPage.objects.get(id=page.id)
+    assert page.live_posts[0].value["fingerprint"] != fingerprints[0]
+    assert page.live_posts[0].value["modified"] is not None
+    assert page.live_posts[1].value["fingerprint"] == fingerprints[1]
+
+
+@pytest.mark.django_db
+@override_settings(WAGTAIL_LIVE_POST_STORAGE="table")
+def test_table_storage_resets_live_posts_checksum(blog_page_factory):
+    page = blog_page_factory(channel_id="channel_id")
+    assert page.live_posts_checksum
+
+    live_post = construct_live_post_block(message_id="some-id", created=now())
+    page.add_live_post(live_post=live_post)
+    page.refresh_from_db()
+    assert page.live_posts_checksum == ""
+
+
+def make_live_posts(count):
+    return json.dumps(
+        [
+            {
+                "type": "live_post",
+                "id": f"post-{i}",
+                "value": {
+                    "message_id": str(i),
+                    "created": (
+                        datetime(2021, 1, 1) + timedelta(minutes=count - i)
+                    ).isoformat(),
+                    "modified": None,
+                    "show": True,
+                    "content": [],
+                },
+            }
+            for i in range(count)
+        ]
+    )
+
+
+@pytest.mark.django_db
+def test_live_posts_index(blog_page_factory):
+    page = blog_page_factory(channel_id="some-id", live_posts=make_live_posts(5))
+    assert [page.get_live_post_index(message_id=str(i)) for i in range(5)] == [
+        0,
+        1,
+        2,
+        3,
+        4,
+    ]
+
+    # Add a new post between existing ones.
+    created = page.get_live_post_by_index(2).value["created"]
+    live_post = construct_live_post_block(message_id="new", created=created)
+    page.add_live_post(live_post=live_post)
+    assert page.get_live_post_index(message_id="new") == 3
+    assert page.get_live_post_index(message_id="2") == 2
+    assert page.get_live_post_index(message_id="3") == 4
+
+    # Delete a post.
+    page.delete_live_post(message_id="1")
+    assert page.get_live_post_index(message_id="1") is None
+    assert page.get_live_post_index(message_id="0") == 0
+    assert page.get_live_post_index(message_id="new") == 2
+    assert page.get_live_post_index(message_id="4") == 4
+
+    # The index follows the live posts when they are replaced.
+    page.live_posts = make_live_posts(2)
+    assert page.get_live_post_index(message_id="1") == 1
+    assert page.get_live_post_index(message_id="new") is None
+
+
+@pytest.mark.django_db
+def test_live_posts_index_invalidation(blog_page_factory):
+    page = blog_page_factory(channel_id="some-id", live_posts=make_live_posts(3))
+    assert page.get_live_post_index(message_id="1") == 1
+
+    # Replace a live post in place, leaving the number of live posts unchanged.
+    live_post = construct_live_post_block(message_id="new", created=now())
+    page.live_posts[1] = ("live_post", live_post, "post-new")
+    assert page.get_live_post_index(message_id="new") == 1
+    assert page.get_live_post_index(message_id="1") is None
+
+    # Edit the raw data of a live post.
+    raw_live_post = page.live_posts.raw_data[2]
+    raw_live_post["value"]["message_id"] = "other"
+    page.live_posts.raw_data[2] = raw_live_post
+    assert page.get_live_post_index(message_id="other") == 2
+
+    # Assigning the live posts drops the index, even when they are the same object.
+    page.live_posts = page.live_posts
+    assert "_live_posts_index" not in page.__dict__
+    assert page.get_live_post_index(message_id="0") == 0
+
+
+@pytest.mark.django_db
+def test_get_live_post_by_message_id_converts_only_one_post(blog_page_factory):
+    page = blog_page_factory(channel_id="some-id", live_posts=make_live_posts(100))
+    page = BlogPage.objects.get(id=page.id)
+
+    live_post = page.get_live_post_by_message_id(message_id="50")
+    assert live_post.id == "post-50"
+    assert live_post is page.get_live_post_by_index(50)
+
+    bound_blocks = page.live_posts._bound_blocks
+    assert len([block for block in bound_blocks if block is not None]) == 1
+
+
+@pytest.mark.django_db
+def test_add_live_post_large_page(blog_page_factory, mocker):
+    """Adding a live post to a large page neither scans nor converts existing posts."""
+
+    page = blog_page_factory(channel_id="some-id", live_posts=make_live_posts(10000))
+    page = BlogPage.objects.get(id=page.id)
+    mocker.spy(page, "_get_live_post_created")
+
+    live_post = construct_live_post_block(message_id="new", created=now())
+    page.add_live_post(live_post=live_post)
+
+    # Binary search: log2(10000) ~ 13.3
+    assert page._get_live_post_created.call_count <= 14
+    assert page.get_live_post_index(message_id="new") == 0
+
+    bound_blocks = page.live_posts._bound_blocks
+    assert len([block for block in bound_blocks if block is not None]) == 1
+
+    # Insert between existing live posts.
+    created = page.get_live_post_by_index(5000).value["created"]
+    live_post = construct_live_post_block(message_id="other", created=created)
+    page.add_live_post(live_post=live_post)
+    assert page.get_live_post_index(message_id="other") == 5001
+
+
+@pytest.mark.django_db
+def test_update_journal(blog_page_factory):
+    page = blog_page_factory(channel_id="some-id", live_posts=make_live_posts(2))
+    assert page.last_update_seq == 0
+
+    live_post = construct_live_post_block(message_id="new", created=now())
+    page.add_live_post(live_post=live_post)
+    live_post = page.get_live_post_by_message_id(message_id="new")
+    page.update_live_post(live_post=live_post)
+    page.delete_live_post(message_id="0")
+
+    page = BlogPage.objects.get(id=page.id)
+    assert page.last_update_seq == 3
+
+    live_updates = LiveUpdate.objects.filter(page_id=page.id).order_by("seq")
+    assert [
+        (update.seq, json.loads(update.renders), json.loads(update.removals))
+        for update in live_updates
+    ] == [
+        (0, [], []),
+        (1, [live_post.id], []),
+        (2, [live_post.id], []),
+        (3, [], ["post-0"]),
+    ]
+    assert page.get_live_post_ids() == [live_post.id, "post-1"]
+
+
+@pytest.mark.django_db
+def test_update_journal_save_live_page(blog_page_factory):
+    page = blog_page_factory(channel_id="some-id", live_posts=make_live_posts(2))
+
+    page.live_posts = make_live_posts(1)
+    page.save()
+
+    page = BlogPage.objects.get(id=page.id)
+    assert page.last_update_seq == 1
+    live_update = LiveUpdate.objects.get(page_id=page.id, seq=1)
+    assert live_update.created == page.last_updated_at
+    assert json.loads(live_update.removals) == ["post-1"]
+
+
+@pytest.mark.django_db
+@override_settings(WAGTAIL_LIVE_UPDATE_JOURNAL_SIZE=2)
+def test_update_journal_is_trimmed(blog_page_factory):
+    page = blog_page_factory(channel_id="some-id")
+    for i in range(3):
+        live_post = construct_live_post_block(message_id=str(i), created=now())
+        page.add_live_post(live_post=live_post)
+
+    live_updates = LiveUpdate.objects.filter(page_id=page.id).order_by("seq")
+    assert [update.seq for update in live_updates] == [2, 3]
+
+
+@pytest.mark.django_db
+def test_get_updates_since_reads_journal(blog_page_factory, mocker):
+    page = blog_page_factory(channel_id="some-id", live_posts=make_live_posts(100))
+    page = BlogPage.objects.get(id=page.id)
+
+    last_update_ts = now()
+    live_post = construct_live_post_block(message_id="new", created=now())
+    page.add_live_post(live_post=live_post)
+    new_post_id = page.get_live_post_by_index(0).id
+    edited_post = page.get_live_post_by_message_id(message_id="50")
+    page.update_live_post(live_post=edited_post)
+    page.delete_live_post(message_id="10")
+
+    page = BlogPage.objects.get(id=page.id)
+    mocker.spy(page, "_scan_updates_since")
+    updated_posts, current_posts = page.get_updates_since(last_update_ts)
+
+    assert page._scan_updates_since.call_count == 0
+    assert list(updated_posts) == ["post-50", new_post_id]
+    assert current_posts[-1] == new_post_id
+    assert "post-10" not in current_posts
+    assert len(current_posts) == 100
+
+    # Only the updated posts are converted.
+    bound_blocks = page.live_posts._bound_blocks
+    assert len([block for block in bound_blocks if block is not None]) == 2
+
+
+@pytest.mark.django_db
+def test_get_updates_since_before_journal(blog_page_factory, mocker):
+    page = blog_page_factory(channel_id="some-id", live_posts=make_live_posts(2))
+    live_post = construct_live_post_block(message_id="new", created=now())
+    page.add_live_post(live_post=live_post)
+
+    mocker.spy(page, "_scan_updates_since")
+    updated_posts, current_posts = page.get_updates_since(datetime(2021, 1, 1))
+
+    assert page._scan_updates_since.call_count == 1
+    assert len(updated_posts) == 3
+    assert len(current_posts) == 3
+
+
+@pytest.mark.django_db
+def test_get_updates_since_seq(blog_page_factory):
+    page = blog_page_factory(channel_id="some-id", live_posts=make_live_posts(3))
+
+    # Several updates can happen in the same millisecond.
+    created = now()
+    for message_id in ["new-1", "new-2"]:
+        live_post = construct_live_post_block(message_id=message_id, created=created)
+        page.add_live_post(live_post=live_post)
+
+    page = BlogPage.objects.get(id=page.id)
+    new_post_1 = page.get_live_post_by_message_id(message_id="new-1").id
+    new_post_2 = page.get_live_post_by_message_id(message_id="new-2").id
+
+    updated_posts, current_posts = page.get_updates_since_seq(1)
+    assert list(updated_posts) == [new_post_2]
+    assert current_posts == ["post-2", "post-1", "post-0", new_post_2, new_post_1]
+
+    updated_posts, _ = page.get_updates_since_seq(0)
+    assert set(updated_posts) == {new_post_1, new_post_2}
+
+    updated_posts, current_posts = page.get_updates_since_seq(2)
+    assert updated_posts == {}
+    assert len(current_posts) == 5
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("storage", ["streamfield", "table"])
+def test_update_seqs_are_unique(blog_page_factory, storage):
+    with override_settings(WAGTAIL_LIVE_POST_STORAGE=storage):
+        page = blog_page_factory(channel_id="some-id")
+        other = BlogPage.objects.get(id=page.id)
+
+        # Both instances hold the same sequence number.
+        for instance, message_id in [(page, "1"), (other, "2")]:
+            live_post = construct_live_post_block(message_id=message_id, created=now())
+            instance.add_live_post(live_post=live_post)
+
+        assert (page.last_update_seq, other.last_update_seq) == (1, 2)
+        seqs = LiveUpdate.objects.filter(page_id=page.id).values_list("seq", flat=True)
+        assert sorted(seqs) == [0, 1, 2]
+
+        # An outdated sequence number isn't written back,
+        # e.g. when the page is restored from a revision.
+        page = BlogPage.objects.get(id=page.id)
+        page.last_update_seq = 1
+        page.save()
+        page.refresh_from_db()
+        assert page.last_update_seq == 2
+
+        with pytest.raises(IntegrityError):
+            with transaction.atomic():
+                LiveUpdate.objects.create(page_id=page.id, seq=2, created=now())
+
+
+@pytest.mark.django_db
+@override_settings(WAGTAIL_LIVE_UPDATE_JOURNAL_SIZE=1)
+def test_get_updates_since_seq_resync(blog_page_factory):
+    page = blog_page_factory(channel_id="some-id", live_posts=make_live_posts(3))
+    for message_id in ["new-1", "new-2"]:
+        live_post = construct_live_post_block(message_id=message_id, created=now())
+        page.add_live_post(live_post=live_post)
+
+    # The journal doesn't go back to the first update, send all the live posts.
+    page = BlogPage.objects.get(id=page.id)
+    updated_posts, current_posts = page.get_updates_since_seq(0)
+    assert list(updated_posts) == current_posts
+    assert len(updated_posts) == 5
+
+
+@pytest.mark.django_db
+def test_live_posts_window(blog_page_factory):
+    page = blog_page_factory(channel_id="some-id", live_posts=make_live_posts(3))
+    assert [post.id for post in page.live_posts_window] == [
+        "post-0",
+        "post-1",
+        "post-2",
+    ]
+    assert page.get_live_posts_window_ids() == ["post-0", "post-1", "post-2"]
+    assert not page.has_older_live_posts
+
+    with override_settings(WAGTAIL_LIVE_POSTS_WINDOW_SIZE=2):
+        assert [post.id for post in page.live_posts_window] == ["post-0", "post-1"]
+        assert page.get_live_posts_window_ids() == ["post-0", "post-1"]
+        assert page.has_older_live_posts
+        assert page.live_posts_window_oldest_timestamp == (
+            page.live_posts[1].value["created"].timestamp()
+        )
+
+
+@pytest.mark.django_db
+@override_settings(WAGTAIL_LIVE_POSTS_WINDOW_SIZE=2)
+def test_get_live_posts_before(blog_page_factory):
+    page = blog_page_factory(channel_id="some-id", live_posts=make_live_posts(5))
+
+    live_posts, has_more = page.get_live_posts_before("post-1")
+    assert [post.id for post in live_posts] == ["post-2", "post-3"]
+    assert has_more
+
+    live_posts, has_more = page.get_live_posts_before("post-3")
+    assert [post.id for post in live_posts] == ["post-4"]
+    assert not has_more
+
+    live_posts, has_more = page.get_live_posts_before("post-0", count=10)
+    assert len(live_posts) == 4
+    assert not has_more
+
+    with pytest.raises(KeyError):
+        page.get_live_posts_before("unknown-id")
+
+
+@pytest.mark.django_db
+def test_get_updates_since_seq_oldest_post(blog_page_factory):
+    page = blog_page_factory(channel_id="some-id", live_posts=make_live_posts(3))
+    live_post = construct_live_post_block(message_id="new", created=now())
+    page.add_live_post(live_post=live_post)
+    new_post = page.get_live_post_by_message_id(message_id="new").id
+
+    # Edit a live post the client side hasn't loaded.
+    page.update_live_post(live_post=page.get_live_post_by_message_id(message_id="2"))
+
+    page = BlogPage.objects.get(id=page.id)
+    updated_posts, current_posts = page.get_updates_since_seq(
+        0, oldest_post_id="post-1"
+    )
+    assert list(updated_posts) == [new_post]
+    assert current_posts == ["post-1", "post-0", new_post]
+
+    updated_posts, current_posts = page.get_updates_since_seq(
+        page.last_update_seq, oldest_post_id="post-0"
+    )
+    assert updated_posts == {}
+    assert current_posts == ["post-0", new_post]
+
+    # Unknown live posts are ignored.
+    _, current_posts = page.get_updates_since_seq(0, oldest_post_id="unknown-id")
+    assert len(current_posts) == 4
+
+
+@pytest.mark.django_db
+def test_get_update_delta_since_seq(blog_page_factory):
+    page = blog_page_factory(channel_id="some-id", live_posts=make_live_posts(3))
+    live_post = construct_live_post_block(message_id="new", created=now())
+    page.add_live_post(live_post=live_post)
+    new_post = page.get_live_post_by_message_id(message_id="new").id
+    page.delete_live_post(message_id="1")
+    page.delete_live_post(message_id="new")
+
+    page = BlogPage.objects.get(id=page.id)
+    updated_posts, removals = page.get_update_delta_since_seq(0)
+    assert updated_posts == {}
+    assert removals == ["post-1", new_post]
+
+    assert page.get_update_delta_since_seq(page.last_update_seq) == ({}, [])
+
+
+@pytest.mark.django_db
+def test_get_update_delta_since_seq_reads_latest_posts(blog_page_factory, mocker):
+    page = blog_page_factory(channel_id="some-id", live_posts=make_live_posts(100))
+    live_post = construct_live_post_block(message_id="new", created=now())
+    page.add_live_post(live_post=live_post)
+    new_post = page.get_live_post_by_message_id(message_id="new").id
+    page.update_live_post(live_post=page.get_live_post_by_message_id(message_id="1"))
+
+    page = BlogPage.objects.get(id=page.id)
+    mocker.spy(page, "get_live_post_ids")
+    updated_posts, removals = page.get_update_delta_since_seq(0)
+    assert list(updated_posts) == ["post-1", new_post]
+    assert removals == []
+
+    # The IDs of all the live posts aren't needed.
+    assert page.get_live_post_ids.call_count == 0
+
+    # Live posts older than the oldest one loaded in the client side are left out.
+    updated_posts, _ = page.get_update_delta_since_seq(0, oldest_post_id="post-0")
+    assert list(updated_posts) == [new_post]
+
+
+@pytest.mark.django_db
+@override_settings(WAGTAIL_LIVE_UPDATE_JOURNAL_SIZE=1)
+def test_get_update_delta_since_seq_resync(blog_page_factory):
+    page = blog_page_factory(channel_id="some-id", live_posts=make_live_posts(3))
+    page.delete_live_post(message_id="1")
+    page.delete_live_post(message_id="2")
+
+    page = BlogPage.objects.get(id=page.id)
+    assert page.get_update_delta_since_seq(0) is None
+
+
+@pytest.mark.django_db(transaction=True, serialized_rollback=True)
+def test_close_live_page(blog_page_factory):
+    page = blog_page_factory(channel_id="some-id", live_posts=make_live_posts(2))
+    assert page.live_posts_archive == ""
+    last_update_seq = page.last_update_seq
+
+    updates = []
+
+    def callback(sender, channel_id, renders, removals, signal, **kwargs):
+        updates.append((channel_id, renders, removals, kwargs))
+
+    live_page_update.connect(callback)
+    try:
+        page.closed = True
+        page.save()
+    finally:
+        live_page_update.disconnect(callback)
+
+    page = BlogPage.objects.get(id=page.id)
+    assert page.last_update_seq == last_update_seq + 1
+    assert LiveUpdate.objects.filter(page_id=page.id, seq=page.last_update_seq).exists()
+    assert updates == [
+        ("some-id", [], [], {"seq": page.last_update_seq, "closed": True})
+    ]
+
+    assert page.live_posts_archive == page.render_live_posts_archive()
+    assert 'data-post-id="post-0"' in page.live_posts_archive
+    assert 'data-post-id="post-1"' in page.live_posts_archive
+
+
+@pytest.mark.django_db
+def test_is_closing_without_query(blog_page_factory, django_assert_num_queries):
+    page = blog_page_factory(channel_id="some-id")
+    page = BlogPage.objects.get(id=page.id)
+
+    page.closed = True
+    with django_assert_num_queries(0):
+        assert page._is_closing()
+
+    page.save(sync=False)
+    with django_assert_num_queries(0):
+        assert not page._is_closing()
+
+    # The page is reopened in the database.
+    BlogPage.objects.filter(id=page.id).update(closed=False)
+    page.refresh_from_db()
+    page.closed = True
+    with django_assert_num_queries(0):
+        assert page._is_closing()
+
+
+@pytest.mark.django_db
+def test_save_closed_live_page(blog_page_factory, mocker):
+    page = blog_page_factory(channel_id="some-id", live_posts=make_live_posts(2))
+    page.closed = True
+    page.save()
+    last_update_seq = page.last_update_seq
+
+    # The archive is kept as long as the live posts don't change.
+    spy = mocker.spy(page, "render_live_posts_archive")
+    page.save()
+    assert spy.call_count == 0
+    assert page.last_update_seq == last_update_seq
+
+    page.live_posts = make_live_posts(1)
+    page.save()
+    assert spy.call_count == 1
+    assert 'data-post-id="post-1"' not in page.live_posts_archive
+
+
+@pytest.mark.django_db
+def test_reopen_live_page(blog_page_factory):
+    page = blog_page_factory(channel_id="some-id", live_posts=make_live_posts(2))
+    page.closed = True
+    page.save()
+
+    page.closed = False
+    page.save()
+    page = BlogPage.objects.get(id=page.id)
+    assert page.live_posts_archive == ""
+
+
+@pytest.mark.django_db
+def test_render_closed_live_page(blog_page_factory, django_assert_num_queries):
+    page = blog_page_factory(channel_id="some-id", live_posts=make_live_posts(2))
+    page.closed = True
+    page.save()
+
+    page = BlogPage.objects.get(id=page.id)
+    with django_assert_num_queries(0):
+        render = render_to_string("wagtail_live/live_posts.html", {"self": page})
+    assert page.live_posts_archive in render
+    assert "utils.js" not in render
@@ -0,0 +1,82 @@
+import json
+
+import pytest
+from django.template.loader import render_to_string
+from django.test import override_settings
+
+from tests.utils import reload_urlconf
+
+
+@pytest.fixture
+def live_page(blog_page_factory):
+    live_posts = json.dumps(
+        [
+            {
+                "type": "live_post",
+                "id": f"post-{i}",
+                "value": {
+                    "message_id": str(i),
+                    "created": f"2021-01-01T12:0{5 - i}:00",
+                    "modified": None,
+                    "show": i != 2,
+                    "content": [],
+                },
+            }
+            for i in range(5)
+        ]
+    )
+    return blog_page_factory(channel_id="test_channel", live_posts=live_posts)
+
+
+@pytest.fixture(autouse=True)
+def reload_urls():
+    reload_urlconf()
+
+
+@pytest.mark.django_db
+@override_settings(WAGTAIL_LIVE_POSTS_WINDOW_SIZE=2)
+def test_older_live_posts(live_page, client):
+    response = client.get(
+        "/wagtail_live/older-posts/test_channel/", {"before": "post-1"}
+    )
+    assert response.status_code == 200
+
+    payload = response.json()
+    assert [post["id"] for post in payload["livePosts"]] == ["post-2", "post-3"]
+    assert [post["show"] for post in payload["livePosts"]] == [False, True]
+    assert [post["created"] for post in payload["livePosts"]] == [
+        live_page.live_posts[i].value["created"].timestamp() for i in [2, 3]
+    ]
+    assert 'data-post-id="post-2"' in payload["livePosts"][0]["content"]
+    assert payload["hasMore"]
+
+    response = client.get(
+        "/wagtail_live/older-posts/test_channel/", {"before": "post-3"}
+    )
+    payload = response.json()
+    assert [post["id"] for post in payload["livePosts"]] == ["post-4"]
+    assert not payload["hasMore"]
+
+
+@pytest.mark.django_db
+def test_older_live_posts_not_found(live_page, client):
+    response = client.get("/wagtail_live/older-posts/bad_channel/", {"before": "x"})
+    assert response.status_code == 404
+
+    response = client.get(
+        "/wagtail_live/older-posts/test_channel/", {"before": "unknown-id"}
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+@override_settings(WAGTAIL_LIVE_POSTS_WINDOW_SIZE=2)
+def test_live_posts_template_renders_window(live_page):
+    content = render_to_string("wagtail_live/live_posts.html", {"self": live_page})
+
+    assert 'data-post-id="post-1"' in content
+    assert 'data-post-id="post-2"' not in content
+    assert 'id="load-older-posts"' in content
+    # Client side ignores the updates of the live posts older than the ones loaded.
+    created = live_page.live_posts[1].value["created"].timestamp()
+    assert f'data-oldest-created="{created:f}"' in content